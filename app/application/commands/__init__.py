@@ -3,17 +3,24 @@ Application layer commands.
 """
 
 from .create_attack_command import CreateAttackCommand
+from .create_attacks_batch_command import CreateAttacksBatchCommand
 from .update_attack_modifiers_command import UpdateAttackModifiersCommand
 from .update_attack_roll_command import UpdateAttackRollCommand
+from .update_attack_rolls_batch_command import UpdateAttackRollsBatchCommand
 from .update_critical_roll_command import UpdateCriticalRollCommand
 from .update_fumble_roll_command import UpdateFumbleRollCommand
 from .update_attack_parry_command import UpdateAttackParryCommand
+from .simulate_attack_command import SimulateAttackCommand, MAX_SIMULATION_SAMPLES
 
 __all__ = [
     "CreateAttackCommand",
+    "CreateAttacksBatchCommand",
     "UpdateAttackModifiersCommand",
     "UpdateAttackRollCommand",
+    "UpdateAttackRollsBatchCommand",
     "UpdateCriticalRollCommand",
     "UpdateFumbleRollCommand",
     "UpdateAttackParryCommand",
+    "SimulateAttackCommand",
+    "MAX_SIMULATION_SAMPLES",
 ]
@@ -0,0 +1,25 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from app.domain.entities import BatchItemError
+from .create_attack_command import CreateAttackCommand
+
+MAX_BATCH_ATTACKS = 500
+
+
+@dataclass
+class CreateAttacksBatchCommand:
+    """Command object for creating several attacks"""
+
+    # None marks items rejected while building the command, see errors
+    attacks: list[Optional[CreateAttackCommand]]
+    errors: list[BatchItemError] = field(default_factory=list)
+
+    def validate(self) -> None:
+        """Validate command data"""
+        if not self.attacks:
+            raise ValueError("At least one attack is required")
+        if len(self.attacks) > MAX_BATCH_ATTACKS:
+            raise ValueError(
+                f"A batch cannot contain more than {MAX_BATCH_ATTACKS} attacks"
+            )
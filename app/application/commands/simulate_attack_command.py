@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from app.domain.entities.attack import AttackModifiers
+
+MAX_SIMULATION_SAMPLES = 1_000_000
+
+
+@dataclass
+class SimulateAttackCommand:
+    """Command object for simulating the outcomes of an attack"""
+
+    modifiers: AttackModifiers
+    samples: int = 10_000
+    open_ended: bool = True
+    seed: Optional[int] = None
+
+    def validate(self) -> None:
+        """Validate command data"""
+        if not self.modifiers:
+            raise ValueError("Modifiers are required")
+        if not isinstance(self.samples, int) or not (
+            0 < self.samples <= MAX_SIMULATION_SAMPLES
+        ):
+            raise ValueError(f"Samples must be between 1 and {MAX_SIMULATION_SAMPLES}")
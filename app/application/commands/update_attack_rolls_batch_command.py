@@ -0,0 +1,33 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from app.domain.entities import BatchItemError
+from .update_attack_roll_command import UpdateAttackRollCommand
+
+MAX_BATCH_ROLLS = 500
+
+
+@dataclass
+class UpdateAttackRollsBatchCommand:
+    """Command object for updating the rolls of several attacks"""
+
+    # None marks items rejected while building the command, see errors
+    rolls: list[Optional[UpdateAttackRollCommand]]
+    errors: list[BatchItemError] = field(default_factory=list)
+
+    def validate(self) -> None:
+        """Validate command data"""
+        if not self.rolls:
+            raise ValueError("At least one roll is required")
+        if len(self.rolls) > MAX_BATCH_ROLLS:
+            raise ValueError(
+                f"A batch cannot contain more than {MAX_BATCH_ROLLS} rolls"
+            )
+        attack_ids = set()
+        for roll in self.rolls:
+            if roll is None:
+                continue
+            roll.validate()
+            if roll.attack_id in attack_ids:
+                raise ValueError(f"Duplicated attack ID: {roll.attack_id}")
+            attack_ids.add(roll.attack_id)
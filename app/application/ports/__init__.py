@@ -1,9 +1,17 @@
 from .attack_ports import AttackRepository, AttackNotificationPort, AttackValidationPort
-from .attack_table_port import AttackTableClient
+from .attack_table_port import (
+    AttackTableClient,
+    ATTACK_TABLE_MIN_ROLL,
+    ATTACK_TABLE_MAX_ROLL,
+)
+from .calculation_port import CalculationExecutor
 
 __all__ = [
     "AttackRepository",
     "AttackNotificationPort",
     "AttackValidationPort",
     "AttackTableClient",
+    "CalculationExecutor",
+    "ATTACK_TABLE_MIN_ROLL",
+    "ATTACK_TABLE_MAX_ROLL",
 ]
@@ -4,8 +4,8 @@ These are interfaces that define contracts for external dependencies.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
-from app.domain.entities import Attack
+from typing import AsyncIterator, Optional, List
+from app.domain.entities import Attack, AttackSummary, BatchResult
 
 
 class AttackRepository(ABC):
@@ -16,27 +16,63 @@ class AttackRepository(ABC):
         """Find an attack by its ID"""
         pass
 
+    @abstractmethod
+    async def find_by_ids(self, attack_ids: List[str]) -> List[Attack]:
+        """Find the existing attacks of a list of IDs"""
+        pass
+
     @abstractmethod
     async def save(self, attack: Attack) -> Attack:
         """Save an attack"""
         pass
 
+    @abstractmethod
+    async def save_all(self, attacks: List[Attack]) -> BatchResult[Attack]:
+        """Save several attacks in a single bulk insert, reporting failed items"""
+        pass
+
     @abstractmethod
     async def update(self, attack: Attack) -> Optional[Attack]:
         """Update an existing attack"""
         pass
 
+    async def patch(self, attack: Attack) -> Optional[Attack]:
+        """
+        Update only the dirty fields of an existing attack. Implementations
+        supporting partial updates should override this.
+        """
+        return await self.update(attack)
+
+    @abstractmethod
+    async def update_all(self, attacks: List[Attack]) -> List[Attack]:
+        """
+        Update the dirty fields of existing attacks in a single bulk write,
+        returns the attacks that were found and updated
+        """
+        pass
+
     @abstractmethod
     async def delete(self, attack_id: str) -> bool:
         """Delete an attack by its ID"""
         pass
 
+    @abstractmethod
+    async def delete_many(
+        self,
+        rsql_query: Optional[str] = None,
+        action_id: Optional[str] = None,
+    ) -> int:
+        """Delete every attack matching the filters, returns deleted count"""
+        pass
+
     @abstractmethod
     async def find_all(
         self,
         limit: int = 100,
         skip: int = 0,
+        after: Optional[str] = None,
     ) -> List[Attack]:
+        """Find attacks sorted by ID, starting after the given attack ID"""
         pass
 
     @abstractmethod
@@ -50,14 +86,41 @@ class AttackRepository(ABC):
         """Count attacks with optional filters"""
         pass
 
+    @abstractmethod
+    async def estimated_count(self) -> int:
+        """Estimate the total number of attacks from collection metadata"""
+        pass
+
     @abstractmethod
     async def find_by_rsql(
         self,
         rsql_query: Optional[str] = None,
         limit: int = 100,
         skip: int = 0,
+        after: Optional[str] = None,
     ) -> List[Attack]:
-        """Find attacks using RSQL query"""
+        """Find attacks using RSQL query sorted by ID, starting after the given attack ID"""
+        pass
+
+    @abstractmethod
+    async def find_summaries_by_rsql(
+        self,
+        fields: List[str],
+        rsql_query: Optional[str] = None,
+        limit: int = 100,
+        skip: int = 0,
+        after: Optional[str] = None,
+    ) -> List[AttackSummary]:
+        """Find attacks like find_by_rsql loading only the given summary fields"""
+        pass
+
+    @abstractmethod
+    def stream_by_rsql(
+        self,
+        rsql_query: Optional[str] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Attack]:
+        """Iterate over every attack matching an RSQL query sorted by ID"""
         pass
 
     @abstractmethod
@@ -1,7 +1,11 @@
+import asyncio
 from abc import ABC, abstractmethod
 
 from app.domain.entities import AttackTableEntry, CriticalTableEntry, FumbleTableEntry
 
+ATTACK_TABLE_MIN_ROLL = 1
+ATTACK_TABLE_MAX_ROLL = 175
+
 
 class AttackTableClient(ABC):
 
@@ -11,6 +15,24 @@ class AttackTableClient(ABC):
     ) -> AttackTableEntry:
         pass
 
+    async def get_attack_table_row(
+        self, attack_table: str, size: str, at: int
+    ) -> list[AttackTableEntry]:
+        """
+        Get every entry of an attack table for the given size and AT, indexed by
+        roll - 1. Implementations holding whole tables should override this.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.get_attack_table_entry(
+                        attack_table=attack_table, size=size, roll=roll, at=at
+                    )
+                    for roll in range(ATTACK_TABLE_MIN_ROLL, ATTACK_TABLE_MAX_ROLL + 1)
+                )
+            )
+        )
+
     @abstractmethod
     async def get_critical_table_entry(
         self, critical_type: str, critical_severity: str, roll: int
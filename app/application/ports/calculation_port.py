@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional, TypeVar
+
+from app.domain.entities import Attack
+
+T = TypeVar("T")
+
+
+class CalculationExecutor(ABC):
+    """
+    Port running CPU-bound attack calculations. Implementations decide whether
+    the work runs on the event loop or on worker processes.
+    """
+
+    @abstractmethod
+    async def calculate_attacks(
+        self, attacks: list[Attack]
+    ) -> list[Optional[Exception]]:
+        """
+        Calculate attacks in place as AttackCalculator.calculate_batch does.
+        Returns the error of each attack, None for the calculated ones.
+        """
+        pass
+
+    @abstractmethod
+    async def run_simulation(self, fn: Callable[..., T], *args: Any, samples: int) -> T:
+        """
+        Run a simulation function without blocking the event loop. Functions and
+        arguments must be picklable, they may run on a worker process.
+        """
+        pass
+
+    async def start(self) -> None:
+        """Prepare the executor before the first calculation"""
+        pass
+
+    def stats(self) -> dict:
+        """Executor counters"""
+        return {}
+
+    async def close(self) -> None:
+        """Release the executor resources"""
+        pass
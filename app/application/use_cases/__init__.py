@@ -1,10 +1,15 @@
 from .apply_attack_use_case import ApplyAttackUseCase
 from .create_attack_use_case import CreateAttackUseCase
+from .create_attacks_batch_use_case import CreateAttacksBatchUseCase
 from .delete_attack_use_case import DeleteAttackUseCase
+from .delete_attacks_use_case import DeleteAttacksUseCase
+from .export_attacks_use_case import ExportAttacksUseCase
 from .search_attacks_by_rsql_use_case import SearchAttacksByRsqlUseCase
 from .search_attack_by_id_use_case import SearchAttackByIdUseCase
+from .simulate_attack_use_case import SimulateAttackUseCase
 from .update_attack_modifiers_use_case import UpdateAttackModifiersUseCase
 from .update_attack_roll_use_case import UpdateAttackRollUseCase
+from .update_attack_rolls_batch_use_case import UpdateAttackRollsBatchUseCase
 from .update_critical_roll_use_case import UpdateCriticalRollUseCase
 from .update_fumble_roll_use_case import UpdateFumbleRollUseCase
 from .update_attack_parry_use_case import UpdateAttackParryUseCase
@@ -12,12 +17,17 @@ from .update_attack_parry_use_case import UpdateAttackParryUseCase
 __all__ = [
     "ApplyAttackUseCase",
     "CreateAttackUseCase",
+    "CreateAttacksBatchUseCase",
     "DeleteAttackUseCase",
+    "DeleteAttacksUseCase",
+    "ExportAttacksUseCase",
     "SearchAttacksByRsqlUseCase",
     "SearchAttackByIdUseCase",
     "GetAttackUseCase",
+    "SimulateAttackUseCase",
     "UpdateAttackModifiersUseCase",
     "UpdateAttackRollUseCase",
+    "UpdateAttackRollsBatchUseCase",
     "UpdateCriticalRollUseCase",
     "UpdateFumbleRollUseCase",
     "UpdateAttackParryUseCase",
@@ -0,0 +1,44 @@
+from app.domain.entities import Attack, BatchItemError, BatchResult
+from app.domain.entities.enums import AttackStatus
+from app.domain.services import AttackDomainService
+from app.application.commands import CreateAttacksBatchCommand
+
+
+class CreateAttacksBatchUseCase:
+    """Use case for creating several attacks at once."""
+
+    def __init__(self, domain_service: AttackDomainService):
+        self._domain_service = domain_service
+
+    async def execute(self, command: CreateAttacksBatchCommand) -> BatchResult[Attack]:
+        """Execute the create attacks batch use case."""
+
+        command.validate()
+        errors = list(command.errors)
+        attacks: list[Attack] = []
+        positions: list[int] = []
+        for index, item in enumerate(command.attacks):
+            if item is None:
+                continue
+            try:
+                item.validate()
+            except ValueError as e:
+                errors.append(BatchItemError(index=index, message=str(e)))
+                continue
+            attacks.append(
+                Attack(
+                    id=None,
+                    action_id=item.action_id,
+                    source_id=item.source_id,
+                    target_id=item.target_id,
+                    modifiers=item.modifiers,
+                    status=AttackStatus.PENDING_ATTACK_ROLL,
+                )
+            )
+            positions.append(index)
+
+        result = await self._domain_service.create_attacks(attacks)
+        for error in result.errors:
+            error.index = positions[error.index]
+        result.errors = sorted(errors + result.errors, key=lambda error: error.index)
+        return result
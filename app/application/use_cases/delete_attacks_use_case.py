@@ -0,0 +1,22 @@
+from typing import Optional
+
+from app.application.ports.attack_ports import AttackRepository
+
+
+class DeleteAttacksUseCase:
+    """Use case for deleting every attack matching a filter"""
+
+    def __init__(self, attack_repository: AttackRepository):
+        self._attack_repository = attack_repository
+
+    async def execute(
+        self,
+        rsql_query: Optional[str] = None,
+        action_id: Optional[str] = None,
+    ) -> int:
+        """Execute the delete attacks use case, returns the deleted count"""
+        if not (rsql_query and rsql_query.strip()) and not action_id:
+            raise ValueError("An RSQL search or an action ID is required")
+        return await self._attack_repository.delete_many(
+            rsql_query=rsql_query, action_id=action_id
+        )
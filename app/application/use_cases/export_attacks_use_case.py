@@ -0,0 +1,22 @@
+from typing import AsyncIterator, Optional
+
+from app.domain.entities import Attack
+from app.application.ports import AttackRepository
+
+
+class ExportAttacksUseCase:
+    """Use case for streaming every attack matching an RSQL query"""
+
+    def __init__(self, attack_repository: AttackRepository, batch_size: int = 500):
+        self._attack_repository = attack_repository
+        self._batch_size = batch_size
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    def execute(self, rsql_query: Optional[str] = None) -> AsyncIterator[Attack]:
+        """Execute the export attacks use case, attacks are loaded batch by batch"""
+        return self._attack_repository.stream_by_rsql(
+            rsql_query=rsql_query, batch_size=self._batch_size
+        )
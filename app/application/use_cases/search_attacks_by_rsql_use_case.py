@@ -1,6 +1,9 @@
-from typing import Optional
+import asyncio
+from typing import List, Optional, Union
 
 from app.domain.entities.attack import Attack
+from app.domain.entities.attack_summary import AttackSummary, ATTACK_SUMMARY_FIELDS
+from app.domain.entities.enums import CountMode
 from app.domain.entities.page import Page, Pagination
 from app.application.ports import AttackRepository
 
@@ -16,31 +19,78 @@ class SearchAttacksByRsqlUseCase:
         rsql_query: Optional[str] = None,
         page: int = 0,
         size: int = 100,
-    ) -> Page[Attack]:
+        after: Optional[str] = None,
+        count: Optional[CountMode] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Page[Union[Attack, AttackSummary]]:
+        """
+        List attacks by offset (page) or by keyset (after, the ID of the last
+        attack of the previous page). Keyset pages cost the same at any depth and
+        skip the count unless requested.
+        When fields are given only those AttackSummary fields are loaded.
+        """
 
-        skip = page * size
-        limit = size
+        skip = 0 if after else page * size
+        # One extra element tells whether a next page exists
+        limit = size + 1
+        if count is None:
+            count = CountMode.NONE if after else CountMode.EXACT
+        # Collection metadata can only estimate the unfiltered total
+        total_exact = count == CountMode.EXACT or (
+            count == CountMode.ESTIMATED and bool(rsql_query)
+        )
 
-        if rsql_query:
-            attacks = await self._attack_repository.find_by_rsql(
+        if fields is not None:
+            unknown = [name for name in fields if name not in ATTACK_SUMMARY_FIELDS]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+            find = self._attack_repository.find_summaries_by_rsql(
+                fields=fields,
                 rsql_query=rsql_query,
                 limit=limit,
                 skip=skip,
+                after=after,
             )
-            total_elements = await self._attack_repository.count_by_rsql(
+        elif rsql_query:
+            find = self._attack_repository.find_by_rsql(
                 rsql_query=rsql_query,
+                limit=limit,
+                skip=skip,
+                after=after,
             )
         else:
-            attacks = await self._attack_repository.find_all(
+            find = self._attack_repository.find_all(
                 limit=limit,
                 skip=skip,
+                after=after,
             )
-            total_elements = await self._attack_repository.count_all()
+
+        if count == CountMode.NONE:
+            attacks = await find
+            total_elements = None
+        else:
+            if not total_exact:
+                count_total = self._attack_repository.estimated_count()
+            elif rsql_query:
+                count_total = self._attack_repository.count_by_rsql(
+                    rsql_query=rsql_query,
+                )
+            else:
+                count_total = self._attack_repository.count_all()
+            attacks, total_elements = await asyncio.gather(find, count_total)
+
+        next_after = None
+        if len(attacks) > size:
+            attacks = attacks[:size]
+            next_after = attacks[-1].id
 
         pagination = Pagination(
-            page=page,
+            page=0 if after else page,
             size=size,
             total_elements=total_elements,
+            next_after=next_after,
+            total_exact=total_exact,
+            after=after,
         )
 
         return Page(
@@ -0,0 +1,22 @@
+from app.domain.entities import AttackSimulation
+from app.domain.services import AttackSimulator
+
+from app.application.commands import SimulateAttackCommand
+
+
+class SimulateAttackUseCase:
+    """Use case for previewing the outcomes of an attack."""
+
+    def __init__(self, attack_simulator: AttackSimulator):
+        self._attack_simulator = attack_simulator
+
+    async def execute(self, command: SimulateAttackCommand) -> AttackSimulation:
+        """Execute the simulate attack use case."""
+
+        command.validate()
+        return await self._attack_simulator.simulate(
+            modifiers=command.modifiers,
+            samples=command.samples,
+            open_ended=command.open_ended,
+            seed=command.seed,
+        )
@@ -1,3 +1,4 @@
+import copy
 from typing import Optional
 
 from app.domain.entities import Attack
@@ -30,12 +31,14 @@ class UpdateAttackModifiersUseCase:
         attack_id = command.attack_id
         attack = await self._attack_repository.find_by_id(attack_id)
 
+        previous_modifiers = copy.deepcopy(attack.modifiers)
         self._update_attack_modifiers_partially(attack, command.modifiers)
+        attack.mark_dirty("modifiers")
 
         if attack.roll:
-            await self._attack_calculator.calculate_attack(attack)
+            await self._attack_calculator.recalculate_attack(attack, previous_modifiers)
 
-        updated_attack = await self._attack_repository.update(attack)
+        updated_attack = await self._attack_repository.patch(attack)
 
         if self._notification_port and updated_attack:
             await self._notification_port.notify_attack_updated(updated_attack)
@@ -1,3 +1,4 @@
+import copy
 from typing import Optional
 from app.domain.entities import Attack
 from app.domain.services.attack_calculator import AttackCalculator
@@ -23,10 +24,15 @@ class UpdateAttackParryUseCase:
         attack = await self._attack_repository.find_by_id(command.attack_id)
         if not attack:
             return None
+        previous_modifiers = copy.deepcopy(attack.modifiers)
         attack.modifiers.roll_modifiers.parry = command.parry
-        self._attack_calculator.initialize_attack_calculations(attack)
-        self._attack_calculator.calculate_attack_roll_modifiers(attack)
-        await self._attack_repository.update(attack)
+        attack.mark_dirty("modifiers")
+        if attack.roll:
+            await self._attack_calculator.recalculate_attack(attack, previous_modifiers)
+        else:
+            self._attack_calculator.initialize_attack_calculations(attack)
+            self._attack_calculator.calculate_attack_roll_modifiers(attack)
+        await self._attack_repository.patch(attack)
         if self._notification_port:
             await self._notification_port.notify_attack_updated(attack)
         return attack
@@ -0,0 +1,35 @@
+from app.domain.entities import Attack, BatchResult
+from app.domain.services import AttackResolutionService
+
+from app.application.commands import UpdateAttackRollsBatchCommand
+
+
+class UpdateAttackRollsBatchUseCase:
+    """Use case for resolving the rolls of several attacks at once"""
+
+    def __init__(self, attack_resolution_service: AttackResolutionService):
+        self._attack_resolution_service = attack_resolution_service
+
+    async def execute(
+        self, command: UpdateAttackRollsBatchCommand
+    ) -> BatchResult[Attack]:
+        """Execute the update attack rolls batch use case."""
+
+        command.validate()
+        positions = [
+            index for index, roll in enumerate(command.rolls) if roll is not None
+        ]
+        result = BatchResult[Attack]()
+        if positions:
+            result = await self._attack_resolution_service.update_attack_rolls(
+                [
+                    (command.rolls[index].attack_id, command.rolls[index].roll)
+                    for index in positions
+                ]
+            )
+        for error in result.errors:
+            error.index = positions[error.index]
+        result.errors = sorted(
+            command.errors + result.errors, key=lambda error: error.index
+        )
+        return result
@@ -18,8 +18,11 @@ from .critical import (
     AttackCriticalResult,
     FumbleTableEntry,
 )
-from .enums import AttackStatus, AttackType
+from .attack_summary import AttackSummary, ATTACK_SUMMARY_FIELDS
+from .enums import AttackStatus, AttackType, CountMode
 from .page import Page, Pagination
+from .batch import BatchItemError, BatchResult
+from .simulation import AttackSimulation
 
 __all__ = [
     "Attack",
@@ -33,8 +36,14 @@ __all__ = [
     "AttackType",
     "AttackCalculations",
     "AttackBonusEntry",
+    "AttackSimulation",
+    "AttackSummary",
+    "ATTACK_SUMMARY_FIELDS",
+    "CountMode",
     "Page",
     "Pagination",
+    "BatchItemError",
+    "BatchResult",
     "AttackTableEntry",
     "CriticalTableEntry",
     "AttackFeature",
@@ -19,7 +19,7 @@ from .enums import (
 from .critical import AttackCriticalResult, CriticalEffect
 
 
-@dataclass
+@dataclass(slots=True)
 class AttackBonusEntry:
     """Attack bonus data"""
 
@@ -166,9 +166,28 @@ class AttackResult:
         return None
 
 
+# Attack fields whose assignment marks them as dirty
+DIRTY_TRACKED_FIELDS = frozenset(
+    {
+        "action_id",
+        "source_id",
+        "target_id",
+        "status",
+        "modifiers",
+        "roll",
+        "calculated",
+        "results",
+    }
+)
+
+
 @dataclass
 class Attack:
-    """Attack domain entity."""
+    """
+    Attack domain entity.
+    Assigning a field marks it as dirty so repositories can write only the
+    changed fields. Changes inside a field are marked with mark_dirty.
+    """
 
     id: str
     action_id: str
@@ -180,6 +199,31 @@ class Attack:
     calculated: Optional[AttackCalculations] = None
     results: Optional[AttackResult] = None
 
+    def __post_init__(self):
+        object.__setattr__(self, "_dirty", set())
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in DIRTY_TRACKED_FIELDS:
+            dirty = self.__dict__.get("_dirty")
+            if dirty is not None:
+                dirty.add(name)
+
+    def mark_dirty(self, *paths: str) -> None:
+        """
+        Mark changes made inside fields, e.g. "modifiers" after updating a roll
+        modifier, or "roll.critical_rolls.<key>" and "results.criticals.<key>"
+        after resolving a single critical
+        """
+        self._dirty.update(paths)
+
+    def dirty_fields(self) -> set[str]:
+        """Fields and paths changed since the attack was loaded or saved"""
+        return set(self._dirty)
+
+    def clear_dirty(self) -> None:
+        self._dirty.clear()
+
     def is_melee(self) -> bool:
         return self.modifiers.attack_type == AttackType.MELEE
 
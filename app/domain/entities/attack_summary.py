@@ -0,0 +1,34 @@
+"""
+Domain entity for attack list views.
+A summary holds the top level attack fields only, absent fields were not loaded.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from .enums import AttackStatus, AttackType
+
+ATTACK_SUMMARY_FIELDS = (
+    "id",
+    "action_id",
+    "source_id",
+    "target_id",
+    "status",
+    "attack_type",
+    "roll",
+    "roll_total",
+)
+
+
+@dataclass
+class AttackSummary:
+    """Partial view of an attack"""
+
+    id: str
+    action_id: Optional[str] = None
+    source_id: Optional[str] = None
+    target_id: Optional[str] = None
+    status: Optional[AttackStatus] = None
+    attack_type: Optional[AttackType] = None
+    roll: Optional[int] = None
+    roll_total: Optional[int] = None
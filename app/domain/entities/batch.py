@@ -0,0 +1,30 @@
+"""
+Domain entities for batch operations.
+Batch operations report per-item errors instead of failing the whole batch.
+"""
+
+from dataclasses import dataclass, field
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class BatchItemError:
+    """Error of a single item of a batch"""
+
+    index: int
+    message: str
+    attack_id: Optional[str] = None
+
+
+@dataclass
+class BatchResult(Generic[T]):
+    """Result of a batch operation"""
+
+    content: List[T] = field(default_factory=list)
+    errors: List[BatchItemError] = field(default_factory=list)
+
+    @property
+    def has_errors(self) -> bool:
+        return len(self.errors) > 0
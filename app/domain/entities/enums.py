@@ -71,6 +71,26 @@ class FumbleStatus(Enum):
         raise TypeError(f"Invalid FumbleStatus value: {value}")
 
 
+class CountMode(Enum):
+    """Total count mode of paged searches"""
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+    @classmethod
+    def from_value(cls, value: Union[str, "CountMode"]) -> "CountMode":
+        if not value:
+            return None
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            for i in cls:
+                if i.value == value:
+                    return i
+        raise TypeError(f"Invalid CountMode value: {value}")
+
+
 class AttackSize(Enum):
     """Attack size enumeration"""
 
@@ -4,7 +4,7 @@ This represents a page of results with metadata.
 """
 
 from dataclasses import dataclass
-from typing import List, TypeVar, Generic
+from typing import List, Optional, TypeVar, Generic
 import math
 
 T = TypeVar("T")
@@ -16,11 +16,20 @@ class Pagination:
 
     page: int
     size: int
-    total_elements: int
+    # None when the count was skipped
+    total_elements: Optional[int]
+    # ID of the last element when more elements follow, used as keyset cursor
+    next_after: Optional[str] = None
+    # False when total_elements is an estimate
+    total_exact: bool = True
+    # Keyset cursor the page starts after, None for offset pages
+    after: Optional[str] = None
 
     @property
-    def total_pages(self) -> int:
+    def total_pages(self) -> Optional[int]:
         """Calculate total number of pages"""
+        if self.total_elements is None:
+            return None
         if self.size <= 0:
             return 0
         return math.ceil(self.total_elements / self.size)
@@ -28,11 +37,14 @@ class Pagination:
     @property
     def is_first(self) -> bool:
         """Check if this is the first page"""
-        return self.page == 0
+        return self.page == 0 and self.after is None
 
     @property
     def is_last(self) -> bool:
         """Check if this is the last page"""
+        # The page number of cursor pages is always 0, only next_after is known
+        if self.total_elements is None or self.after is not None:
+            return self.next_after is None
         return self.page >= self.total_pages - 1
 
 
@@ -50,7 +62,7 @@ class Page(Generic[T]):
 
     # Backward compatibility properties
     @property
-    def total_elements(self) -> int:
+    def total_elements(self) -> Optional[int]:
         """Get total elements (backward compatibility)"""
         return self.pagination.total_elements
 
@@ -65,7 +77,7 @@ class Page(Generic[T]):
         return self.pagination.size
 
     @property
-    def total_pages(self) -> int:
+    def total_pages(self) -> Optional[int]:
         """Get total pages (backward compatibility)"""
         return self.pagination.total_pages
 
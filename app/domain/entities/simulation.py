@@ -0,0 +1,24 @@
+"""
+Domain entities for attack outcome simulations.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class AttackSimulation:
+    """Outcome distribution of an attack over many simulated rolls"""
+
+    samples: int
+    hit_rate: float = 0.0
+    miss_rate: float = 0.0
+    fumble_rate: float = 0.0
+    critical_rate: float = 0.0
+    # Expected damage of the attack, fumbles count as no damage
+    damage_mean: float = 0.0
+    # Probability of each damage value, fumbles excluded
+    damage: dict[int, float] = field(default_factory=dict)
+    # Probability of each critical severity of the attack table entry
+    critical_severities: dict[str, float] = field(default_factory=dict)
+    # Mean roll total of the samples that are not fumbles
+    roll_total_mean: float = 0.0
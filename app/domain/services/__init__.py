@@ -1,5 +1,11 @@
 from .attack_domain_service import AttackDomainService
 from .attack_calculator import AttackCalculator
 from .attack_resolution_service import AttackResolutionService
+from .attack_simulator import AttackSimulator
 
-__all__ = ["AttackDomainService", "AttackCalculator", "AttackResolutionService"]
+__all__ = [
+    "AttackDomainService",
+    "AttackCalculator",
+    "AttackResolutionService",
+    "AttackSimulator",
+]
@@ -1,20 +1,51 @@
+import asyncio
 import math
+from collections import defaultdict
 from typing import Optional
 from uuid import uuid4
+
+import numpy as np
+
 from app.domain.entities import (
     Attack,
     AttackCalculations,
     AttackBonusEntry,
     AttackFumbleResult,
+    AttackModifiers,
     AttackResult,
-    AttackCriticalResult
 )
-from app.domain.entities.enums import AttackStatus, Cover, CriticalStatus, FumbleStatus, PositionalSource, PositionalTarget, RestrictedQuarters
-from app.application.ports import AttackNotificationPort, AttackTableClient
+from app.domain.entities.enums import AttackStatus, FumbleStatus
+from app.domain.services.attack_outcome_table import (
+    AttackOutcomeTable,
+    critical_templates,
+    table_roll,
+)
+from app.domain.services.attack_recalculation import (
+    CalculationStage,
+    affected_stages,
+    changed_modifiers,
+)
+from app.domain.services.attack_roll_modifiers import (
+    calculate_roll_modifiers,
+    roll_modifier_entries,
+    roll_modifier_matrix,
+)
+from app.application.ports import (
+    AttackNotificationPort,
+    AttackTableClient,
+    ATTACK_TABLE_MAX_ROLL,
+)
 from app.infrastructure.logging.logger_config import get_logger
 
 logger = get_logger(__name__)
 
+
+_CALCULATED_HIT_STATUSES = (
+    AttackStatus.PENDING_CRITICAL_ROLL,
+    AttackStatus.PENDING_APPLY,
+)
+
+
 class AttackCalculator:
 
     def __init__(
@@ -32,12 +63,210 @@ class AttackCalculator:
             self.calculate_attack_roll_modifiers(attack)
             self.calculate_critical_modifiers(attack)
             self.calculate_critical_severity_modifiers(attack)
-            await self.calculate_attack_results(attack)
+            if not await self.calculate_attack_results(attack):
+                # A FAILED attack must not become pending
+                return
             self.create_critical_results(attack)
         else:
             self.calculate_fumble_result(attack)
         self.update_status(attack)
 
+    async def recalculate_attack(
+        self, attack: Attack, previous_modifiers: AttackModifiers
+    ) -> None:
+        """
+        Recalculate an attack whose modifiers changed from previous_modifiers.
+        Only the stages depending on the changed modifiers run again, and the
+        attack table is only read when the table, size, AT or the adjusted roll
+        total changed. Calculations, table entry and status match calculate_attack,
+        but criticals, including rolled ones, are kept while their table entry and
+        critical total do not change, where calculate_attack would make them
+        pending again.
+        """
+        stages = affected_stages(
+            changed_modifiers(previous_modifiers, attack.modifiers)
+        )
+        calculated = attack.calculated
+        results = attack.results
+        # Only the results of a calculated hit can be updated
+        if (
+            CalculationStage.FUMBLE in stages
+            or attack.status not in _CALCULATED_HIT_STATUSES
+            or not calculated
+            or not results
+            or attack.is_fumble()
+        ):
+            await self.calculate_attack(attack)
+            return
+        self.validate_attack(attack)
+
+        previous_roll_total = calculated.roll_total
+        previous_critical_total = calculated.critical_total
+        if CalculationStage.ROLL in stages:
+            calculated.roll_modifiers = []
+            calculated.critical_modifiers = []
+            self.calculate_attack_roll_modifiers(attack)
+            self.calculate_critical_modifiers(attack)
+        if CalculationStage.CRITICAL_SEVERITY in stages:
+            calculated.critical_severity_modifiers = []
+            self.calculate_critical_severity_modifiers(attack)
+
+        previous_entry = results.attack_table_entry
+        if (
+            CalculationStage.ATTACK_TABLE in stages
+            or not previous_entry
+            or table_roll(calculated.roll_total) != table_roll(previous_roll_total)
+        ):
+            attack.results = AttackResult(attack_table_entry=None, criticals=[])
+            if not await self.calculate_attack_results(attack):
+                attack.mark_dirty("calculated", "results")
+                return
+        if (
+            attack.results.attack_table_entry != previous_entry
+            or calculated.critical_total != previous_critical_total
+        ):
+            attack.results.criticals = []
+            self.create_critical_results(attack)
+        else:
+            attack.results.criticals = results.criticals
+        attack.mark_dirty("calculated", "results")
+        self.update_status(attack)
+
+    async def calculate_many(self, attacks: list[Attack]) -> list[Optional[Exception]]:
+        """
+        Calculate many attacks at once, with the same results as calculate_attack
+        on each one. Roll modifiers, roll totals, absolute hit bonuses and critical
+        severity totals are computed in a single NumPy pass, and attack table
+        entries are read with one row lookup per table, size and AT.
+        Returns the error of each attack, None for the calculated ones. Attacks
+        whose table row cannot be read or reaching invalid criticals are FAILED.
+        """
+        for attack in attacks:
+            self.validate_attack(attack)
+            self.initialize_attack_calculations(attack)
+        fumbles = [attack for attack in attacks if attack.is_fumble()]
+        hits = [attack for attack in attacks if not attack.is_fumble()]
+        self.calculate_many_roll_modifiers(hits)
+
+        failed = await self.calculate_many_attack_results(hits)
+
+        for attack in fumbles:
+            self.calculate_fumble_result(attack)
+        for attack in attacks:
+            self.update_status(attack)
+        errors: list[Optional[Exception]] = [None] * len(attacks)
+        indexes = {id(attack): index for index, attack in enumerate(attacks)}
+        for attack, error in failed:
+            attack.status = AttackStatus.FAILED
+            errors[indexes[id(attack)]] = error
+        return errors
+
+    async def calculate_batch(self, attacks: list[Attack]) -> list[Optional[Exception]]:
+        """
+        Calculate the valid attacks of a batch with calculate_many. Returns the
+        error of each attack, None for the calculated ones, so invalid attacks do
+        not fail the others.
+        """
+        errors: list[Optional[Exception]] = [None] * len(attacks)
+        valid: list[Attack] = []
+        positions: list[int] = []
+        for index, attack in enumerate(attacks):
+            try:
+                self.validate_attack(attack)
+            except ValueError as e:
+                errors[index] = e
+                continue
+            valid.append(attack)
+            positions.append(index)
+        for index, error in zip(positions, await self.calculate_many(valid)):
+            errors[index] = error
+        return errors
+
+    def calculate_many_roll_modifiers(self, attacks: list[Attack]) -> None:
+        """Roll, critical and critical severity modifiers of many attacks"""
+        if not attacks:
+            return
+        matrix = roll_modifier_matrix(attacks)
+        roll_totals = matrix.sum(axis=1)
+        # ceil((total - 175) / 5) for totals above 175
+        absolute_hits = np.where(
+            roll_totals > ATTACK_TABLE_MAX_ROLL,
+            -((ATTACK_TABLE_MAX_ROLL - roll_totals) // 5),
+            0,
+        )
+        severity_totals = np.fromiter(
+            (attack.modifiers.situational_modifiers.size_difference for attack in attacks),
+            dtype=np.int64,
+            count=len(attacks),
+        )
+        for attack, roll_modifiers, roll_total, absolute_hit, severity in zip(
+            attacks,
+            roll_modifier_entries(matrix),
+            roll_totals.tolist(),
+            absolute_hits.tolist(),
+            severity_totals.tolist(),
+        ):
+            calculated = attack.calculated
+            calculated.roll_modifiers = roll_modifiers
+            calculated.roll_total = roll_total
+            if absolute_hit:
+                calculated.critical_modifiers.append(
+                    AttackBonusEntry("absolute-hit", absolute_hit)
+                )
+            calculated.critical_total = absolute_hit
+            if severity != 0:
+                calculated.critical_severity_modifiers.append(
+                    AttackBonusEntry("size-difference", severity)
+                )
+            calculated.critical_severity_total = severity
+
+    async def calculate_many_attack_results(
+        self, attacks: list[Attack]
+    ) -> list[tuple[Attack, Exception]]:
+        """
+        Attack table entries and criticals of many attacks. Each table row is
+        read once per call and resolved into an AttackOutcomeTable indexed by
+        roll total. Returns the attacks whose table row cannot be read or whose
+        table entry has invalid criticals, with their error.
+        """
+        failed: list[tuple[Attack, Exception]] = []
+        if not self._attack_table_client or not attacks:
+            return failed
+        groups: dict[tuple[str, str, int], list[Attack]] = defaultdict(list)
+        for attack in attacks:
+            modifiers = attack.modifiers
+            key = (modifiers.attack_table, modifiers.attack_size, modifiers.at)
+            groups[key].append(attack)
+        rows = await asyncio.gather(
+            *(
+                self._attack_table_client.get_attack_table_row(
+                    attack_table=attack_table, size=size, at=at
+                )
+                for attack_table, size, at in groups
+            ),
+            return_exceptions=True,
+        )
+        for group, row in zip(groups.values(), rows):
+            if isinstance(row, Exception):
+                logger.error(f"Error calculating attack results: {row}")
+                failed.extend((attack, row) for attack in group)
+                continue
+            outcome_table = AttackOutcomeTable.from_row(row)
+            for attack in group:
+                outcome = outcome_table.outcome(attack.calculated.roll_total)
+                try:
+                    criticals = outcome.create_criticals()
+                except ValueError as e:
+                    # Only the attacks reaching an invalid entry fail
+                    logger.error(f"Error calculating attack criticals: {e}")
+                    failed.append((attack, e))
+                    criticals = []
+                attack.results = AttackResult(
+                    attack_table_entry=outcome.create_entry(),
+                    criticals=criticals,
+                )
+        return failed
+
     def validate_attack(self, attack: Attack) -> None:
         if not attack:
             raise ValueError("Attack cannot be None")
@@ -64,7 +293,8 @@ class AttackCalculator:
             fumble=None,
         )
 
-    async def calculate_attack_results(self, attack: Attack) -> None:
+    async def calculate_attack_results(self, attack: Attack) -> bool:
+        """Read the attack table entry, False when the attack FAILED"""
         if self._attack_table_client:
             try:
                 attack_table_entry = (
@@ -83,189 +313,15 @@ class AttackCalculator:
                 logger.error(f"Error calculating attack results: {e}")
                 # TODO update attack message
                 attack.status = AttackStatus.FAILED
+                return False
+        return True
 
     def calculate_attack_roll_modifiers(self, attack: Attack) -> None:
-        roll_modifiers = attack.modifiers.roll_modifiers
-
-        if(attack.roll):
-            self.append_bonus(attack, "roll", attack.roll.roll)
-
-        self.append_bonus(attack, "bo", roll_modifiers.bo)
-        self.append_injury_penalty(attack)
-        self.append_bonus(attack, "fatigue-penalty", roll_modifiers.fatigue_penalty)
-        self.append_pace_penalty(attack)
-        self.append_bonus(attack, "range-penalty", roll_modifiers.range_penalty)
-        self.append_bonus_bd(attack)
-        self.append_bonus_bd_shield(attack)
-        self.append_parry(attack)
-        self.append_bonus(attack, "custom-bonus", roll_modifiers.custom_bonus)
-        self.append_off_hand(attack)
-        self.append_restricted_quarters(attack)
-        self.append_source_statuses(attack)
-        self.append_target_statuses(attack)
-        self.append_source_weapon_type(attack)
-        self.append_positional_source(attack)
-        self.append_positional_target(attack)
-        self.append_cover(attack)
-        self.append_range_in_melee_bonus(attack)
-        self.append_size_bonus(attack)
-        
         # TODO called shot
-
-        attack.calculated.roll_modifiers = [
-            p for p in attack.calculated.roll_modifiers if p.value != 0
-        ]
-        attack.calculated.roll_total = sum(p.value for p in attack.calculated.roll_modifiers)
-
-
-
-    def append_bonus(self, attack: Attack, key: str, value: int) -> None:
-        attack.calculated.roll_modifiers.append(AttackBonusEntry(key=key, value=value))
-
-    def append_with_skill(
-        self, attack: Attack, key: str, value: int, skill_id: str
-    ) -> None:
-        if not value or value == 0:
-            return
-        skill_bonus = self.get_skill_bonus(attack, skill_id)
-        skill_bonus_adjusted = min(abs(value), skill_bonus)
-        self.append_bonus(attack, key, value)
-        self.append_bonus(attack, f"{key}-skill-{skill_id}", skill_bonus_adjusted)
-
-    def get_skill_bonus(self, attack: Attack, skill_id: str) -> int:
-        for skill in attack.modifiers.source_skills:
-            if skill.skill_id == skill_id:
-                return skill.bonus
-        return 0
-
-    def source_has_status(self, attack: Attack, status: str) -> bool:
-        return status in attack.modifiers.situational_modifiers.source_status
-
-    def target_has_status(self, attack: Attack, status: str) -> bool:
-        return status in attack.modifiers.situational_modifiers.target_status
-
-    def append_bonus_bd(self, attack: Attack) -> None:
-        if not attack.modifiers.situational_modifiers.disabled_db:
-            self.append_bonus(attack, "bd", -attack.modifiers.roll_modifiers.bd)
-
-    def append_bonus_bd_shield(self, attack: Attack) -> None:
-        if not attack.modifiers.situational_modifiers.disabled_shield:
-            self.append_bonus(attack, "shield", -attack.modifiers.roll_modifiers.shield)
-
-    def append_injury_penalty(self, attack: Attack) -> None:
-        self.append_bonus(
-            attack,
-            "injury-penalty",
-            attack.modifiers.roll_modifiers.injury_penalty,
-        )
-
-    def append_pace_penalty(self, attack: Attack) -> None:
-        # Only use footwork skill for melee attacks
-        if attack.is_melee():
-            self.append_with_skill(
-                attack,
-                "pace-penalty",
-                attack.modifiers.roll_modifiers.pace_penalty,
-                "footwork",
-            )
-        else:
-            self.append_bonus(
-                attack,
-                "pace-penalty",
-                attack.modifiers.roll_modifiers.pace_penalty,
-            )
-
-    def append_parry(self, attack: Attack) -> None:
-        if not attack.modifiers.situational_modifiers.disabled_parry:
-            self.append_bonus(attack, "parry", -attack.modifiers.roll_modifiers.parry)
-
-    def append_off_hand(self, attack: Attack) -> None:
-        if attack.modifiers.situational_modifiers.off_hand:
-            self.append_bonus(attack, "off-hand", -20)
-
-    def append_restricted_quarters(self, attack: Attack) -> None:
-        if attack.modifiers.situational_modifiers.restricted_quarters:
-            bonus = 0;
-            match attack.modifiers.situational_modifiers.restricted_quarters:
-                case RestrictedQuarters.CLOSE:
-                    bonus = -25
-                case RestrictedQuarters.CRAMPED:
-                    bonus = -50
-                case RestrictedQuarters.TIGHT:
-                    bonus = -75
-                case RestrictedQuarters.CONFINED:
-                    bonus = -100
-            self.append_with_skill(attack, "restricted-quarters", bonus, "restricted-quarters")
-
-    def append_positional_source(self, attack: Attack) -> None:
-        if attack.modifiers.situational_modifiers.positional_source and attack.is_melee():
-            bonus = 0
-            match attack.modifiers.situational_modifiers.positional_source:
-                case PositionalSource.TO_FLANK:
-                    bonus = -30
-                case PositionalSource.TO_REAR:
-                    bonus = -70
-            self.append_bonus(attack, "positional-source", bonus)
-            reverse_strike_skill_bonus = self.get_skill_bonus(attack, "reverse-strike")
-            self.append_bonus(attack, "positional-source-skill-reverse-strike", reverse_strike_skill_bonus)
-
-    def append_positional_target(self, attack: Attack) -> None:
-        if attack.modifiers.situational_modifiers.positional_target and attack.is_melee():
-            bonus = 0
-            match attack.modifiers.situational_modifiers.positional_target:
-                case PositionalTarget.FLANK:
-                    bonus = 15
-                case PositionalTarget.REAR:
-                    bonus = 35
-            self.append_bonus(attack, "positional-target", bonus)
-
-    def append_source_statuses(self, attack: Attack) -> None:
-        if self.source_has_status(attack, "prone"):
-            self.append_bonus(attack, "prone-source", -50)
-
-    def append_target_statuses(self, attack: Attack) -> None:
-        if self.target_has_status(attack, "stunned"):
-            self.append_bonus(attack, "stunned-target", 20)
-        if self.target_has_status(attack, "surprised"):
-            self.append_bonus(attack, "surprised-target", 25)
-        if self.target_has_status(attack, "prone"):
-            if attack.is_melee():
-                self.append_bonus(attack, "prone-target", 30)
-            else:
-                self.append_bonus(attack, "prone-target", -30)
-
-    def append_source_weapon_type(self, attack: Attack) -> None:
-        if attack.modifiers.situational_modifiers.off_hand:
-            self.append_bonus(attack,"off-hand-weapon",-20)
-            if self.source_has_status(attack, "ambidextrous"):
-                self.append_bonus(attack, "ambidextrous", 20)
-        if attack.modifiers.situational_modifiers.two_handed_weapon and attack.is_melee():
-            self.append_bonus(attack, "two-handed-weapon", 10)
-
-    def append_range_in_melee_bonus(self, attack: Attack) -> None:
-        if not attack.is_melee() and self.source_has_status(attack, "melee"):
-            self.append_bonus(attack, "range-in-melee", -20)
-
-    def append_cover(self, attack: Attack) -> None:
-        bonus = 0
-        match attack.modifiers.situational_modifiers.cover:
-            case Cover.SOFT_PARTIAL:
-                bonus = -10 or not attack.is_melee() -20
-            case Cover.SOFT_HALF:
-                bonus = -20 or not attack.is_melee() -40
-            case Cover.SOFT_FULL:
-                bonus = -50 or not attack.is_melee() -100
-            case Cover.HARD_PARTIAL:
-                bonus = -20 or not attack.is_melee() -40
-            case Cover.HARD_HALF:
-                bonus = -40 or not attack.is_melee() -80
-            case Cover.HARD_FULL:
-                bonus = -100 or not attack.is_melee() -200
-        self.append_bonus(attack, "cover", bonus)
-
-    def append_size_bonus(self, attack: Attack) -> None:
-        if attack.modifiers.situational_modifiers.size_difference and attack.modifiers.situational_modifiers.size_difference < 0:
-            self.append_bonus(attack, "size-bonus", attack.modifiers.situational_modifiers.size_difference * 5)
+        roll_modifiers = [p for p in attack.calculated.roll_modifiers if p.value != 0]
+        roll_modifiers.extend(calculate_roll_modifiers(attack))
+        attack.calculated.roll_modifiers = roll_modifiers
+        attack.calculated.roll_total = sum(p.value for p in roll_modifiers)
 
     def calculate_critical_modifiers(self, attack: Attack) -> None:
         if attack.calculated.roll_total > 175:
@@ -290,35 +346,15 @@ class AttackCalculator:
         )
 
     def create_critical_results(self, attack: Attack) -> None:
-        if not attack.results.attack_table_entry or not attack.results.attack_table_entry.critical_type:
+        entry = attack.results.attack_table_entry
+        if not entry or not entry.critical_type:
             return
-        critical_severity_map: dict[str, list[str]] = {
-            "A": ["A"],
-            "B": ["B"],
-            "C": ["C"],
-            "D": ["D"],
-            "E": ["E"],
-            "F": ["E", "A"],
-            "G": ["E", "B"],
-            "H": ["E", "C"],
-            "I": ["E", "C", "A"],
-            "J": ["J", "C", "B"],
-        }
-        if attack.results.attack_table_entry.critical_severity not in critical_severity_map:
-            raise ValueError(
-                f"Invalid critical severity: {attack.results.attack_table_entry.critical_severity}"
-            )
-        severity_list = critical_severity_map.get(attack.results.attack_table_entry.critical_severity, [])
         attack.results.criticals = [
-            AttackCriticalResult(
-                critical_type=attack.results.attack_table_entry.critical_type,
-                critical_severity=severity,
-                status=CriticalStatus.PENDING_CRITICAL_ROLL,
-            ) for severity in severity_list
+            template.create()
+            for template in critical_templates(
+                entry.critical_type, entry.critical_severity
+            )
         ]
-        # TODO check additional critical features
-        for idx, critical in enumerate(attack.results.criticals):
-            critical.key = f"{critical.critical_type}_{critical.critical_severity}_{idx+1}".lower()
 
     def update_status(self, attack: Attack) -> None:
         if attack.results.criticals:
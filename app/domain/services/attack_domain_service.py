@@ -4,7 +4,7 @@ These contain business logic that doesn't naturally fit into entities.
 """
 
 from typing import Optional
-from app.domain.entities import Attack
+from app.domain.entities import Attack, BatchItemError, BatchResult
 
 # TODO fix import
 from app.application.ports import AttackRepository, AttackNotificationPort
@@ -41,6 +41,38 @@ class AttackDomainService:
 
         return created_attack
 
+    async def create_attacks(self, attacks: list[Attack]) -> BatchResult[Attack]:
+        """
+        Create several attacks with a single bulk insert.
+        Error indexes refer to positions in the given list.
+        """
+
+        result = BatchResult[Attack]()
+        valid_attacks: list[Attack] = []
+        positions: list[int] = []
+        for index, attack in enumerate(attacks):
+            try:
+                self._attack_calculator.initialize_attack_calculations(attack)
+                self._attack_calculator.calculate_attack_roll_modifiers(attack)
+            except Exception as e:
+                result.errors.append(BatchItemError(index=index, message=str(e)))
+                continue
+            valid_attacks.append(attack)
+            positions.append(index)
+
+        saved = await self._attack_repository.save_all(valid_attacks)
+        result.content = saved.content
+        for error in saved.errors:
+            error.index = positions[error.index]
+            result.errors.append(error)
+        result.errors.sort(key=lambda error: error.index)
+
+        if self._notification_port:
+            for created_attack in result.content:
+                await self._notification_port.notify_attack_created(created_attack)
+
+        return result
+
     async def apply_attack_results(
         self,
         attack_id: str,
@@ -68,6 +100,6 @@ class AttackDomainService:
         if self._notification_port:
             await self._notification_port.notify_attack_results_applied(attack)
             attack.status = AttackStatus.APPLIED
-            updated_attack = await self._attack_repository.update(attack)
+            updated_attack = await self._attack_repository.patch(attack)
             return updated_attack
         pass
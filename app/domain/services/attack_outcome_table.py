@@ -0,0 +1,116 @@
+"""
+Precomputed attack outcomes.
+For a given attack table, size and AT the outcome of an attack only depends on
+its roll total, so each row read for a batch is resolved once into immutable
+outcomes holding the table entry and the criticals it causes. Resolving a roll
+is then a single index plus copies of the templates.
+"""
+
+import copy
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+from app.domain.entities import AttackCriticalResult, AttackTableEntry
+from app.domain.entities.enums import CriticalStatus
+from app.application.ports import ATTACK_TABLE_MIN_ROLL, ATTACK_TABLE_MAX_ROLL
+
+# Criticals caused by each severity of an attack table entry
+CRITICAL_SEVERITIES: dict[str, tuple[str, ...]] = {
+    "A": ("A",),
+    "B": ("B",),
+    "C": ("C",),
+    "D": ("D",),
+    "E": ("E",),
+    "F": ("E", "A"),
+    "G": ("E", "B"),
+    "H": ("E", "C"),
+    "I": ("E", "C", "A"),
+    "J": ("J", "C", "B"),
+}
+
+
+def table_roll(roll_total: int) -> int:
+    """Roll of the attack table read for a roll total"""
+    return min(ATTACK_TABLE_MAX_ROLL, max(roll_total, ATTACK_TABLE_MIN_ROLL))
+
+
+@dataclass(frozen=True, slots=True)
+class CriticalTemplate:
+    """Immutable critical of an attack outcome, copied into each attack"""
+
+    key: str
+    critical_type: str
+    critical_severity: str
+
+    def create(self) -> AttackCriticalResult:
+        return AttackCriticalResult(
+            key=self.key,
+            status=CriticalStatus.PENDING_CRITICAL_ROLL,
+            critical_type=self.critical_type,
+            critical_severity=self.critical_severity,
+        )
+
+
+@lru_cache(maxsize=None)
+def critical_templates(
+    critical_type: str, critical_severity: str
+) -> tuple[CriticalTemplate, ...]:
+    """Criticals of an attack table entry, raises ValueError on unknown severities"""
+    if critical_severity not in CRITICAL_SEVERITIES:
+        raise ValueError(f"Invalid critical severity: {critical_severity}")
+    # TODO check additional critical features
+    return tuple(
+        CriticalTemplate(
+            key=f"{critical_type}_{severity}_{idx + 1}".lower(),
+            critical_type=critical_type,
+            critical_severity=severity,
+        )
+        for idx, severity in enumerate(CRITICAL_SEVERITIES[critical_severity])
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class AttackOutcome:
+    """Table entry and criticals of a roll total"""
+
+    entry: Optional[AttackTableEntry]
+    criticals: tuple[CriticalTemplate, ...] = ()
+    # Set instead of criticals when the entry has an unknown severity, so the
+    # error is raised by the attacks reaching it, as create_critical_results does
+    error: Optional[str] = None
+
+    def create_entry(self) -> Optional[AttackTableEntry]:
+        """Copy of the table entry, owned by the attack"""
+        return copy.copy(self.entry)
+
+    def create_criticals(self) -> list[AttackCriticalResult]:
+        if self.error:
+            raise ValueError(self.error)
+        return [template.create() for template in self.criticals]
+
+    @classmethod
+    def from_entry(cls, entry: Optional[AttackTableEntry]) -> "AttackOutcome":
+        if not entry or not entry.critical_type:
+            return cls(entry=entry)
+        try:
+            criticals = critical_templates(entry.critical_type, entry.critical_severity)
+        except ValueError as e:
+            return cls(entry=entry, error=str(e))
+        return cls(entry=entry, criticals=criticals)
+
+
+@dataclass(frozen=True, slots=True)
+class AttackOutcomeTable:
+    """Outcomes of an attack table row indexed by roll total - 1"""
+
+    outcomes: tuple[AttackOutcome, ...]
+
+    def outcome(self, roll_total: int) -> AttackOutcome:
+        """Outcome of a roll total, adjusted to the rolls of the table"""
+        return self.outcomes[table_roll(roll_total) - ATTACK_TABLE_MIN_ROLL]
+
+    @classmethod
+    def from_row(cls, row: list[AttackTableEntry]) -> "AttackOutcomeTable":
+        """Outcome table of an attack table row as read by get_attack_table_row"""
+        return cls(outcomes=tuple(AttackOutcome.from_entry(entry) for entry in row))
@@ -0,0 +1,74 @@
+"""
+Dependencies between attack modifiers and calculated values.
+The calculation of an attack runs in stages: roll modifiers give the roll total
+and the critical modifiers, the size difference gives the critical severity
+modifiers, and the roll total with the attack table, size and AT give the table
+entry and its criticals. When a few modifiers change, only the stages depending
+on them need to run again.
+"""
+
+from dataclasses import fields, is_dataclass
+from enum import Flag, auto
+
+from app.domain.entities import AttackModifiers
+
+
+class CalculationStage(Flag):
+    """Stages of an attack calculation"""
+
+    NONE = 0
+    ROLL = auto()
+    CRITICAL_SEVERITY = auto()
+    ATTACK_TABLE = auto()
+    # Changes the attack between a hit and a fumble
+    FUMBLE = auto()
+    ALL = ROLL | CRITICAL_SEVERITY | ATTACK_TABLE | FUMBLE
+
+
+# Stages depending on each modifier, nested fields fall back to their parent
+MODIFIER_STAGES: dict[str, CalculationStage] = {
+    "attack_type": CalculationStage.ROLL,
+    "attack_table": CalculationStage.ATTACK_TABLE,
+    "attack_size": CalculationStage.ATTACK_TABLE,
+    "at": CalculationStage.ATTACK_TABLE,
+    "fumble": CalculationStage.FUMBLE,
+    "fumble_table": CalculationStage.NONE,
+    "action_points": CalculationStage.NONE,
+    "roll_modifiers": CalculationStage.ROLL,
+    "situational_modifiers": CalculationStage.ROLL,
+    "situational_modifiers.size_difference": (
+        CalculationStage.ROLL | CalculationStage.CRITICAL_SEVERITY
+    ),
+    "features": CalculationStage.ROLL,
+    "source_skills": CalculationStage.ROLL,
+}
+
+
+def changed_modifiers(previous: AttackModifiers, current: AttackModifiers) -> set[str]:
+    """Fields that differ between two modifiers, e.g. roll_modifiers.parry"""
+    changed: set[str] = set()
+    for field in fields(AttackModifiers):
+        before = getattr(previous, field.name)
+        after = getattr(current, field.name)
+        if before == after:
+            continue
+        if is_dataclass(before) and type(before) is type(after):
+            changed.update(
+                f"{field.name}.{nested.name}"
+                for nested in fields(before)
+                if getattr(before, nested.name) != getattr(after, nested.name)
+            )
+        else:
+            changed.add(field.name)
+    return changed
+
+
+def affected_stages(changed: set[str]) -> CalculationStage:
+    """Stages to run again after the given modifiers changed"""
+    stages = CalculationStage.NONE
+    for name in changed:
+        stage = MODIFIER_STAGES.get(name)
+        if stage is None:
+            stage = MODIFIER_STAGES.get(name.split(".", 1)[0], CalculationStage.ALL)
+        stages |= stage
+    return stages
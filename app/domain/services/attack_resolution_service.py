@@ -1,11 +1,12 @@
 from typing import Optional
 
-from app.domain.entities import Attack, AttackRoll
+from app.domain.entities import Attack, AttackRoll, BatchItemError, BatchResult
 from app.domain.entities.enums import AttackStatus, CriticalStatus
 from app.application.ports import (
     AttackRepository,
     AttackNotificationPort,
     AttackTableClient,
+    CalculationExecutor,
 )
 
 from .attack_calculator import AttackCalculator
@@ -20,24 +21,91 @@ class AttackResolutionService:
         attack_calculator: AttackCalculator,
         notification_port: Optional[AttackNotificationPort] = None,
         attack_table_client: AttackTableClient = None,
+        calculation_executor: Optional[CalculationExecutor] = None,
     ):
         self._attack_repository = attack_repository
         self._attack_calculator = attack_calculator
         self._notification_port = notification_port
         self._attack_table_client = attack_table_client
+        self._calculation_executor = calculation_executor
 
     async def update_attack_roll(self, attack_id: str, roll: int) -> Attack:
         # TODO check valid status
         attack = await self._attack_repository.find_by_id(attack_id)
         attack.roll = AttackRoll(roll=roll)
         await self._attack_calculator.calculate_attack(attack)
-        updated_attack = await self._attack_repository.update(attack)
+        updated_attack = await self._attack_repository.patch(attack)
         return updated_attack
 
+    async def update_attack_rolls(
+        self, rolls: list[tuple[str, int]]
+    ) -> BatchResult[Attack]:
+        """
+        Resolve the rolls of several attacks loading and saving them in bulk.
+        Table lookups run concurrently, identical lookups are deduplicated by the
+        attack table client.
+        """
+        attacks = await self._attack_repository.find_by_ids(
+            [attack_id for attack_id, _ in rolls]
+        )
+        attacks_by_id = {attack.id: attack for attack in attacks}
+
+        result = BatchResult[Attack]()
+        pending: list[tuple[int, Attack]] = []
+        for index, (attack_id, roll) in enumerate(rolls):
+            attack = attacks_by_id.get(attack_id)
+            if not attack:
+                result.errors.append(
+                    BatchItemError(
+                        index=index,
+                        attack_id=attack_id,
+                        message=f"Attack with ID '{attack_id}' not found",
+                    )
+                )
+                continue
+            attack.roll = AttackRoll(roll=roll)
+            pending.append((index, attack))
+
+        outcomes = await self._calculate_attacks([attack for _, attack in pending])
+        for (index, attack), outcome in zip(pending, outcomes):
+            if isinstance(outcome, Exception):
+                result.errors.append(
+                    BatchItemError(
+                        index=index, attack_id=attack.id, message=str(outcome)
+                    )
+                )
+            else:
+                result.content.append(attack)
+
+        updated = await self._attack_repository.update_all(result.content)
+        if len(updated) < len(result.content):
+            # Attacks deleted after being loaded are not written
+            updated_ids = {attack.id for attack in updated}
+            indexes = {attack.id: index for index, attack in pending}
+            for attack in result.content:
+                if attack.id not in updated_ids:
+                    result.errors.append(
+                        BatchItemError(
+                            index=indexes[attack.id],
+                            attack_id=attack.id,
+                            message=f"Attack with ID '{attack.id}' not found",
+                        )
+                    )
+            result.content = updated
+        result.errors.sort(key=lambda error: error.index)
+        return result
+
+    async def _calculate_attacks(
+        self, attacks: list[Attack]
+    ) -> list[Optional[Exception]]:
+        """Errors of each attack, large batches may run on the calculation executor"""
+        if self._calculation_executor:
+            return await self._calculation_executor.calculate_attacks(attacks)
+        return await self._attack_calculator.calculate_batch(attacks)
+
     async def update_critical_roll(
         self, attack_id: str, critical_key: str, roll: int
     ) -> Attack:
-
         attack = await self._attack_repository.find_by_id(attack_id)
         if not attack.status == AttackStatus.PENDING_CRITICAL_ROLL:
             raise ValueError("Attack is not in a state to roll criticals")
@@ -49,6 +117,9 @@ class AttackResolutionService:
             attack.roll.critical_rolls = {}
 
         attack.roll.critical_rolls[critical_key] = roll
+        attack.mark_dirty(
+            f"roll.critical_rolls.{critical_key}", f"results.criticals.{critical_key}"
+        )
         # TODO calculations
 
         roll_bonus = attack.calculated.critical_total or 0
@@ -63,7 +134,7 @@ class AttackResolutionService:
         critical_result.status = CriticalStatus.PENDING_APPLY
         critical_result.result = critical_table_entry
 
-        updated_attack = await self._attack_repository.update(attack)
+        updated_attack = await self._attack_repository.patch(attack)
         return updated_attack
 
     async def update_fumble_roll(self, attack_id: str, roll: int) -> Attack:
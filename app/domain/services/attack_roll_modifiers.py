@@ -0,0 +1,354 @@
+"""
+Table-driven attack roll modifiers.
+Situational bonuses are precomputed per enum value and skills are indexed once
+per attack, so computing the modifiers only allocates the non-zero entries.
+roll_modifier_matrix computes the same modifiers for many attacks with NumPy.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+from app.domain.entities import Attack, AttackBonusEntry
+from app.domain.entities.enums import (
+    Cover,
+    PositionalSource,
+    PositionalTarget,
+    RestrictedQuarters,
+)
+
+RESTRICTED_QUARTERS_BONUS: dict[RestrictedQuarters, int] = {
+    RestrictedQuarters.CLOSE: -25,
+    RestrictedQuarters.CRAMPED: -50,
+    RestrictedQuarters.TIGHT: -75,
+    RestrictedQuarters.CONFINED: -100,
+}
+
+POSITIONAL_SOURCE_BONUS: dict[PositionalSource, int] = {
+    PositionalSource.TO_FLANK: -30,
+    PositionalSource.TO_REAR: -70,
+}
+
+POSITIONAL_TARGET_BONUS: dict[PositionalTarget, int] = {
+    PositionalTarget.FLANK: 15,
+    PositionalTarget.REAR: 35,
+}
+
+# The same value applies to melee and ranged attacks
+COVER_BONUS: dict[Cover, int] = {
+    Cover.SOFT_PARTIAL: -10,
+    Cover.SOFT_HALF: -20,
+    Cover.SOFT_FULL: -50,
+    Cover.HARD_PARTIAL: -20,
+    Cover.HARD_HALF: -40,
+    Cover.HARD_FULL: -100,
+}
+
+OFF_HAND_PENALTY = -20
+OFF_HAND_WEAPON_PENALTY = -20
+AMBIDEXTROUS_BONUS = 20
+TWO_HANDED_WEAPON_BONUS = 10
+PRONE_SOURCE_PENALTY = -50
+STUNNED_TARGET_BONUS = 20
+SURPRISED_TARGET_BONUS = 25
+PRONE_TARGET_MELEE_BONUS = 30
+PRONE_TARGET_RANGED_PENALTY = -30
+RANGE_IN_MELEE_PENALTY = -20
+SIZE_BONUS_PER_STEP = 5
+
+
+def calculate_roll_modifiers(attack: Attack) -> list[AttackBonusEntry]:
+    """Non-zero roll modifiers of an attack, in the order they are displayed"""
+    modifiers = attack.modifiers
+    roll_modifiers = modifiers.roll_modifiers
+    situational = modifiers.situational_modifiers
+    source_status = situational.source_status
+    target_status = situational.target_status
+    melee = attack.is_melee()
+    # The first entry of a repeated skill wins, as in a linear search
+    skills = {
+        skill.skill_id: skill.bonus for skill in reversed(modifiers.source_skills or [])
+    }
+
+    entries: list[AttackBonusEntry] = []
+    append = entries.append
+
+    def add(key: str, value: int) -> None:
+        if value != 0:
+            append(AttackBonusEntry(key, value))
+
+    def add_with_skill(key: str, value: int, skill_id: str) -> None:
+        # Skills reduce a penalty up to its absolute value
+        if not value:
+            return
+        add(key, value)
+        add(f"{key}-skill-{skill_id}", min(abs(value), skills.get(skill_id, 0)))
+
+    if attack.roll:
+        add("roll", attack.roll.roll)
+    add("bo", roll_modifiers.bo)
+    add("injury-penalty", roll_modifiers.injury_penalty)
+    add("fatigue-penalty", roll_modifiers.fatigue_penalty)
+    if melee:
+        # Only use footwork skill for melee attacks
+        add_with_skill("pace-penalty", roll_modifiers.pace_penalty, "footwork")
+    else:
+        add("pace-penalty", roll_modifiers.pace_penalty)
+    add("range-penalty", roll_modifiers.range_penalty)
+    if not situational.disabled_db:
+        add("bd", -roll_modifiers.bd)
+    if not situational.disabled_shield:
+        add("shield", -roll_modifiers.shield)
+    if not situational.disabled_parry:
+        add("parry", -roll_modifiers.parry)
+    add("custom-bonus", roll_modifiers.custom_bonus)
+    if situational.off_hand:
+        add("off-hand", OFF_HAND_PENALTY)
+    if situational.restricted_quarters:
+        add_with_skill(
+            "restricted-quarters",
+            RESTRICTED_QUARTERS_BONUS.get(situational.restricted_quarters, 0),
+            "restricted-quarters",
+        )
+
+    if "prone" in source_status:
+        add("prone-source", PRONE_SOURCE_PENALTY)
+    if "stunned" in target_status:
+        add("stunned-target", STUNNED_TARGET_BONUS)
+    if "surprised" in target_status:
+        add("surprised-target", SURPRISED_TARGET_BONUS)
+    if "prone" in target_status:
+        add(
+            "prone-target",
+            PRONE_TARGET_MELEE_BONUS if melee else PRONE_TARGET_RANGED_PENALTY,
+        )
+
+    if situational.off_hand:
+        add("off-hand-weapon", OFF_HAND_WEAPON_PENALTY)
+        if "ambidextrous" in source_status:
+            add("ambidextrous", AMBIDEXTROUS_BONUS)
+    if melee and situational.two_handed_weapon:
+        add("two-handed-weapon", TWO_HANDED_WEAPON_BONUS)
+
+    if melee and situational.positional_source:
+        add(
+            "positional-source",
+            POSITIONAL_SOURCE_BONUS.get(situational.positional_source, 0),
+        )
+        add(
+            "positional-source-skill-reverse-strike",
+            skills.get("reverse-strike", 0),
+        )
+    if melee and situational.positional_target:
+        add(
+            "positional-target",
+            POSITIONAL_TARGET_BONUS.get(situational.positional_target, 0),
+        )
+
+    add("cover", COVER_BONUS.get(situational.cover, 0))
+    if not melee and "melee" in source_status:
+        add("range-in-melee", RANGE_IN_MELEE_PENALTY)
+    if situational.size_difference and situational.size_difference < 0:
+        add("size-bonus", situational.size_difference * SIZE_BONUS_PER_STEP)
+
+    return entries
+
+
+# Columns of the vectorized calculation, in the order of calculate_roll_modifiers
+ROLL_MODIFIER_KEYS: tuple[str, ...] = (
+    "roll",
+    "bo",
+    "injury-penalty",
+    "fatigue-penalty",
+    "pace-penalty",
+    "pace-penalty-skill-footwork",
+    "range-penalty",
+    "bd",
+    "shield",
+    "parry",
+    "custom-bonus",
+    "off-hand",
+    "restricted-quarters",
+    "restricted-quarters-skill-restricted-quarters",
+    "prone-source",
+    "stunned-target",
+    "surprised-target",
+    "prone-target",
+    "off-hand-weapon",
+    "ambidextrous",
+    "two-handed-weapon",
+    "positional-source",
+    "positional-source-skill-reverse-strike",
+    "positional-target",
+    "cover",
+    "range-in-melee",
+    "size-bonus",
+)
+
+# Attack fields packed by _pack, one array per field
+_PACKED_FIELDS = (
+    "melee",
+    "roll",
+    "bo",
+    "injury_penalty",
+    "fatigue_penalty",
+    "pace_penalty",
+    "range_penalty",
+    "bd",
+    "shield",
+    "parry",
+    "custom_bonus",
+    "disabled_db",
+    "disabled_shield",
+    "disabled_parry",
+    "off_hand",
+    "two_handed_weapon",
+    "restricted_quarters",
+    "positional_source",
+    "positional_target",
+    "cover",
+    "size_difference",
+    "footwork",
+    "restricted_quarters_skill",
+    "reverse_strike",
+    "source_prone",
+    "source_ambidextrous",
+    "source_melee",
+    "target_stunned",
+    "target_surprised",
+    "target_prone",
+)
+
+
+def _pack(attacks: Sequence[Attack]) -> dict[str, np.ndarray]:
+    """Copy the fields used by the roll modifiers into one int64 array per field"""
+    rows = []
+    for attack in attacks:
+        modifiers = attack.modifiers
+        roll_modifiers = modifiers.roll_modifiers
+        situational = modifiers.situational_modifiers
+        source_status = situational.source_status
+        target_status = situational.target_status
+        skills = {
+            skill.skill_id: skill.bonus
+            for skill in reversed(modifiers.source_skills or [])
+        }
+        rows.append(
+            (
+                attack.is_melee(),
+                attack.roll.roll if attack.roll else 0,
+                roll_modifiers.bo,
+                roll_modifiers.injury_penalty,
+                roll_modifiers.fatigue_penalty,
+                roll_modifiers.pace_penalty,
+                roll_modifiers.range_penalty,
+                roll_modifiers.bd,
+                roll_modifiers.shield,
+                roll_modifiers.parry,
+                roll_modifiers.custom_bonus,
+                situational.disabled_db,
+                situational.disabled_shield,
+                situational.disabled_parry,
+                situational.off_hand,
+                situational.two_handed_weapon,
+                RESTRICTED_QUARTERS_BONUS.get(situational.restricted_quarters, 0),
+                (
+                    POSITIONAL_SOURCE_BONUS.get(situational.positional_source, 0)
+                    if situational.positional_source
+                    else None
+                ),
+                (
+                    POSITIONAL_TARGET_BONUS.get(situational.positional_target, 0)
+                    if situational.positional_target
+                    else None
+                ),
+                COVER_BONUS.get(situational.cover, 0),
+                situational.size_difference or 0,
+                skills.get("footwork", 0),
+                skills.get("restricted-quarters", 0),
+                skills.get("reverse-strike", 0),
+                "prone" in source_status,
+                "ambidextrous" in source_status,
+                "melee" in source_status,
+                "stunned" in target_status,
+                "surprised" in target_status,
+                "prone" in target_status,
+            )
+        )
+    columns = list(zip(*rows)) if rows else [()] * len(_PACKED_FIELDS)
+    packed = {}
+    for field, values in zip(_PACKED_FIELDS, columns):
+        if field in ("positional_source", "positional_target"):
+            # None marks a missing position, which adds no reverse-strike skill
+            packed[f"{field}_set"] = np.array(
+                [value is not None for value in values], dtype=bool
+            )
+            values = [value or 0 for value in values]
+        packed[field] = np.array(values, dtype=np.int64)
+    return packed
+
+
+def roll_modifier_matrix(attacks: Sequence[Attack]) -> np.ndarray:
+    """
+    Roll modifiers of many attacks as an (attacks x ROLL_MODIFIER_KEYS) matrix.
+    Zero cells are the entries calculate_roll_modifiers leaves out.
+    """
+    p = _pack(attacks)
+    melee = p["melee"].astype(bool)
+    off_hand = p["off_hand"].astype(bool)
+
+    def with_skill(value: np.ndarray, skill: np.ndarray) -> np.ndarray:
+        return np.where(value != 0, np.minimum(np.abs(value), skill), 0)
+
+    def where(condition: np.ndarray, value) -> np.ndarray:
+        return np.where(condition, value, 0)
+
+    columns = (
+        p["roll"],
+        p["bo"],
+        p["injury_penalty"],
+        p["fatigue_penalty"],
+        p["pace_penalty"],
+        where(melee, with_skill(p["pace_penalty"], p["footwork"])),
+        p["range_penalty"],
+        where(p["disabled_db"] == 0, -p["bd"]),
+        where(p["disabled_shield"] == 0, -p["shield"]),
+        where(p["disabled_parry"] == 0, -p["parry"]),
+        p["custom_bonus"],
+        where(off_hand, OFF_HAND_PENALTY),
+        p["restricted_quarters"],
+        with_skill(p["restricted_quarters"], p["restricted_quarters_skill"]),
+        where(p["source_prone"] == 1, PRONE_SOURCE_PENALTY),
+        where(p["target_stunned"] == 1, STUNNED_TARGET_BONUS),
+        where(p["target_surprised"] == 1, SURPRISED_TARGET_BONUS),
+        where(
+            p["target_prone"] == 1,
+            np.where(melee, PRONE_TARGET_MELEE_BONUS, PRONE_TARGET_RANGED_PENALTY),
+        ),
+        where(off_hand, OFF_HAND_WEAPON_PENALTY),
+        where(off_hand & (p["source_ambidextrous"] == 1), AMBIDEXTROUS_BONUS),
+        where(melee & (p["two_handed_weapon"] == 1), TWO_HANDED_WEAPON_BONUS),
+        where(melee & p["positional_source_set"], p["positional_source"]),
+        where(melee & p["positional_source_set"], p["reverse_strike"]),
+        where(melee & p["positional_target_set"], p["positional_target"]),
+        p["cover"],
+        where(~melee & (p["source_melee"] == 1), RANGE_IN_MELEE_PENALTY),
+        where(p["size_difference"] < 0, p["size_difference"] * SIZE_BONUS_PER_STEP),
+    )
+    return np.stack(
+        [np.broadcast_to(column, (len(attacks),)) for column in columns], axis=1
+    ).astype(np.int64, copy=False)
+
+
+def roll_modifier_entries(matrix: np.ndarray) -> list[list[AttackBonusEntry]]:
+    """Non-zero cells of a roll modifier matrix as bonus entries per attack"""
+    rows, columns = np.nonzero(matrix)
+    keys = ROLL_MODIFIER_KEYS
+    flat = [
+        AttackBonusEntry(keys[column], value)
+        for column, value in zip(columns.tolist(), matrix[rows, columns].tolist())
+    ]
+    # np.nonzero returns the cells row by row, split them at the row boundaries
+    ends = np.cumsum(np.count_nonzero(matrix, axis=1)).tolist()
+    starts = [0] + ends[:-1]
+    return [flat[start:end] for start, end in zip(starts, ends)]
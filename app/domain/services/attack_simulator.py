@@ -0,0 +1,192 @@
+"""
+Monte Carlo simulation of attack outcomes.
+The modifiers of an attack are calculated once with the AttackCalculator, then
+many d100 rolls are resolved against the attack table row with NumPy, so a GM
+can preview the odds of an attack before rolling it.
+"""
+
+import asyncio
+from typing import Optional
+
+import numpy as np
+
+from app.domain.entities import (
+    Attack,
+    AttackModifiers,
+    AttackSimulation,
+    AttackTableEntry,
+)
+from app.domain.entities.enums import AttackStatus
+from app.domain.services.attack_calculator import AttackCalculator
+from app.application.ports import (
+    AttackTableClient,
+    CalculationExecutor,
+    ATTACK_TABLE_MIN_ROLL,
+    ATTACK_TABLE_MAX_ROLL,
+)
+
+OPEN_ENDED_HIGH = 96
+OPEN_ENDED_LOW = 5
+
+
+def open_ended_rolls(
+    rng: np.random.Generator, samples: int, open_ended: bool = True
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Random d100 rolls, as the natural rolls and the roll totals. Open-ended
+    rolls of 96-100 roll again and add, repeating while the new roll is 96-100,
+    and rolls of 01-05 roll again and subtract the new roll, which is
+    open-ended the same way.
+    """
+    rolls = rng.integers(1, 101, samples, dtype=np.int64)
+    if not open_ended:
+        return rolls, rolls
+
+    def extension(mask: np.ndarray) -> np.ndarray:
+        extra = np.zeros(samples, dtype=np.int64)
+        rolling = np.flatnonzero(mask)
+        while rolling.size:
+            values = rng.integers(1, 101, rolling.size, dtype=np.int64)
+            extra[rolling] += values
+            rolling = rolling[values >= OPEN_ENDED_HIGH]
+        return extra
+
+    return rolls, (
+        rolls + extension(rolls >= OPEN_ENDED_HIGH) - extension(rolls <= OPEN_ENDED_LOW)
+    )
+
+
+def simulate_outcomes(
+    base_total: int,
+    fumble: int,
+    row: list[AttackTableEntry],
+    natural_rolls: np.ndarray,
+    rolls: np.ndarray,
+) -> AttackSimulation:
+    """
+    Outcome distribution of the rolls of an attack whose modifiers other than
+    the roll add up to base_total. Natural rolls up to fumble are fumbles,
+    whatever their open-ended total, and the others read the row entry of
+    their roll total.
+    """
+    samples = len(rolls)
+    if samples == 0:
+        return AttackSimulation(samples=0)
+    severities = sorted(
+        {entry.critical_severity for entry in row if entry and entry.critical_type}
+    )
+    # Per roll lookup arrays, severity code 0 means no critical
+    damages = np.array([entry.damage if entry else 0 for entry in row], dtype=np.int64)
+    severity_codes = np.array(
+        [
+            severities.index(entry.critical_severity) + 1
+            if entry and entry.critical_type
+            else 0
+            for entry in row
+        ],
+        dtype=np.int64,
+    )
+
+    if fumble > 0:
+        fumbles = natural_rolls <= fumble
+    else:
+        fumbles = np.zeros(samples, dtype=bool)
+    roll_totals = base_total + rolls
+    indexes = (
+        np.clip(roll_totals, ATTACK_TABLE_MIN_ROLL, ATTACK_TABLE_MAX_ROLL)
+        - ATTACK_TABLE_MIN_ROLL
+    )
+    resolved = ~fumbles
+    damage = np.where(resolved, damages[indexes], 0)
+    severity = np.where(resolved, severity_codes[indexes], 0)
+    hits = resolved & ((damage > 0) | (severity > 0))
+
+    damage_values, damage_counts = np.unique(damage[resolved], return_counts=True)
+    severity_counts = np.bincount(severity, minlength=len(severities) + 1)
+    return AttackSimulation(
+        samples=samples,
+        hit_rate=float(np.count_nonzero(hits)) / samples,
+        miss_rate=float(np.count_nonzero(resolved & ~hits)) / samples,
+        fumble_rate=float(np.count_nonzero(fumbles)) / samples,
+        critical_rate=float(np.count_nonzero(severity)) / samples,
+        damage_mean=float(damage.mean()),
+        damage={
+            value: count / samples
+            for value, count in zip(damage_values.tolist(), damage_counts.tolist())
+        },
+        critical_severities={
+            letter: count / samples
+            for letter, count in zip(severities, severity_counts[1:].tolist())
+        },
+        roll_total_mean=float(roll_totals[resolved].mean()) if resolved.any() else 0.0,
+    )
+
+
+class AttackSimulator:
+    """Domain service simulating the outcomes of an attack"""
+
+    def __init__(
+        self,
+        attack_calculator: AttackCalculator,
+        attack_table_client: AttackTableClient,
+        calculation_executor: Optional[CalculationExecutor] = None,
+    ):
+        self._attack_calculator = attack_calculator
+        self._attack_table_client = attack_table_client
+        self._calculation_executor = calculation_executor
+
+    async def simulate(
+        self,
+        modifiers: AttackModifiers,
+        samples: int,
+        open_ended: bool = True,
+        seed: Optional[int] = None,
+    ) -> AttackSimulation:
+        """
+        Simulate samples rolls of an attack with the given modifiers. The
+        vectorized resolution runs on the calculation executor, or the default
+        executor without one, so large simulations do not block the event loop.
+        """
+        attack = Attack(
+            id=None,
+            action_id=None,
+            source_id=None,
+            target_id=None,
+            status=AttackStatus.PENDING_ATTACK_ROLL,
+            modifiers=modifiers,
+        )
+        # Every modifier but the roll, which is added per sample
+        self._attack_calculator.initialize_attack_calculations(attack)
+        self._attack_calculator.calculate_attack_roll_modifiers(attack)
+        row = await self._attack_table_client.get_attack_table_row(
+            attack_table=modifiers.attack_table,
+            size=modifiers.attack_size,
+            at=modifiers.at,
+        )
+        args = (
+            attack.calculated.roll_total,
+            modifiers.fumble,
+            row,
+            samples,
+            open_ended,
+            seed,
+        )
+        if self._calculation_executor:
+            return await self._calculation_executor.run_simulation(
+                self._run, *args, samples=samples
+            )
+        return await asyncio.get_running_loop().run_in_executor(None, self._run, *args)
+
+    @staticmethod
+    def _run(
+        base_total: int,
+        fumble: int,
+        row: list[AttackTableEntry],
+        samples: int,
+        open_ended: bool,
+        seed: Optional[int],
+    ) -> AttackSimulation:
+        natural_rolls, rolls = open_ended_rolls(
+            np.random.default_rng(seed), samples, open_ended
+        )
+        return simulate_outcomes(base_total, fumble, row, natural_rolls, rolls)
@@ -0,0 +1,180 @@
+"""
+In-process cache for Attack Table Service lookups.
+This adapter decorates any AttackTableClient with a bounded LRU cache with TTL.
+"""
+
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from app.domain.entities import (
+    AttackTableEntry,
+    CriticalTableEntry,
+    FumbleTableEntry,
+)
+from app.application.ports import (
+    AttackTableClient,
+    ATTACK_TABLE_MIN_ROLL,
+    ATTACK_TABLE_MAX_ROLL,
+)
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class LRUCache:
+    """Bounded LRU cache with per-entry time to live and hit/miss counters"""
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl: Optional[float] = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a value, returning None when missing or expired"""
+        item = self._entries.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        expires_at, value = item
+        if expires_at and expires_at <= self._clock():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        expires_at = self._clock() + self.ttl if self.ttl else 0
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every entry (counters are kept)"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """Cache counters"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxSize": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hitRatio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class CachingAttackTableClient(AttackTableClient):
+    """AttackTableClient decorator that caches attack, critical and fumble lookups"""
+
+    def __init__(
+        self,
+        delegate: AttackTableClient,
+        max_size: int = 10000,
+        ttl: Optional[float] = 3600.0,
+    ):
+        self._delegate = delegate
+        self._cache = LRUCache(max_size=max_size, ttl=ttl)
+
+    @property
+    def delegate(self) -> AttackTableClient:
+        return self._delegate
+
+    async def get_attack_table_entry(
+        self, attack_table: str, size: str, roll: int, at: int
+    ) -> AttackTableEntry:
+        adjusted_roll = min(ATTACK_TABLE_MAX_ROLL, max(roll, ATTACK_TABLE_MIN_ROLL))
+        key = ("attack", attack_table, size, at, adjusted_roll)
+        return await self._get_or_load(
+            key,
+            lambda: self._delegate.get_attack_table_entry(
+                attack_table=attack_table, size=size, roll=adjusted_roll, at=at
+            ),
+        )
+
+    async def get_attack_table_row(
+        self, attack_table: str, size: str, at: int
+    ) -> list[AttackTableEntry]:
+        """Whole rows are cached under their own key, read with the delegate row path"""
+        key = ("attack-row", attack_table, size, at)
+        row = self._cache.get(key)
+        if row is None:
+            logger.debug(f"Attack table cache miss: {key}")
+            row = await self._delegate.get_attack_table_row(
+                attack_table=attack_table, size=size, at=at
+            )
+            self._cache.put(key, row)
+        # Table entries are flat, a shallow copy of each one is not shared
+        return [copy.copy(entry) for entry in row]
+
+    async def get_critical_table_entry(
+        self, critical_type: str, critical_severity: str, roll: int
+    ) -> CriticalTableEntry:
+        key = ("critical", critical_type, critical_severity, roll)
+        return await self._get_or_load(
+            key,
+            lambda: self._delegate.get_critical_table_entry(
+                critical_type=critical_type,
+                critical_severity=critical_severity,
+                roll=roll,
+            ),
+        )
+
+    async def get_fumble_table_entry(
+        self, fumble_table: str, roll: int
+    ) -> FumbleTableEntry:
+        key = ("fumble", fumble_table, roll)
+        return await self._get_or_load(
+            key,
+            lambda: self._delegate.get_fumble_table_entry(
+                fumble_table=fumble_table, roll=roll
+            ),
+        )
+
+    async def _get_or_load(self, key: tuple, loader: Callable) -> Any:
+        entry = self._cache.get(key)
+        if entry is None:
+            logger.debug(f"Attack table cache miss: {key}")
+            entry = await loader()
+            self._cache.put(key, entry)
+        # Entries end up inside mutable Attack entities, never share the cached instance
+        return copy.deepcopy(entry)
+
+    def clear(self) -> None:
+        """Invalidate every cached entry"""
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        """Cache counters"""
+        stats = self._cache.stats()
+        if hasattr(self._delegate, "stats"):
+            stats["delegate"] = self._delegate.stats()
+        return stats
+
+    async def close(self):
+        """Close the decorated client"""
+        if hasattr(self._delegate, "close"):
+            await self._delegate.close()
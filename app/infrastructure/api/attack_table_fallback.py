@@ -0,0 +1,161 @@
+"""
+Persistent fallback for Attack Table Service lookups.
+This adapter keeps the entries received from the service in a persistent store
+and serves them only when the service fails, so an outage does not fail attacks.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Hashable, Optional, Protocol, Tuple
+
+from app.domain.entities import (
+    AttackTableEntry,
+    CriticalTableEntry,
+    FumbleTableEntry,
+)
+from app.application.ports import (
+    AttackTableClient,
+    ATTACK_TABLE_MIN_ROLL,
+    ATTACK_TABLE_MAX_ROLL,
+)
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class TableEntryStore(Protocol):
+    async def get(self, key: Tuple[Hashable, ...]) -> Optional[Tuple[Any, datetime]]:
+        ...
+
+    async def put(self, key: Tuple[Hashable, ...], entry: Any) -> None:
+        ...
+
+
+class FallbackAttackTableClient(AttackTableClient):
+    """
+    AttackTableClient decorator backed by a persistent entry store.
+    Lookups always call the delegate, the store is only read when the delegate
+    fails. Entries received from the delegate are written to the store in
+    background, at most once every refresh_after seconds per entry.
+    """
+
+    def __init__(
+        self,
+        delegate: AttackTableClient,
+        store: TableEntryStore,
+        refresh_after: float = 86400.0,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        self._delegate = delegate
+        self._store = store
+        self._refresh_after = refresh_after
+        self._clock = clock
+        # Last time each entry was written by this process
+        self._written_at: dict[Hashable, datetime] = {}
+        # References to pending store writes, so they are not garbage collected
+        self._writing: set[asyncio.Task] = set()
+        self.fallback_hits = 0
+        self.fallback_misses = 0
+        self.store_errors = 0
+
+    @property
+    def delegate(self) -> AttackTableClient:
+        return self._delegate
+
+    async def get_attack_table_entry(
+        self, attack_table: str, size: str, roll: int, at: int
+    ) -> AttackTableEntry:
+        adjusted_roll = min(ATTACK_TABLE_MAX_ROLL, max(roll, ATTACK_TABLE_MIN_ROLL))
+        return await self._get(
+            ("attack", attack_table, size, at, adjusted_roll),
+            lambda: self._delegate.get_attack_table_entry(
+                attack_table=attack_table, size=size, roll=adjusted_roll, at=at
+            ),
+        )
+
+    async def get_critical_table_entry(
+        self, critical_type: str, critical_severity: str, roll: int
+    ) -> CriticalTableEntry:
+        return await self._get(
+            ("critical", critical_type, critical_severity, roll),
+            lambda: self._delegate.get_critical_table_entry(
+                critical_type=critical_type,
+                critical_severity=critical_severity,
+                roll=roll,
+            ),
+        )
+
+    async def get_fumble_table_entry(
+        self, fumble_table: str, roll: int
+    ) -> FumbleTableEntry:
+        return await self._get(
+            ("fumble", fumble_table, roll),
+            lambda: self._delegate.get_fumble_table_entry(
+                fumble_table=fumble_table, roll=roll
+            ),
+        )
+
+    async def _get(
+        self, key: Tuple[Hashable, ...], loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        try:
+            entry = await loader()
+        except Exception as e:
+            stored = await self._read(key)
+            if stored is None:
+                self.fallback_misses += 1
+                raise
+            entry, updated_at = stored
+            self.fallback_hits += 1
+            logger.warning(
+                f"Error calling attack tables API, serving {key} stored at "
+                f"{updated_at.isoformat()}: {e}"
+            )
+            return entry
+        self._schedule_put(key, entry)
+        return entry
+
+    async def _read(self, key: Tuple[Hashable, ...]) -> Optional[Tuple[Any, datetime]]:
+        try:
+            return await self._store.get(key)
+        except Exception as e:
+            self.store_errors += 1
+            logger.warning(f"Error reading table entry store: {e}")
+            return None
+
+    async def _put(self, key: Tuple[Hashable, ...], entry: Any) -> None:
+        try:
+            await self._store.put(key, entry)
+        except Exception as e:
+            self.store_errors += 1
+            # Written again with the next entry received
+            self._written_at.pop(key, None)
+            logger.warning(f"Error writing table entry store: {e}")
+
+    def _schedule_put(self, key: Tuple[Hashable, ...], entry: Any) -> None:
+        now = self._clock()
+        written_at = self._written_at.get(key)
+        if written_at and (now - written_at).total_seconds() < self._refresh_after:
+            return
+        self._written_at[key] = now
+        task = asyncio.create_task(self._put(key, entry))
+        self._writing.add(task)
+        task.add_done_callback(self._writing.discard)
+
+    def stats(self) -> dict:
+        """Store counters"""
+        stats = {
+            "fallbackHits": self.fallback_hits,
+            "fallbackMisses": self.fallback_misses,
+            "writing": len(self._writing),
+            "storeErrors": self.store_errors,
+        }
+        if hasattr(self._delegate, "stats"):
+            stats["delegate"] = self._delegate.stats()
+        return stats
+
+    async def close(self):
+        """Wait for pending store writes and close the decorated client"""
+        await asyncio.gather(*self._writing, return_exceptions=True)
+        if hasattr(self._delegate, "close"):
+            await self._delegate.close()
@@ -0,0 +1,300 @@
+"""
+Preloaded attack tables.
+This adapter keeps whole attack tables in memory as dense grids so attack table
+lookups become an index operation instead of an HTTP call.
+"""
+
+import asyncio
+import dataclasses
+import time
+from array import array
+from typing import Iterable, Optional, Sequence
+
+from app.domain.entities import (
+    AttackTableEntry,
+    CriticalTableEntry,
+    FumbleTableEntry,
+)
+from app.application.ports import (
+    AttackTableClient,
+    ATTACK_TABLE_MIN_ROLL,
+    ATTACK_TABLE_MAX_ROLL,
+)
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+ROLLS_PER_ROW = ATTACK_TABLE_MAX_ROLL - ATTACK_TABLE_MIN_ROLL + 1
+DEFAULT_AT_VALUES = tuple(range(1, 11))
+
+
+class AttackTableGrid:
+    """
+    Dense AT x roll grid of a single attack table and size.
+    Repeated results are stored once and referenced by a 16 bit index.
+    """
+
+    def __init__(
+        self,
+        attack_table: str,
+        size: str,
+        at_values: Sequence[int],
+        entries: Sequence[AttackTableEntry],
+        index: array,
+    ):
+        if len(index) != len(at_values) * ROLLS_PER_ROW:
+            raise ValueError("Grid index does not match the AT values")
+        self.attack_table = attack_table
+        self.size = size
+        self.at_values = tuple(at_values)
+        self._at_offsets = {at: i * ROLLS_PER_ROW for i, at in enumerate(at_values)}
+        self._entries = tuple(entries)
+        self._index = index
+
+    @classmethod
+    def from_rows(
+        cls,
+        attack_table: str,
+        size: str,
+        rows: dict[int, Sequence[AttackTableEntry]],
+    ) -> "AttackTableGrid":
+        """Build a grid from rows of entries indexed by roll - 1"""
+        at_values = sorted(rows)
+        entries: list[AttackTableEntry] = []
+        entry_ids: dict[tuple, int] = {}
+        index = array("H")
+        for at in at_values:
+            row = rows[at]
+            if len(row) != ROLLS_PER_ROW:
+                raise ValueError(
+                    f"Attack table {attack_table}/{size}/{at} has {len(row)} rolls, "
+                    f"expected {ROLLS_PER_ROW}"
+                )
+            for entry in row:
+                key = dataclasses.astuple(entry)
+                entry_id = entry_ids.get(key)
+                if entry_id is None:
+                    entry_id = len(entries)
+                    entry_ids[key] = entry_id
+                    entries.append(entry)
+                index.append(entry_id)
+        return cls(attack_table, size, at_values, entries, index)
+
+    @property
+    def entries(self) -> tuple[AttackTableEntry, ...]:
+        """Distinct entries of the grid"""
+        return self._entries
+
+    @property
+    def index(self) -> array:
+        """Entry ids of every cell, AT major"""
+        return self._index
+
+    def has_at(self, at: int) -> bool:
+        return at in self._at_offsets
+
+    def get(self, at: int, roll: int) -> AttackTableEntry:
+        """Get the (shared) entry for an AT and roll, clamping the roll"""
+        adjusted_roll = min(ATTACK_TABLE_MAX_ROLL, max(roll, ATTACK_TABLE_MIN_ROLL))
+        offset = self._at_offsets[at] + adjusted_roll - ATTACK_TABLE_MIN_ROLL
+        return self._entries[self._index[offset]]
+
+    def row(self, at: int) -> list[AttackTableEntry]:
+        """Get the (shared) entries for an AT indexed by roll - 1"""
+        offset = self._at_offsets[at]
+        entries = self._entries
+        return [entries[i] for i in self._index[offset : offset + ROLLS_PER_ROW]]
+
+
+class PreloadingAttackTableClient(AttackTableClient):
+    """
+    AttackTableClient decorator serving attack table entries from preloaded grids.
+    Configured tables are loaded by preload(), any other table is loaded in the
+    background the first time it is requested.
+    """
+
+    def __init__(
+        self,
+        delegate: AttackTableClient,
+        tables: Iterable[tuple[str, str]] = (),
+        at_values: Sequence[int] = DEFAULT_AT_VALUES,
+        concurrency: int = 20,
+        lazy: bool = True,
+        retry_interval: float = 60.0,
+    ):
+        self._delegate = delegate
+        self._tables = list(tables)
+        self._at_values = tuple(at_values)
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._lazy = lazy
+        self._retry_interval = retry_interval
+        self._grids: dict[tuple[str, str], AttackTableGrid] = {}
+        self._loading: dict[tuple[str, str], asyncio.Task] = {}
+        self._failed_at: dict[tuple[str, str], float] = {}
+        self.grid_hits = 0
+        self.grid_misses = 0
+
+    @property
+    def delegate(self) -> AttackTableClient:
+        return self._delegate
+
+    async def preload(self) -> None:
+        """Load every configured table"""
+        results = await asyncio.gather(
+            *(self.load_table(table, size) for table, size in self._tables),
+            return_exceptions=True,
+        )
+        for (table, size), result in zip(self._tables, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error preloading attack table {table}/{size}: {result}")
+
+    async def load_table(self, attack_table: str, size: str) -> AttackTableGrid:
+        """Fetch a whole table from the delegate and store it as a grid"""
+        return await self._start_load(attack_table, size)
+
+    def _start_load(self, attack_table: str, size: str) -> asyncio.Task:
+        key = (attack_table, size)
+        task = self._loading.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(attack_table, size))
+            self._loading[key] = task
+        return task
+
+    async def _load(self, attack_table: str, size: str) -> AttackTableGrid:
+        key = (attack_table, size)
+        try:
+            grid = await self._fetch_grid(attack_table, size)
+            self._grids[key] = grid
+            self._failed_at.pop(key, None)
+            return grid
+        except Exception:
+            self._failed_at[key] = time.monotonic()
+            raise
+        finally:
+            self._loading.pop(key, None)
+
+    async def _fetch_grid(self, attack_table: str, size: str) -> AttackTableGrid:
+        logger.info(f"Loading attack table {attack_table}/{size}")
+        rows = await asyncio.gather(
+            *(self._fetch_row(attack_table, size, at) for at in self._at_values)
+        )
+        grid = AttackTableGrid.from_rows(
+            attack_table, size, dict(zip(self._at_values, rows))
+        )
+        logger.info(
+            f"Loaded attack table {attack_table}/{size}: "
+            f"{len(grid.index)} cells, {len(grid.entries)} distinct entries"
+        )
+        return grid
+
+    async def _fetch_row(
+        self, attack_table: str, size: str, at: int
+    ) -> list[AttackTableEntry]:
+        # The tables API only serves single entries, so a row is fetched cell by
+        # cell. Going through get_attack_table_entry of the delegate keeps its
+        # retries, store and coalescing per cell, and the semaphore bounds the
+        # requests of all the rows loading at once.
+        async def fetch(roll: int) -> AttackTableEntry:
+            async with self._semaphore:
+                return await self._delegate.get_attack_table_entry(
+                    attack_table=attack_table, size=size, roll=roll, at=at
+                )
+
+        return list(
+            await asyncio.gather(
+                *(
+                    fetch(roll)
+                    for roll in range(ATTACK_TABLE_MIN_ROLL, ATTACK_TABLE_MAX_ROLL + 1)
+                )
+            )
+        )
+
+    def get_grid(self, attack_table: str, size: str) -> Optional[AttackTableGrid]:
+        return self._grids.get((attack_table, size))
+
+    def _recently_failed(self, attack_table: str, size: str) -> bool:
+        failed_at = self._failed_at.get((attack_table, size))
+        return bool(failed_at) and time.monotonic() - failed_at < self._retry_interval
+
+    def _schedule_load(self, attack_table: str, size: str) -> None:
+        key = (attack_table, size)
+        if not self._lazy or key in self._loading:
+            return
+        if self._recently_failed(attack_table, size):
+            return
+        task = self._start_load(attack_table, size)
+        task.add_done_callback(self._log_load_error)
+
+    @staticmethod
+    def _log_load_error(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Error loading attack table: {task.exception()}")
+
+    async def get_attack_table_entry(
+        self, attack_table: str, size: str, roll: int, at: int
+    ) -> AttackTableEntry:
+        grid = self._grids.get((attack_table, size))
+        if grid is not None and grid.has_at(at):
+            self.grid_hits += 1
+            return dataclasses.replace(grid.get(at, roll))
+        self.grid_misses += 1
+        if grid is None:
+            self._schedule_load(attack_table, size)
+        return await self._delegate.get_attack_table_entry(
+            attack_table=attack_table, size=size, roll=roll, at=at
+        )
+
+    async def get_attack_table_row(
+        self, attack_table: str, size: str, at: int
+    ) -> list[AttackTableEntry]:
+        grid = self._grids.get((attack_table, size))
+        if grid is None and not self._recently_failed(attack_table, size):
+            try:
+                grid = await self.load_table(attack_table, size)
+            except Exception as e:
+                # Rows are then read from the delegate, as entries are
+                logger.error(
+                    f"Error loading attack table {attack_table}/{size}, "
+                    f"reading row at={at} from the delegate: {e}"
+                )
+        if grid is None or not grid.has_at(at):
+            self.grid_misses += 1
+            return await self._delegate.get_attack_table_row(
+                attack_table=attack_table, size=size, at=at
+            )
+        self.grid_hits += 1
+        return [dataclasses.replace(entry) for entry in grid.row(at)]
+
+    async def get_critical_table_entry(
+        self, critical_type: str, critical_severity: str, roll: int
+    ) -> CriticalTableEntry:
+        return await self._delegate.get_critical_table_entry(
+            critical_type=critical_type,
+            critical_severity=critical_severity,
+            roll=roll,
+        )
+
+    async def get_fumble_table_entry(
+        self, fumble_table: str, roll: int
+    ) -> FumbleTableEntry:
+        return await self._delegate.get_fumble_table_entry(
+            fumble_table=fumble_table, roll=roll
+        )
+
+    def stats(self) -> dict:
+        """Preloaded tables and lookup counters"""
+        stats = {
+            "tables": [f"{table}/{size}" for table, size in self._grids],
+            "gridHits": self.grid_hits,
+            "gridMisses": self.grid_misses,
+        }
+        if hasattr(self._delegate, "stats"):
+            stats["delegate"] = self._delegate.stats()
+        return stats
+
+    async def close(self):
+        """Close the decorated client"""
+        for task in list(self._loading.values()):
+            task.cancel()
+        if hasattr(self._delegate, "close"):
+            await self._delegate.close()
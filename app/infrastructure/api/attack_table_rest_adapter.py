@@ -4,6 +4,7 @@ This adapter implements the AttackTableService port by making HTTP calls to an e
 """
 
 import asyncio
+import importlib.util
 from typing import Optional
 import httpx
 
@@ -13,22 +14,76 @@ from app.domain.entities import (
     CriticalEffect,
     FumbleTableEntry,
 )
-from app.application.ports import AttackTableClient
+from app.application.ports import (
+    AttackTableClient,
+    ATTACK_TABLE_MIN_ROLL,
+    ATTACK_TABLE_MAX_ROLL,
+)
 from app.infrastructure.logging import get_logger
+from .single_flight import SingleFlight
 
 logger = get_logger(__name__)
 
+RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+
+class AttackTableApiException(Exception):
+    """
+    Error calling the attack table API. retryable is True for errors that may not
+    happen again: transport errors, timeouts, throttling and 5xx responses.
+    """
+
+    def __init__(
+        self, message: str, status_code: Optional[int] = None, retryable: bool = False
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retryable = retryable
+
+    @classmethod
+    def from_error(cls, error: Exception) -> "AttackTableApiException":
+        message = f"Unexpected error accessing attack table API: {str(error)}"
+        if isinstance(error, httpx.HTTPStatusError):
+            status_code = error.response.status_code
+            return cls(
+                message,
+                status_code=status_code,
+                retryable=status_code in RETRYABLE_STATUS_CODES,
+            )
+        return cls(message, retryable=isinstance(error, httpx.TransportError))
+
 
 class AttackTableRestAdapter(AttackTableClient):
     """REST adapter for Attack Table Service"""
 
     def __init__(
-        self, base_url: str, timeout: float = 30.0, api_key: Optional[str] = None
+        self,
+        base_url: str,
+        timeout: float = 30.0,
+        api_key: Optional[str] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
     ):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.api_key = api_key
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and self._http2_available()
         self._client: Optional[httpx.AsyncClient] = None
+        self._single_flight = SingleFlight()
+
+    @staticmethod
+    def _http2_available() -> bool:
+        if importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but h2 is not installed, using HTTP/1.1")
+            return False
+        return True
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None:
@@ -36,18 +91,59 @@ class AttackTableRestAdapter(AttackTableClient):
             if self.api_key:
                 headers["Authorization"] = f"Bearer {self.api_key}"
             self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self.timeout), headers=headers
+                timeout=httpx.Timeout(self.timeout),
+                headers=headers,
+                limits=self.limits,
+                http2=self.http2,
             )
         return self._client
 
+    async def start(self, warm_up_connections: int = 1) -> int:
+        """
+        Create the HTTP client and open up to warm_up_connections connections to the
+        attack tables API, so the first attack does not pay the connection setup.
+        Returns the number of successful warm-up requests. Failures are only logged,
+        the API may be started after this service.
+        """
+        client = await self._get_client()
+        # A single HTTP/2 connection multiplexes every request
+        count = (
+            1
+            if self.http2
+            else min(warm_up_connections, self.limits.max_keepalive_connections or 1)
+        )
+        if count <= 0:
+            return 0
+        results = await asyncio.gather(
+            *(client.head(self.base_url) for _ in range(count)),
+            return_exceptions=True,
+        )
+        warmed = sum(1 for result in results if not isinstance(result, Exception))
+        if warmed < count:
+            logger.warning(
+                f"Attack table API warm-up: {warmed}/{count} connections opened"
+            )
+        else:
+            logger.info(f"Attack table API warm-up: {warmed} connections opened")
+        return warmed
+
     async def get_attack_table_entry(
         self, attack_table: str, size: str, roll: int, at: int
     ) -> AttackTableEntry:
+        adjusted_roll = min(ATTACK_TABLE_MAX_ROLL, max(roll, ATTACK_TABLE_MIN_ROLL))
+        return await self._single_flight.do(
+            ("attack", attack_table, size, at, adjusted_roll),
+            lambda: self._fetch_attack_table_entry(
+                attack_table, size, adjusted_roll, at
+            ),
+        )
 
-        logger.info(f"Fetching attack table entry for roll={roll}, at={at}")
+    async def _fetch_attack_table_entry(
+        self, attack_table: str, size: str, adjusted_roll: int, at: int
+    ) -> AttackTableEntry:
+        logger.info(f"Fetching attack table entry for roll={adjusted_roll}, at={at}")
         try:
             client = await self._get_client()
-            adjusted_roll = min(175, max(roll, 1))
             url = f"{self.base_url}/attack-tables/{attack_table}/{size}/{at}/{adjusted_roll}"
             logger.debug(f"Making request to {url}")
             response = await client.get(url)
@@ -64,7 +160,7 @@ class AttackTableRestAdapter(AttackTableClient):
             return entry
         except Exception as e:
             logger.error(f"Unexpected error calling attack table API: {str(e)}")
-            raise Exception(f"Unexpected error accessing attack table API: {str(e)}")
+            raise AttackTableApiException.from_error(e)
 
     async def get_critical_table_entry(
         self, critical_type: str, critical_severity: str, roll: int
@@ -72,7 +168,16 @@ class AttackTableRestAdapter(AttackTableClient):
         """
         Get attack table entry by critical type, critical severity, roll and AT.
         """
+        return await self._single_flight.do(
+            ("critical", critical_type, critical_severity, roll),
+            lambda: self._fetch_critical_table_entry(
+                critical_type, critical_severity, roll
+            ),
+        )
 
+    async def _fetch_critical_table_entry(
+        self, critical_type: str, critical_severity: str, roll: int
+    ) -> CriticalTableEntry:
         logger.info(
             f"Fetching critical {critical_type}-{critical_severity} for roll={roll}"
         )
@@ -107,7 +212,7 @@ class AttackTableRestAdapter(AttackTableClient):
             )
         except Exception as e:
             logger.error(f"Unexpected error calling attack table API: {str(e)}")
-            raise Exception(f"Unexpected error accessing attack table API: {str(e)}")
+            raise AttackTableApiException.from_error(e)
 
     async def get_fumble_table_entry(
         self, fumble_table: str, roll: int
@@ -115,7 +220,14 @@ class AttackTableRestAdapter(AttackTableClient):
         """
         Get fumble table entry by fumble type, fumble severity, roll.
         """
+        return await self._single_flight.do(
+            ("fumble", fumble_table, roll),
+            lambda: self._fetch_fumble_table_entry(fumble_table, roll),
+        )
 
+    async def _fetch_fumble_table_entry(
+        self, fumble_table: str, roll: int
+    ) -> FumbleTableEntry:
         logger.info(f"Fetching fumble {fumble_table} for roll={roll}")
         try:
             client = await self._get_client()
@@ -146,7 +258,11 @@ class AttackTableRestAdapter(AttackTableClient):
             )
         except Exception as e:
             logger.error(f"Unexpected error calling attack table API: {str(e)}")
-            raise Exception(f"Unexpected error accessing attack table API: {str(e)}")
+            raise AttackTableApiException.from_error(e)
+
+    def stats(self) -> dict:
+        """Request counters"""
+        return self._single_flight.stats()
 
     async def close(self):
         """Close HTTP client connection"""
@@ -161,49 +277,3 @@ class AttackTableRestAdapter(AttackTableClient):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
         await self.close()
-
-
-class AttackTableRestAdapterWithRetry(AttackTableRestAdapter):
-    """REST adapter with retry mechanism"""
-
-    def __init__(
-        self,
-        base_url: str,
-        timeout: float = 30.0,
-        api_key: Optional[str] = None,
-        max_retries: int = 3,
-        retry_delay: float = 1.0,
-    ):
-        super().__init__(base_url, timeout, api_key)
-        self.max_retries = max_retries
-        self.retry_delay = retry_delay
-
-    async def get_attack_table_entry(
-        self, attack_table: str, size: str, roll: int, at: int
-    ) -> Optional[AttackTableEntry]:
-        """
-        Get attack table entry with retry mechanism
-        """
-        last_exception = None
-
-        for attempt in range(self.max_retries + 1):
-            try:
-                if attempt > 0:
-                    logger.info(f"Retry attempt {attempt} for roll={roll}, at={at}")
-                    await asyncio.sleep(self.retry_delay * attempt)
-
-                return await super().get_attack_table_entry(
-                    attack_table=attack_table, size=size, roll=roll, at=at
-                )
-
-            except Exception as e:
-                last_exception = e
-                if attempt < self.max_retries:
-                    logger.warning(f"Attempt {attempt + 1} failed, retrying: {str(e)}")
-                else:
-                    logger.error(
-                        f"All {self.max_retries + 1} attempts failed for roll={roll}, at={at}"
-                    )
-
-        # If all retries failed, raise the last exception
-        raise last_exception
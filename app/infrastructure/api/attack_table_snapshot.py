@@ -0,0 +1,514 @@
+"""
+Local snapshots of the Attack Table Service.
+
+A snapshot is a single binary file holding attack, critical and fumble tables:
+
+    magic (8 bytes) | header length (uint32) | header (JSON)
+    entry offsets (uint32 offset, uint32 length per entry)
+    entry payloads (JSON)
+    index arrays (uint16 entry id per roll)
+
+The file is memory-mapped, so several worker processes reading the same snapshot
+share a single copy through the OS page cache. Rows are decoded on first use and
+kept in a small per-process LRU, so a worker only decodes the rows it reads.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Any, Optional, Sequence
+
+from app.domain.entities import (
+    AttackTableEntry,
+    CriticalEffect,
+    CriticalTableEntry,
+    FumbleTableEntry,
+)
+from app.application.ports import (
+    AttackTableClient,
+    ATTACK_TABLE_MIN_ROLL,
+    ATTACK_TABLE_MAX_ROLL,
+)
+from app.infrastructure.logging import get_logger
+from .attack_table_cache import LRUCache
+
+logger = get_logger(__name__)
+
+SNAPSHOT_MAGIC = b"RMUTBLS1"
+SNAPSHOT_VERSION = 1
+ROLLS_PER_ROW = ATTACK_TABLE_MAX_ROLL - ATTACK_TABLE_MIN_ROLL + 1
+
+_HEADER_LENGTH = struct.Struct("<I")
+_ENTRY_OFFSET = struct.Struct("<II")
+_ENTRY_ID = struct.Struct("<H")
+
+
+class TableSnapshotException(Exception):
+    """Exception raised when a snapshot is invalid or does not contain an entry"""
+
+    pass
+
+
+def effects_to_list(effects: Optional[list[CriticalEffect]]) -> Optional[list]:
+    if effects is None:
+        return None
+    return [
+        {
+            "status": effect.status,
+            "rounds": effect.rounds,
+            "value": effect.value,
+            "delay": effect.delay,
+            "condition": effect.condition,
+        }
+        for effect in effects
+    ]
+
+
+def effects_from_list(effects: Optional[list]) -> Optional[list[CriticalEffect]]:
+    if effects is None:
+        return None
+    return [
+        CriticalEffect(
+            status=effect.get("status"),
+            rounds=effect.get("rounds", None),
+            value=effect.get("value", None),
+            delay=effect.get("delay", None),
+            condition=effect.get("condition", None),
+        )
+        for effect in effects
+    ]
+
+
+def table_entry_to_dict(entry: Any) -> dict:
+    """Convert an attack, critical or fumble table entry to a plain dict"""
+    if isinstance(entry, AttackTableEntry):
+        return {
+            "kind": "attack",
+            "text": entry.text,
+            "damage": entry.damage,
+            "criticalType": entry.critical_type,
+            "criticalSeverity": entry.critical_severity,
+        }
+    if isinstance(entry, CriticalTableEntry):
+        return {
+            "kind": "critical",
+            "text": entry.text,
+            "damage": entry.damage,
+            "location": entry.location,
+            "effects": effects_to_list(entry.effects),
+        }
+    if isinstance(entry, FumbleTableEntry):
+        return {
+            "kind": "fumble",
+            "text": entry.text,
+            "status": entry.status,
+            "additionalDamageText": entry.additional_damage_text,
+            "effects": effects_to_list(entry.effects),
+        }
+    raise TypeError(f"Unsupported table entry: {type(entry).__name__}")
+
+
+def table_entry_from_dict(data: dict) -> Any:
+    """Convert a dict created by table_entry_to_dict back to a table entry"""
+    kind = data.get("kind")
+    if kind == "attack":
+        return AttackTableEntry(
+            text=data.get("text", ""),
+            damage=data.get("damage", 0),
+            critical_type=data.get("criticalType", None),
+            critical_severity=data.get("criticalSeverity", None),
+        )
+    if kind == "critical":
+        return CriticalTableEntry(
+            text=data.get("text", ""),
+            damage=data.get("damage", 0),
+            location=data.get("location", ""),
+            effects=effects_from_list(data.get("effects")),
+        )
+    if kind == "fumble":
+        return FumbleTableEntry(
+            text=data.get("text", ""),
+            status=data.get("status", None),
+            additional_damage_text=data.get("additionalDamageText", None),
+            effects=effects_from_list(data.get("effects")),
+        )
+    raise TypeError(f"Unsupported table entry kind: {kind}")
+
+
+class TableSnapshotWriter:
+    """Collects table rows and writes them as a snapshot file"""
+
+    def __init__(self):
+        self._payloads: list[bytes] = []
+        self._payload_ids: dict[bytes, int] = {}
+        self._attack_tables: list[tuple[dict, array]] = []
+        self._critical_tables: list[tuple[dict, array]] = []
+        self._fumble_tables: list[tuple[dict, array]] = []
+
+    def _entry_id(self, entry: Any) -> int:
+        payload = json.dumps(
+            table_entry_to_dict(entry), separators=(",", ":"), sort_keys=True
+        ).encode("utf-8")
+        entry_id = self._payload_ids.get(payload)
+        if entry_id is None:
+            entry_id = len(self._payloads)
+            if entry_id > 0xFFFF:
+                raise TableSnapshotException("Too many distinct entries")
+            self._payload_ids[payload] = entry_id
+            self._payloads.append(payload)
+        return entry_id
+
+    def _index(self, entries: Sequence[Any]) -> array:
+        return array("H", (self._entry_id(entry) for entry in entries))
+
+    def add_attack_table(
+        self, attack_table: str, size: str, rows: dict[int, Sequence[AttackTableEntry]]
+    ) -> None:
+        """Add an attack table, rows are indexed by roll - 1"""
+        at_values = sorted(rows)
+        index = array("H")
+        for at in at_values:
+            if len(rows[at]) != ROLLS_PER_ROW:
+                raise TableSnapshotException(
+                    f"Attack table {attack_table}/{size}/{at} must have "
+                    f"{ROLLS_PER_ROW} rolls"
+                )
+            index.extend(self._index(rows[at]))
+        self._attack_tables.append(
+            ({"table": attack_table, "size": size, "ats": at_values}, index)
+        )
+
+    def add_critical_table(
+        self,
+        critical_type: str,
+        critical_severity: str,
+        entries: Sequence[CriticalTableEntry],
+    ) -> None:
+        """Add a critical table, entries are indexed by roll - 1"""
+        self._critical_tables.append(
+            (
+                {
+                    "type": critical_type,
+                    "severity": critical_severity,
+                    "rolls": len(entries),
+                },
+                self._index(entries),
+            )
+        )
+
+    def add_fumble_table(
+        self, fumble_table: str, entries: Sequence[FumbleTableEntry]
+    ) -> None:
+        """Add a fumble table, entries are indexed by roll - 1"""
+        self._fumble_tables.append(
+            ({"table": fumble_table, "rolls": len(entries)}, self._index(entries))
+        )
+
+    def write(self, path: str) -> None:
+        """Write the snapshot atomically"""
+        sections = (
+            ("attackTables", self._attack_tables),
+            ("criticalTables", self._critical_tables),
+            ("fumbleTables", self._fumble_tables),
+        )
+        # Offsets are relative to the data section, the reader adds its start
+        header: dict[str, Any] = {
+            "version": SNAPSHOT_VERSION,
+            "entries": {"offset": 0, "count": len(self._payloads)},
+        }
+        offset = _ENTRY_OFFSET.size * len(self._payloads)
+        entry_offsets = array("I")
+        for payload in self._payloads:
+            entry_offsets.extend((offset, len(payload)))
+            offset += len(payload)
+        if offset % 2:
+            offset += 1
+        for name, tables in sections:
+            header[name] = []
+            for metadata, index in tables:
+                header[name].append({**metadata, "index": offset})
+                offset += index.itemsize * len(index)
+
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(SNAPSHOT_MAGIC)
+            file.write(_HEADER_LENGTH.pack(len(header_bytes)))
+            file.write(header_bytes)
+            file.write(_to_little_endian(entry_offsets).tobytes())
+            payload_size = 0
+            for payload in self._payloads:
+                file.write(payload)
+                payload_size += len(payload)
+            if payload_size % 2:
+                file.write(b"\0")
+            for _, tables in sections:
+                for _, index in tables:
+                    file.write(_to_little_endian(index).tobytes())
+        os.replace(tmp_path, path)
+        logger.info(
+            f"Written table snapshot {path}: {len(self._payloads)} distinct entries"
+        )
+
+
+def _to_little_endian(values: array) -> array:
+    if sys.byteorder == "little":
+        return values
+    swapped = array(values.typecode, values)
+    swapped.byteswap()
+    return swapped
+
+
+class TableSnapshot:
+    """Read-only memory-mapped view of a snapshot file"""
+
+    def __init__(self, path: str, row_cache_size: int = 256):
+        self.path = path
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[: len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            self._mmap.close()
+            raise TableSnapshotException(f"{path} is not a table snapshot")
+        (header_length,) = _HEADER_LENGTH.unpack_from(self._mmap, len(SNAPSHOT_MAGIC))
+        header_start = len(SNAPSHOT_MAGIC) + _HEADER_LENGTH.size
+        header = json.loads(self._mmap[header_start : header_start + header_length])
+        if header.get("version") != SNAPSHOT_VERSION:
+            self._mmap.close()
+            raise TableSnapshotException(
+                f"Unsupported snapshot version: {header.get('version')}"
+            )
+        self._data_start = header_start + header_length
+        self._rows = LRUCache(max_size=row_cache_size, ttl=None)
+        self._attack_tables = {
+            (table["table"], table["size"]): (
+                {at: i * ROLLS_PER_ROW for i, at in enumerate(table["ats"])},
+                self._data_start + table["index"],
+            )
+            for table in header.get("attackTables", [])
+        }
+        self._critical_tables = {
+            (table["type"], table["severity"]): (
+                table["rolls"],
+                self._data_start + table["index"],
+            )
+            for table in header.get("criticalTables", [])
+        }
+        self._fumble_tables = {
+            table["table"]: (table["rolls"], self._data_start + table["index"])
+            for table in header.get("fumbleTables", [])
+        }
+
+    @property
+    def attack_tables(self) -> list[tuple[str, str]]:
+        return list(self._attack_tables)
+
+    @property
+    def critical_tables(self) -> list[tuple[str, str]]:
+        return list(self._critical_tables)
+
+    @property
+    def fumble_tables(self) -> list[str]:
+        return list(self._fumble_tables)
+
+    def _entry(self, entry_id: int) -> Any:
+        offset, length = _ENTRY_OFFSET.unpack_from(
+            self._mmap, self._data_start + entry_id * _ENTRY_OFFSET.size
+        )
+        start = self._data_start + offset
+        return table_entry_from_dict(json.loads(self._mmap[start : start + length]))
+
+    def _row(self, index_offset: int, start: int, length: int) -> list[Any]:
+        key = (index_offset, start)
+        row = self._rows.get(key)
+        if row is None:
+            entry_ids = struct.unpack_from(
+                f"<{length}H", self._mmap, index_offset + start * _ENTRY_ID.size
+            )
+            # Rows repeat entries, decode each distinct one once
+            entries: dict[int, Any] = {}
+            row = []
+            for entry_id in entry_ids:
+                entry = entries.get(entry_id)
+                if entry is None:
+                    entry = entries[entry_id] = self._entry(entry_id)
+                row.append(entry)
+            self._rows.put(key, row)
+        return row
+
+    def has_attack_table(self, attack_table: str, size: str, at: int) -> bool:
+        table = self._attack_tables.get((attack_table, size))
+        return table is not None and at in table[0]
+
+    def get_attack_table_entry(
+        self, attack_table: str, size: str, roll: int, at: int
+    ) -> Optional[AttackTableEntry]:
+        """Get the (shared) attack table entry, None when not in the snapshot"""
+        table = self._attack_tables.get((attack_table, size))
+        if table is None or at not in table[0]:
+            return None
+        at_offsets, index_offset = table
+        adjusted_roll = min(ATTACK_TABLE_MAX_ROLL, max(roll, ATTACK_TABLE_MIN_ROLL))
+        row = self._row(index_offset, at_offsets[at], ROLLS_PER_ROW)
+        return row[adjusted_roll - ATTACK_TABLE_MIN_ROLL]
+
+    def get_attack_table_row(
+        self, attack_table: str, size: str, at: int
+    ) -> Optional[list[AttackTableEntry]]:
+        """Get the (shared) attack table entries indexed by roll - 1"""
+        table = self._attack_tables.get((attack_table, size))
+        if table is None or at not in table[0]:
+            return None
+        at_offsets, index_offset = table
+        return self._row(index_offset, at_offsets[at], ROLLS_PER_ROW)
+
+    def get_critical_table_entry(
+        self, critical_type: str, critical_severity: str, roll: int
+    ) -> Optional[CriticalTableEntry]:
+        """Get the (shared) critical table entry, None when not in the snapshot"""
+        table = self._critical_tables.get((critical_type, critical_severity))
+        if table is None or not 1 <= roll <= table[0]:
+            return None
+        return self._row(table[1], 0, table[0])[roll - 1]
+
+    def get_fumble_table_entry(
+        self, fumble_table: str, roll: int
+    ) -> Optional[FumbleTableEntry]:
+        """Get the (shared) fumble table entry, None when not in the snapshot"""
+        table = self._fumble_tables.get(fumble_table)
+        if table is None or not 1 <= roll <= table[0]:
+            return None
+        return self._row(table[1], 0, table[0])[roll - 1]
+
+    def stats(self) -> dict:
+        """Decoded row cache counters"""
+        return self._rows.stats()
+
+    def close(self) -> None:
+        self._rows.clear()
+        self._mmap.close()
+
+
+class SnapshotAttackTableClient(AttackTableClient):
+    """
+    AttackTableClient serving tables from a local snapshot file.
+    Lookups missing from the snapshot go to the fallback client when provided.
+    """
+
+    def __init__(
+        self,
+        snapshot: TableSnapshot,
+        fallback: Optional[AttackTableClient] = None,
+    ):
+        self._snapshot = snapshot
+        self._fallback = fallback
+        self.snapshot_hits = 0
+        self.snapshot_misses = 0
+
+    @classmethod
+    def from_file(
+        cls, path: str, fallback: Optional[AttackTableClient] = None
+    ) -> "SnapshotAttackTableClient":
+        snapshot = TableSnapshot(path)
+        logger.info(
+            f"Opened table snapshot {path}: "
+            f"{len(snapshot.attack_tables)} attack tables, "
+            f"{len(snapshot.critical_tables)} critical tables, "
+            f"{len(snapshot.fumble_tables)} fumble tables"
+        )
+        return cls(snapshot, fallback)
+
+    @property
+    def snapshot(self) -> TableSnapshot:
+        return self._snapshot
+
+    def _miss(self, description: str) -> AttackTableClient:
+        self.snapshot_misses += 1
+        if self._fallback is None:
+            raise TableSnapshotException(f"{description} not found in table snapshot")
+        return self._fallback
+
+    async def get_attack_table_entry(
+        self, attack_table: str, size: str, roll: int, at: int
+    ) -> AttackTableEntry:
+        entry = self._snapshot.get_attack_table_entry(attack_table, size, roll, at)
+        if entry is None:
+            return await self._miss(
+                f"Attack table {attack_table}/{size}/{at}"
+            ).get_attack_table_entry(
+                attack_table=attack_table, size=size, roll=roll, at=at
+            )
+        self.snapshot_hits += 1
+        return AttackTableEntry(
+            text=entry.text,
+            damage=entry.damage,
+            critical_type=entry.critical_type,
+            critical_severity=entry.critical_severity,
+        )
+
+    async def get_attack_table_row(
+        self, attack_table: str, size: str, at: int
+    ) -> list[AttackTableEntry]:
+        row = self._snapshot.get_attack_table_row(attack_table, size, at)
+        if row is None:
+            return await self._miss(
+                f"Attack table {attack_table}/{size}/{at}"
+            ).get_attack_table_row(attack_table=attack_table, size=size, at=at)
+        self.snapshot_hits += 1
+        return [
+            AttackTableEntry(
+                text=entry.text,
+                damage=entry.damage,
+                critical_type=entry.critical_type,
+                critical_severity=entry.critical_severity,
+            )
+            for entry in row
+        ]
+
+    async def get_critical_table_entry(
+        self, critical_type: str, critical_severity: str, roll: int
+    ) -> CriticalTableEntry:
+        entry = self._snapshot.get_critical_table_entry(
+            critical_type, critical_severity, roll
+        )
+        if entry is None:
+            return await self._miss(
+                f"Critical {critical_type}-{critical_severity} roll {roll}"
+            ).get_critical_table_entry(
+                critical_type=critical_type,
+                critical_severity=critical_severity,
+                roll=roll,
+            )
+        self.snapshot_hits += 1
+        return table_entry_from_dict(table_entry_to_dict(entry))
+
+    async def get_fumble_table_entry(
+        self, fumble_table: str, roll: int
+    ) -> FumbleTableEntry:
+        entry = self._snapshot.get_fumble_table_entry(fumble_table, roll)
+        if entry is None:
+            return await self._miss(
+                f"Fumble {fumble_table} roll {roll}"
+            ).get_fumble_table_entry(fumble_table=fumble_table, roll=roll)
+        self.snapshot_hits += 1
+        return table_entry_from_dict(table_entry_to_dict(entry))
+
+    def stats(self) -> dict:
+        """Snapshot lookup counters"""
+        stats = {
+            "snapshot": self._snapshot.path,
+            "snapshotHits": self.snapshot_hits,
+            "snapshotMisses": self.snapshot_misses,
+            "rowCache": self._snapshot.stats(),
+        }
+        if self._fallback is not None and hasattr(self._fallback, "stats"):
+            stats["fallback"] = self._fallback.stats()
+        return stats
+
+    async def close(self):
+        """Close the snapshot and the fallback client"""
+        self._snapshot.close()
+        if self._fallback is not None and hasattr(self._fallback, "close"):
+            await self._fallback.close()
@@ -0,0 +1,156 @@
+"""
+Command line tool exporting Attack Table Service tables to a local snapshot file.
+
+Usage:
+    python -m app.infrastructure.api.export_table_snapshot \\
+        --output tables.snapshot \\
+        --attack-table arming-sword:medium --attack-table short-bow:medium \\
+        --critical-type S --critical-type P \\
+        --fumble-table melee
+"""
+
+import argparse
+import asyncio
+from typing import Sequence
+
+from app.application.ports import AttackTableClient
+from app.infrastructure.api.attack_table_preload import PreloadingAttackTableClient
+from app.infrastructure.api.attack_table_rest_adapter import AttackTableRestAdapter
+from app.infrastructure.api.attack_table_snapshot import TableSnapshotWriter
+from app.infrastructure.config.attack_table_config import AttackTableApiConfig
+from app.infrastructure.logging import get_logger, setup_logging
+
+logger = get_logger(__name__)
+
+DEFAULT_CRITICAL_SEVERITIES = ("A", "B", "C", "D", "E")
+CRITICAL_ROLLS = 100
+FUMBLE_ROLLS = 100
+
+
+async def export_snapshot(
+    client: AttackTableClient,
+    output: str,
+    attack_tables: Sequence[tuple[str, str]] = (),
+    at_values: Sequence[int] = tuple(range(1, 11)),
+    critical_types: Sequence[str] = (),
+    critical_severities: Sequence[str] = DEFAULT_CRITICAL_SEVERITIES,
+    fumble_tables: Sequence[str] = (),
+    concurrency: int = 20,
+) -> None:
+    """Fetch the requested tables through the client and write a snapshot"""
+    semaphore = asyncio.Semaphore(concurrency)
+    writer = TableSnapshotWriter()
+
+    loader = PreloadingAttackTableClient(
+        delegate=client, at_values=at_values, concurrency=concurrency, lazy=False
+    )
+    for attack_table, size in attack_tables:
+        grid = await loader.load_table(attack_table, size)
+        writer.add_attack_table(
+            attack_table, size, {at: grid.row(at) for at in grid.at_values}
+        )
+
+    async def fetch_critical(critical_type: str, severity: str, roll: int):
+        async with semaphore:
+            return await client.get_critical_table_entry(
+                critical_type=critical_type, critical_severity=severity, roll=roll
+            )
+
+    for critical_type in critical_types:
+        for severity in critical_severities:
+            logger.info(f"Exporting critical table {critical_type}-{severity}")
+            entries = await asyncio.gather(
+                *(
+                    fetch_critical(critical_type, severity, roll)
+                    for roll in range(1, CRITICAL_ROLLS + 1)
+                )
+            )
+            writer.add_critical_table(critical_type, severity, entries)
+
+    async def fetch_fumble(fumble_table: str, roll: int):
+        async with semaphore:
+            return await client.get_fumble_table_entry(
+                fumble_table=fumble_table, roll=roll
+            )
+
+    for fumble_table in fumble_tables:
+        logger.info(f"Exporting fumble table {fumble_table}")
+        entries = await asyncio.gather(
+            *(fetch_fumble(fumble_table, roll) for roll in range(1, FUMBLE_ROLLS + 1))
+        )
+        writer.add_fumble_table(fumble_table, entries)
+
+    writer.write(output)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Export attack, critical and fumble tables to a snapshot file"
+    )
+    parser.add_argument("--output", required=True, help="Snapshot file to write")
+    parser.add_argument(
+        "--url",
+        default=None,
+        help="Attack tables API base URL (default: RMU_API_ATTACK_TABLES_URL)",
+    )
+    parser.add_argument(
+        "--attack-table",
+        action="append",
+        default=[],
+        help="Attack table as table:size, can be repeated",
+    )
+    parser.add_argument(
+        "--max-at", type=int, default=10, help="Highest AT value exported"
+    )
+    parser.add_argument(
+        "--critical-type",
+        action="append",
+        default=[],
+        help="Critical type, can be repeated",
+    )
+    parser.add_argument(
+        "--critical-severity",
+        action="append",
+        default=None,
+        help="Critical severity, can be repeated (default: A to E)",
+    )
+    parser.add_argument(
+        "--fumble-table",
+        action="append",
+        default=[],
+        help="Fumble table, can be repeated",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=20, help="Concurrent API requests"
+    )
+    return parser.parse_args(argv)
+
+
+async def run(args: argparse.Namespace) -> None:
+    config = AttackTableApiConfig.from_env()
+    async with AttackTableRestAdapter(
+        base_url=args.url or config.base_url,
+        timeout=config.timeout,
+        api_key=config.api_key,
+    ) as client:
+        await export_snapshot(
+            client=client,
+            output=args.output,
+            attack_tables=AttackTableApiConfig.parse_tables(
+                ",".join(args.attack_table)
+            ),
+            at_values=range(1, args.max_at + 1),
+            critical_types=args.critical_type,
+            critical_severities=args.critical_severity or DEFAULT_CRITICAL_SEVERITIES,
+            fumble_tables=args.fumble_table,
+            concurrency=args.concurrency,
+        )
+
+
+def main(argv=None) -> None:
+    setup_logging(log_level="INFO", enable_console=True, enable_file=False)
+    asyncio.run(run(parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""
+Resilience layer for Attack Table Service calls.
+Retries retryable failures with exponential backoff and full jitter inside a
+per-call deadline, and stops calling a failing service with a circuit breaker.
+
+Errors are retried when they have a true `retryable` attribute, timeouts of a
+single attempt are always retryable.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from app.domain.entities import (
+    AttackTableEntry,
+    CriticalTableEntry,
+    FumbleTableEntry,
+)
+from app.application.ports import AttackTableClient
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class ResilienceException(Exception):
+    """Call rejected or abandoned by the resilience layer"""
+
+    retryable = False
+
+
+class CircuitOpenException(ResilienceException):
+    """Raised without calling the service while the circuit breaker is open"""
+
+
+class DeadlineExceededException(ResilienceException):
+    """Raised when a call and its retries did not complete within the deadline"""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter, bounded by a deadline per call"""
+
+    max_retries: int = 3
+    base_delay: float = 0.1
+    max_delay: float = 2.0
+    # Total seconds for a call including every retry, None for no deadline
+    deadline: Optional[float] = 10.0
+
+    def backoff(self, attempt: int, rand: Callable[[], float] = random.random) -> float:
+        """Delay before retry number attempt (starting at 0)"""
+        return rand() * min(self.max_delay, self.base_delay * 2**attempt)
+
+
+class CircuitBreaker:
+    """
+    Opens after failure_threshold consecutive failures. While open, calls fail fast.
+    After reset_timeout seconds a single probe call is let through: its success
+    closes the breaker, its failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold must be a positive integer")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and self._clock() - self._opened_at >= self.reset_timeout
+        ):
+            return self.HALF_OPEN
+        return self._state
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenException when the call is not allowed"""
+        state = self.state
+        if state == self.OPEN or (state == self.HALF_OPEN and self._probing):
+            self.rejected += 1
+            raise CircuitOpenException("Attack table API circuit breaker is open")
+        if state == self.HALF_OPEN:
+            self._probing = True
+
+    def record_success(self) -> None:
+        self._state = self.CLOSED
+        self._failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._probing or self._failures >= self.failure_threshold:
+            if self._state != self.OPEN or self._probing:
+                self.opened += 1
+                logger.warning(
+                    f"Attack table API circuit breaker opened after "
+                    f"{self._failures} failures"
+                )
+            self._state = self.OPEN
+            self._opened_at = self._clock()
+        self._probing = False
+
+    def release(self) -> None:
+        """Forget a probe call that ended without a result (e.g. cancelled)"""
+        self._probing = False
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "failures": self._failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+
+
+class Resilience:
+    """Runs calls with a retry policy and an optional circuit breaker"""
+
+    def __init__(
+        self,
+        policy: RetryPolicy = RetryPolicy(),
+        breaker: Optional[CircuitBreaker] = None,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ):
+        self.policy = policy
+        self.breaker = breaker
+        self._sleep = sleep
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+        self.deadlines_exceeded = 0
+
+    async def call(self, fn: Callable[[], Awaitable[T]], description: str = "") -> T:
+        loop = asyncio.get_running_loop()
+        deadline = (
+            loop.time() + self.policy.deadline
+            if self.policy.deadline is not None
+            else None
+        )
+        self.calls += 1
+        attempt = 0
+        while True:
+            try:
+                return await self._attempt(fn, deadline)
+            except Exception as e:
+                if not getattr(e, "retryable", False):
+                    self.failures += 1
+                    raise
+                if attempt >= self.policy.max_retries:
+                    self.failures += 1
+                    logger.error(
+                        f"All {attempt + 1} attempts failed for {description}: {e}"
+                    )
+                    raise
+                delay = self.policy.backoff(attempt)
+                if deadline is not None and loop.time() + delay >= deadline:
+                    self.failures += 1
+                    self.deadlines_exceeded += 1
+                    raise DeadlineExceededException(
+                        f"Deadline exceeded for {description} after "
+                        f"{attempt + 1} attempts: {e}"
+                    ) from e
+                logger.warning(
+                    f"Attempt {attempt + 1} failed for {description}, "
+                    f"retrying in {delay:.3f}s: {e}"
+                )
+                self.retries += 1
+                attempt += 1
+                await self._sleep(delay)
+
+    async def _attempt(
+        self, fn: Callable[[], Awaitable[T]], deadline: Optional[float]
+    ) -> T:
+        if self.breaker:
+            self.breaker.before_call()
+        try:
+            if deadline is None:
+                result = await fn()
+            else:
+                remaining = deadline - asyncio.get_running_loop().time()
+                try:
+                    result = await asyncio.wait_for(fn(), max(remaining, 0))
+                except asyncio.TimeoutError as e:
+                    self.deadlines_exceeded += 1
+                    raise DeadlineExceededException(
+                        "Deadline exceeded waiting for the attack table API"
+                    ) from e
+        except BaseException as e:
+            if self.breaker:
+                if isinstance(e, DeadlineExceededException) or getattr(
+                    e, "retryable", False
+                ):
+                    self.breaker.record_failure()
+                elif isinstance(e, Exception):
+                    # The service answered, e.g. 404 for an unknown table
+                    self.breaker.record_success()
+                else:
+                    self.breaker.release()
+            raise
+        if self.breaker:
+            self.breaker.record_success()
+        return result
+
+    def stats(self) -> dict:
+        stats = {
+            "calls": self.calls,
+            "retries": self.retries,
+            "failures": self.failures,
+            "deadlinesExceeded": self.deadlines_exceeded,
+        }
+        if self.breaker:
+            stats["circuitBreaker"] = self.breaker.stats()
+        return stats
+
+
+class ResilientAttackTableClient(AttackTableClient):
+    """AttackTableClient decorator running every lookup through a Resilience"""
+
+    def __init__(self, delegate: AttackTableClient, resilience: Resilience):
+        self._delegate = delegate
+        self._resilience = resilience
+
+    @property
+    def delegate(self) -> AttackTableClient:
+        return self._delegate
+
+    async def get_attack_table_entry(
+        self, attack_table: str, size: str, roll: int, at: int
+    ) -> AttackTableEntry:
+        return await self._resilience.call(
+            lambda: self._delegate.get_attack_table_entry(
+                attack_table=attack_table, size=size, roll=roll, at=at
+            ),
+            f"attack table {attack_table}/{size} roll={roll} at={at}",
+        )
+
+    async def get_critical_table_entry(
+        self, critical_type: str, critical_severity: str, roll: int
+    ) -> CriticalTableEntry:
+        return await self._resilience.call(
+            lambda: self._delegate.get_critical_table_entry(
+                critical_type=critical_type,
+                critical_severity=critical_severity,
+                roll=roll,
+            ),
+            f"critical {critical_type}-{critical_severity} roll={roll}",
+        )
+
+    async def get_fumble_table_entry(
+        self, fumble_table: str, roll: int
+    ) -> FumbleTableEntry:
+        return await self._resilience.call(
+            lambda: self._delegate.get_fumble_table_entry(
+                fumble_table=fumble_table, roll=roll
+            ),
+            f"fumble {fumble_table} roll={roll}",
+        )
+
+    def stats(self) -> dict:
+        stats = self._resilience.stats()
+        if hasattr(self._delegate, "stats"):
+            stats["delegate"] = self._delegate.stats()
+        return stats
+
+    async def close(self):
+        """Close the decorated client"""
+        if hasattr(self._delegate, "close"):
+            await self._delegate.close()
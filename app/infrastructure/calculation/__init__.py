@@ -0,0 +1,6 @@
+from .calculation_executor import (
+    InlineCalculationExecutor,
+    ProcessPoolCalculationExecutor,
+)
+
+__all__ = ["InlineCalculationExecutor", "ProcessPoolCalculationExecutor"]
@@ -0,0 +1,245 @@
+"""
+Executors of CPU-bound attack calculations.
+Single attacks are cheap and are calculated on the event loop. Large batches and
+simulations go to a pool of worker processes that serve attack tables from the
+local snapshot, so they do not starve the other requests.
+"""
+
+import asyncio
+import gc
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar, Union
+
+from app.domain.entities import Attack, AttackCalculations, AttackResult
+from app.domain.entities.enums import AttackStatus
+from app.domain.services import AttackCalculator
+from app.application.ports import CalculationExecutor
+from app.infrastructure.api.attack_table_snapshot import (
+    SnapshotAttackTableClient,
+    TableSnapshot,
+)
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class InlineCalculationExecutor(CalculationExecutor):
+    """Calculates attacks on the event loop, simulations on the default executor"""
+
+    def __init__(self, attack_calculator: AttackCalculator):
+        self._attack_calculator = attack_calculator
+        self.inline_batches = 0
+        self.inline_simulations = 0
+
+    async def calculate_attacks(
+        self, attacks: list[Attack]
+    ) -> list[Optional[Exception]]:
+        self.inline_batches += 1
+        return await self._attack_calculator.calculate_batch(attacks)
+
+    async def run_simulation(self, fn: Callable[..., T], *args: Any, samples: int) -> T:
+        self.inline_simulations += 1
+        return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+    def stats(self) -> dict:
+        return {
+            "mode": "inline",
+            "inlineBatches": self.inline_batches,
+            "inlineSimulations": self.inline_simulations,
+        }
+
+
+class ProcessPoolCalculationExecutor(InlineCalculationExecutor):
+    """
+    Sends batches of at least min_batch_size attacks and simulations of at least
+    min_samples samples to worker processes, smaller ones run inline.
+    Workers open the table snapshot when they start. Attacks whose table is not
+    in the snapshot, and every attack when the pool breaks, are calculated inline.
+    """
+
+    def __init__(
+        self,
+        attack_calculator: AttackCalculator,
+        snapshot_path: str,
+        max_workers: int,
+        min_batch_size: int = 500,
+        min_samples: int = 200_000,
+    ):
+        super().__init__(attack_calculator)
+        self._max_workers = max_workers
+        self._min_batch_size = min_batch_size
+        self._min_samples = min_samples
+        # Forking a process running an event loop and driver threads is unsafe
+        self._pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(snapshot_path,),
+        )
+        self.pending = 0
+        self.offloaded_batches = 0
+        self.offloaded_simulations = 0
+        self.snapshot_misses = 0
+        self.pool_errors = 0
+
+    async def start(self) -> None:
+        """Start every worker and open the snapshot before the first request"""
+        try:
+            tables = await asyncio.gather(
+                *(self._submit(_warm_up) for _ in range(self._max_workers))
+            )
+        except Exception as e:
+            # The pool falls back to inline calculations, do not fail the startup
+            self.pool_errors += 1
+            logger.error(f"Could not start the calculation workers: {e}")
+            return
+        logger.info(
+            f"Started {self._max_workers} calculation workers, "
+            f"{tables[0] if tables else 0} snapshot attack tables per worker"
+        )
+
+    async def _submit(self, fn: Callable[..., T], *args: Any) -> T:
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._pool, fn, *args
+            )
+        finally:
+            self.pending -= 1
+
+    async def calculate_attacks(
+        self, attacks: list[Attack]
+    ) -> list[Optional[Exception]]:
+        if len(attacks) < self._min_batch_size:
+            return await super().calculate_attacks(attacks)
+        chunk_size = -(-len(attacks) // self._max_workers)
+        try:
+            chunks = await asyncio.gather(
+                *(
+                    self._submit(_calculate_chunk, attacks[start : start + chunk_size])
+                    for start in range(0, len(attacks), chunk_size)
+                )
+            )
+        except BrokenProcessPool as e:
+            self.pool_errors += 1
+            logger.error(f"Calculation pool failed, calculating inline: {e}")
+            return await super().calculate_attacks(attacks)
+        self.offloaded_batches += 1
+
+        errors: list[Optional[Exception]] = [None] * len(attacks)
+        misses: list[int] = []
+        results = [result for chunk in chunks for result in chunk]
+        for index, (attack, result) in enumerate(zip(attacks, results)):
+            if result is None:
+                misses.append(index)
+            elif isinstance(result, Exception):
+                errors[index] = result
+            else:
+                # Workers calculate copies, results are copied back in place
+                attack.calculated, attack.results, attack.status = result
+        if misses:
+            self.snapshot_misses += len(misses)
+            miss_errors = await super().calculate_attacks(
+                [attacks[index] for index in misses]
+            )
+            for index, error in zip(misses, miss_errors):
+                errors[index] = error
+        return errors
+
+    async def run_simulation(self, fn: Callable[..., T], *args: Any, samples: int) -> T:
+        if samples < self._min_samples:
+            return await super().run_simulation(fn, *args, samples=samples)
+        try:
+            result = await self._submit(fn, *args)
+        except BrokenProcessPool as e:
+            self.pool_errors += 1
+            logger.error(f"Calculation pool failed, simulating inline: {e}")
+            return await super().run_simulation(fn, *args, samples=samples)
+        self.offloaded_simulations += 1
+        return result
+
+    def stats(self) -> dict:
+        return {
+            **super().stats(),
+            "mode": "process",
+            "workers": self._max_workers,
+            "minBatchSize": self._min_batch_size,
+            "minSamples": self._min_samples,
+            "pending": self.pending,
+            # Tasks waiting for a free worker
+            "queueDepth": max(0, self.pending - self._max_workers),
+            "offloadedBatches": self.offloaded_batches,
+            "offloadedSimulations": self.offloaded_simulations,
+            "snapshotMisses": self.snapshot_misses,
+            "poolErrors": self.pool_errors,
+        }
+
+    async def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Calculated fields of an attack, the rest of the attack is not sent back
+CalculatedAttack = tuple[AttackCalculations, AttackResult, AttackStatus]
+
+# Worker process state, set by _init_worker
+_worker_calculator: Optional[AttackCalculator] = None
+_worker_snapshot: Optional[TableSnapshot] = None
+
+
+def _init_worker(snapshot_path: str) -> None:
+    global _worker_calculator, _worker_snapshot
+    client = SnapshotAttackTableClient.from_file(snapshot_path)
+    _worker_snapshot = client.snapshot
+    _worker_calculator = AttackCalculator(attack_table_client=client)
+
+
+def _warm_up() -> int:
+    # Rows are decoded on first use, a worker only pays for the tables it reads
+    return len(_worker_snapshot.attack_tables)
+
+
+def _calculate_chunk(
+    attacks: list[Attack],
+) -> list[Union[CalculatedAttack, Exception, None]]:
+    """
+    Calculated fields of the attacks, the error of the attacks that fail, or None
+    for the attacks whose attack table is not in the snapshot
+    """
+    # Workers only calculate, pausing the cyclic garbage collector affects no
+    # other work and avoids rescanning every attack while allocating results
+    gc.disable()
+    try:
+        results = asyncio.run(_calculate_all(attacks))
+    finally:
+        gc.enable()
+    return [
+        (result.calculated, result.results, result.status)
+        if isinstance(result, Attack)
+        else result
+        for result in results
+    ]
+
+
+async def _calculate_all(
+    attacks: list[Attack],
+) -> list[Union[Attack, Exception, None]]:
+    results: list[Union[Attack, Exception, None]] = [None] * len(attacks)
+    found: list[Attack] = []
+    positions: list[int] = []
+    for index, attack in enumerate(attacks):
+        modifiers = attack.modifiers if attack else None
+        if modifiers and not _worker_snapshot.has_attack_table(
+            modifiers.attack_table, modifiers.attack_size, modifiers.at
+        ):
+            continue
+        found.append(attack)
+        positions.append(index)
+    # The same per attack errors as the inline executor
+    errors = await _worker_calculator.calculate_batch(found)
+    for index, attack, error in zip(positions, found, errors):
+        results[index] = error or attack
+    return results
@@ -2,7 +2,7 @@
 Configuration for Attack Table REST adapter.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 
@@ -12,11 +12,31 @@ class AttackTableApiConfig:
 
     base_url: str
     timeout: float = 30.0
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    warm_up_connections: int = 1
     api_key: Optional[str] = None
     max_retries: int = 3
     retry_delay: float = 1.0
+    retry_max_delay: float = 5.0
+    deadline: Optional[float] = 10.0
+    circuit_breaker_threshold: int = 5
+    circuit_breaker_reset: float = 30.0
     # enable_retry: bool = True
     enable_retry: bool = False
+    enable_cache: bool = True
+    cache_max_size: int = 10000
+    cache_ttl: float = 3600.0
+    enable_preload: bool = False
+    preload_tables: list[tuple[str, str]] = field(default_factory=list)
+    preload_max_at: int = 10
+    preload_concurrency: int = 20
+    snapshot_path: Optional[str] = None
+    snapshot_fallback: bool = True
+    enable_store: bool = False
+    store_refresh_after: float = 86400.0
 
     @classmethod
     def from_env(cls) -> "AttackTableApiConfig":
@@ -26,11 +46,75 @@ class AttackTableApiConfig:
         return cls(
             base_url=os.getenv("RMU_API_ATTACK_TABLES_URL", "http://localhost:3005/v1"),
             timeout=float(os.getenv("RMU_API_ATTACK_TABLES_TIMEOUT", "30.0")),
+            max_connections=int(
+                os.getenv("RMU_API_ATTACK_TABLES_MAX_CONNECTIONS", "100")
+            ),
+            max_keepalive_connections=int(
+                os.getenv("RMU_API_ATTACK_TABLES_MAX_KEEPALIVE", "20")
+            ),
+            keepalive_expiry=float(
+                os.getenv("RMU_API_ATTACK_TABLES_KEEPALIVE_EXPIRY", "30.0")
+            ),
+            http2=os.getenv("RMU_API_ATTACK_TABLES_HTTP2", "false").lower() == "true",
+            warm_up_connections=int(
+                os.getenv("RMU_API_ATTACK_TABLES_WARM_UP_CONNECTIONS", "1")
+            ),
             api_key=os.getenv("RMU_API_ATTACK_TABLES_KEY"),
             max_retries=int(os.getenv("RMU_API_ATTACK_TABLES_MAX_RETRIES", "3")),
             retry_delay=float(os.getenv("RMU_API_ATTACK_TABLES_RETRY_DELAY", "1.0")),
+            retry_max_delay=float(
+                os.getenv("RMU_API_ATTACK_TABLES_RETRY_MAX_DELAY", "5.0")
+            ),
+            deadline=float(os.getenv("RMU_API_ATTACK_TABLES_DEADLINE", "10.0")) or None,
+            circuit_breaker_threshold=int(
+                os.getenv("RMU_API_ATTACK_TABLES_CIRCUIT_BREAKER_THRESHOLD", "5")
+            ),
+            circuit_breaker_reset=float(
+                os.getenv("RMU_API_ATTACK_TABLES_CIRCUIT_BREAKER_RESET", "30.0")
+            ),
             enable_retry=os.getenv(
                 "RMU_API_ATTACK_TABLES_ENABLE_RETRY", "false"
             ).lower()
             == "true",
+            enable_cache=os.getenv("RMU_API_ATTACK_TABLES_ENABLE_CACHE", "true").lower()
+            == "true",
+            cache_max_size=int(
+                os.getenv("RMU_API_ATTACK_TABLES_CACHE_MAX_SIZE", "10000")
+            ),
+            cache_ttl=float(os.getenv("RMU_API_ATTACK_TABLES_CACHE_TTL", "3600.0")),
+            enable_preload=os.getenv(
+                "RMU_API_ATTACK_TABLES_ENABLE_PRELOAD", "false"
+            ).lower()
+            == "true",
+            preload_tables=cls.parse_tables(
+                os.getenv("RMU_API_ATTACK_TABLES_PRELOAD", "")
+            ),
+            preload_max_at=int(os.getenv("RMU_API_ATTACK_TABLES_PRELOAD_MAX_AT", "10")),
+            preload_concurrency=int(
+                os.getenv("RMU_API_ATTACK_TABLES_PRELOAD_CONCURRENCY", "20")
+            ),
+            snapshot_path=os.getenv("RMU_API_ATTACK_TABLES_SNAPSHOT") or None,
+            snapshot_fallback=os.getenv(
+                "RMU_API_ATTACK_TABLES_SNAPSHOT_FALLBACK", "true"
+            ).lower()
+            == "true",
+            enable_store=os.getenv(
+                "RMU_API_ATTACK_TABLES_ENABLE_STORE", "false"
+            ).lower()
+            == "true",
+            store_refresh_after=float(
+                os.getenv("RMU_API_ATTACK_TABLES_STORE_REFRESH_AFTER", "86400")
+            ),
         )
+
+    @staticmethod
+    def parse_tables(value: str) -> list[tuple[str, str]]:
+        """Parse a 'table:size,table:size' list, size defaults to medium"""
+        tables = []
+        for item in value.split(","):
+            item = item.strip()
+            if not item:
+                continue
+            table, _, size = item.partition(":")
+            tables.append((table.strip(), size.strip() or "medium"))
+        return tables
@@ -4,21 +4,30 @@ This assembles all the components and their dependencies.
 """
 
 from typing import Optional
-from motor.motor_asyncio import AsyncIOMotorClient
 from app.domain.services import (
     AttackCalculator,
     AttackDomainService,
     AttackResolutionService,
+    AttackSimulator,
+)
+from app.application.ports import (
+    AttackRepository,
+    AttackTableClient,
+    CalculationExecutor,
 )
-from app.application.ports import AttackRepository, AttackTableClient
 from app.application.use_cases import (
     ApplyAttackUseCase,
     CreateAttackUseCase,
+    CreateAttacksBatchUseCase,
     DeleteAttackUseCase,
+    DeleteAttacksUseCase,
+    ExportAttacksUseCase,
     SearchAttackByIdUseCase,
     SearchAttacksByRsqlUseCase,
+    SimulateAttackUseCase,
     UpdateAttackModifiersUseCase,
     UpdateAttackRollUseCase,
+    UpdateAttackRollsBatchUseCase,
     UpdateCriticalRollUseCase,
     UpdateFumbleRollUseCase,
     UpdateAttackParryUseCase,
@@ -26,12 +35,30 @@ from app.application.use_cases import (
 from app.infrastructure.config.config import settings
 from app.infrastructure.persistence import (
     MongoAttackRepository,
+    MongoIndexAdvisor,
+    MongoTableEntryStore,
+    close_mongo_client,
+    get_mongo_client,
+)
+from app.infrastructure.api.attack_table_rest_adapter import AttackTableRestAdapter
+from app.infrastructure.api.attack_table_cache import CachingAttackTableClient
+from app.infrastructure.api.attack_table_fallback import FallbackAttackTableClient
+from app.infrastructure.api.attack_table_preload import PreloadingAttackTableClient
+from app.infrastructure.api.attack_table_snapshot import SnapshotAttackTableClient
+from app.infrastructure.api.resilience import (
+    CircuitBreaker,
+    Resilience,
+    ResilientAttackTableClient,
+    RetryPolicy,
 )
-from app.infrastructure.api.attack_table_rest_adapter import (
-    AttackTableRestAdapter,
-    AttackTableRestAdapterWithRetry,
+from app.infrastructure.calculation import (
+    InlineCalculationExecutor,
+    ProcessPoolCalculationExecutor,
 )
 from app.infrastructure.config.attack_table_config import AttackTableApiConfig
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
 
 
 class DependencyContainer:
@@ -43,28 +70,40 @@ class DependencyContainer:
 
         # Repositories
         self._attack_repository: Optional[AttackRepository] = None
+        self._index_advisor: Optional[MongoIndexAdvisor] = None
 
         # External services
         self._attack_table_service: Optional[AttackTableClient] = None
+        self._attack_table_preloader: Optional[PreloadingAttackTableClient] = None
+        self._attack_table_rest_adapter: Optional[AttackTableRestAdapter] = None
 
         # Domain services
         self._attack_domain_service: Optional[AttackDomainService] = None
         self._attack_calculator: Optional[AttackCalculator] = None
         self._attack_resolution_service: Optional[AttackResolutionService] = None
+        self._attack_simulator: Optional[AttackSimulator] = None
+        self._calculation_executor: Optional[CalculationExecutor] = None
 
         # Attack Use Cases
         self._apply_attack_use_case: Optional[ApplyAttackUseCase] = None
         self._create_attack_use_case: Optional[CreateAttackUseCase] = None
+        self._create_attacks_batch_use_case: Optional[CreateAttacksBatchUseCase] = None
         self._delete_attack_use_case: Optional[DeleteAttackUseCase] = None
+        self._delete_attacks_use_case: Optional[DeleteAttacksUseCase] = None
+        self._export_attacks_use_case: Optional[ExportAttacksUseCase] = None
         self._search_attack_by_id_use_case: Optional[SearchAttackByIdUseCase] = None
         self._search_attack_by_rsql_use_case: Optional[SearchAttacksByRsqlUseCase] = (
             None
         )
+        self._simulate_attack_use_case: Optional[SimulateAttackUseCase] = None
         self._update_attack_modifiers_use_case: Optional[
             UpdateAttackModifiersUseCase
         ] = None
         self._update_attack_parry_use_case: Optional[UpdateAttackParryUseCase] = None
         self._update_attack_roll_use_case: Optional[UpdateAttackRollUseCase] = None
+        self._update_attack_rolls_batch_use_case: Optional[
+            UpdateAttackRollsBatchUseCase
+        ] = None
         self._update_critical_roll_use_case: Optional[UpdateCriticalRollUseCase] = None
         self._update_fumble_roll_use_case: Optional[UpdateFumbleRollUseCase] = None
 
@@ -72,36 +111,46 @@ class DependencyContainer:
         """Initialize all dependencies"""
 
         # Database connection
-        self._client = AsyncIOMotorClient(settings.MONGODB_URL)
+        self._client = get_mongo_client()
         self._database = self._client.get_default_database()
 
         # Test connection
         await self._database.command("ping")
 
         # Initialize repositories
-        self._attack_repository = MongoAttackRepository(self._database)
+        if settings.INDEX_ADVISOR_ENABLED:
+            self._index_advisor = MongoIndexAdvisor(
+                self._database.attacks,
+                regex_scan_threshold=settings.INDEX_ADVISOR_REGEX_SCAN_THRESHOLD,
+                auto_create=settings.INDEX_ADVISOR_AUTO_CREATE,
+                reject_unindexed=settings.INDEX_ADVISOR_REJECT_UNINDEXED,
+            )
+        self._attack_repository = MongoAttackRepository(
+            self._database, index_advisor=self._index_advisor
+        )
+        if settings.ENSURE_INDEXES:
+            await self._attack_repository.ensure_indexes()
 
         # Initialize external services
         attack_table_config = AttackTableApiConfig.from_env()
-        if attack_table_config.enable_retry:
-            self._attack_table_service = AttackTableRestAdapterWithRetry(
-                base_url=attack_table_config.base_url,
-                timeout=attack_table_config.timeout,
-                api_key=attack_table_config.api_key,
-                max_retries=attack_table_config.max_retries,
-                retry_delay=attack_table_config.retry_delay,
-            )
-        else:
-            self._attack_table_service = AttackTableRestAdapter(
-                base_url=attack_table_config.base_url,
-                timeout=attack_table_config.timeout,
-                api_key=attack_table_config.api_key,
+        self._attack_table_service = self._create_attack_table_client(
+            attack_table_config
+        )
+        if self._attack_table_rest_adapter:
+            await self._attack_table_rest_adapter.start(
+                attack_table_config.warm_up_connections
             )
+        if self._attack_table_preloader:
+            await self._attack_table_preloader.preload()
 
         # Initialize domain services
         self._attack_calculator = AttackCalculator(
             attack_table_client=self._attack_table_service,
         )
+        self._calculation_executor = self._create_calculation_executor(
+            attack_table_config
+        )
+        await self._calculation_executor.start()
         self._attack_domain_service = AttackDomainService(
             attack_calculator=self._attack_calculator,
             attack_repository=self._attack_repository,
@@ -110,6 +159,12 @@ class DependencyContainer:
             attack_calculator=self._attack_calculator,
             attack_repository=self._attack_repository,
             attack_table_client=self._attack_table_service,
+            calculation_executor=self._calculation_executor,
+        )
+        self._attack_simulator = AttackSimulator(
+            attack_calculator=self._attack_calculator,
+            attack_table_client=self._attack_table_service,
+            calculation_executor=self._calculation_executor,
         )
 
         # Initialize Attack use cases
@@ -117,13 +172,21 @@ class DependencyContainer:
             self._attack_domain_service
         )
         self._create_attack_use_case = CreateAttackUseCase(self._attack_domain_service)
+        self._create_attacks_batch_use_case = CreateAttacksBatchUseCase(
+            self._attack_domain_service
+        )
         self._delete_attack_use_case = DeleteAttackUseCase(self._attack_repository)
+        self._delete_attacks_use_case = DeleteAttacksUseCase(self._attack_repository)
+        self._export_attacks_use_case = ExportAttacksUseCase(
+            self._attack_repository, batch_size=settings.EXPORT_CURSOR_BATCH_SIZE
+        )
         self._search_attack_by_id_use_case = SearchAttackByIdUseCase(
             self._attack_repository
         )
         self._search_attack_by_rsql_use_case = SearchAttacksByRsqlUseCase(
             self._attack_repository
         )
+        self._simulate_attack_use_case = SimulateAttackUseCase(self._attack_simulator)
         self._update_attack_modifiers_use_case = UpdateAttackModifiersUseCase(
             attack_repository=self._attack_repository,
             attack_calculator=self._attack_calculator,
@@ -131,6 +194,9 @@ class DependencyContainer:
         self._update_attack_roll_use_case = UpdateAttackRollUseCase(
             self._attack_resolution_service
         )
+        self._update_attack_rolls_batch_use_case = UpdateAttackRollsBatchUseCase(
+            self._attack_resolution_service
+        )
         self._update_critical_roll_use_case = UpdateCriticalRollUseCase(
             self._attack_resolution_service
         )
@@ -142,10 +208,112 @@ class DependencyContainer:
             attack_calculator=self._attack_calculator,
         )
 
+    def _create_attack_table_client(
+        self, attack_table_config: AttackTableApiConfig
+    ) -> AttackTableClient:
+        """Assemble the attack table client and its decorators"""
+        client = AttackTableRestAdapter(
+            base_url=attack_table_config.base_url,
+            timeout=attack_table_config.timeout,
+            api_key=attack_table_config.api_key,
+            **self._connection_options(attack_table_config),
+        )
+        self._attack_table_rest_adapter = client
+        client = ResilientAttackTableClient(
+            delegate=client, resilience=self._create_resilience(attack_table_config)
+        )
+        if attack_table_config.enable_store:
+            client = FallbackAttackTableClient(
+                delegate=client,
+                store=MongoTableEntryStore(self._database.attack_table_entries),
+                refresh_after=attack_table_config.store_refresh_after,
+            )
+        if attack_table_config.enable_preload:
+            self._attack_table_preloader = PreloadingAttackTableClient(
+                delegate=client,
+                tables=attack_table_config.preload_tables,
+                at_values=range(1, attack_table_config.preload_max_at + 1),
+                concurrency=attack_table_config.preload_concurrency,
+            )
+            client = self._attack_table_preloader
+        if attack_table_config.snapshot_path:
+            client = SnapshotAttackTableClient.from_file(
+                attack_table_config.snapshot_path,
+                fallback=client if attack_table_config.snapshot_fallback else None,
+            )
+            if not attack_table_config.snapshot_fallback:
+                # Every entry is served by the snapshot, the API is never called
+                self._attack_table_rest_adapter = None
+        if attack_table_config.enable_cache:
+            client = CachingAttackTableClient(
+                delegate=client,
+                max_size=attack_table_config.cache_max_size,
+                ttl=attack_table_config.cache_ttl,
+            )
+        return client
+
+    def _create_calculation_executor(
+        self, attack_table_config: AttackTableApiConfig
+    ) -> CalculationExecutor:
+        """Process pool for large batches when configured, inline otherwise"""
+        if settings.CALCULATION_WORKERS > 0:
+            if attack_table_config.snapshot_path:
+                return ProcessPoolCalculationExecutor(
+                    attack_calculator=self._attack_calculator,
+                    snapshot_path=attack_table_config.snapshot_path,
+                    max_workers=settings.CALCULATION_WORKERS,
+                    min_batch_size=settings.CALCULATION_POOL_MIN_ATTACKS,
+                    min_samples=settings.CALCULATION_POOL_MIN_SAMPLES,
+                )
+            logger.warning(
+                "Calculation workers need a table snapshot, calculating inline"
+            )
+        return InlineCalculationExecutor(self._attack_calculator)
+
+    @staticmethod
+    def _create_resilience(attack_table_config: AttackTableApiConfig) -> Resilience:
+        """Retry policy and circuit breaker of the attack tables API calls"""
+        breaker = None
+        if attack_table_config.circuit_breaker_threshold > 0:
+            breaker = CircuitBreaker(
+                failure_threshold=attack_table_config.circuit_breaker_threshold,
+                reset_timeout=attack_table_config.circuit_breaker_reset,
+            )
+        return Resilience(
+            RetryPolicy(
+                max_retries=(
+                    attack_table_config.max_retries
+                    if attack_table_config.enable_retry
+                    else 0
+                ),
+                base_delay=attack_table_config.retry_delay,
+                max_delay=attack_table_config.retry_max_delay,
+                deadline=attack_table_config.deadline,
+            ),
+            breaker,
+        )
+
+    @staticmethod
+    def _connection_options(attack_table_config: AttackTableApiConfig) -> dict:
+        return {
+            "max_connections": attack_table_config.max_connections,
+            "max_keepalive_connections": attack_table_config.max_keepalive_connections,
+            "keepalive_expiry": attack_table_config.keepalive_expiry,
+            "http2": attack_table_config.http2,
+        }
+
     async def cleanup(self):
         """Clean up dependencies"""
+        if self._calculation_executor:
+            await self._calculation_executor.close()
+            self._calculation_executor = None
+        if self._attack_table_service and hasattr(self._attack_table_service, "close"):
+            await self._attack_table_service.close()
+            self._attack_table_service = None
+            self._attack_table_preloader = None
+            self._attack_table_rest_adapter = None
         if self._client:
-            self._client.close()
+            close_mongo_client()
             self._client = None
             self._database = None
 
@@ -154,6 +322,10 @@ class DependencyContainer:
         """Get attack repository instance"""
         return self._attack_repository
 
+    def get_index_advisor(self) -> Optional[MongoIndexAdvisor]:
+        """Get index advisor instance, None when disabled"""
+        return self._index_advisor
+
     def get_apply_attack_use_case(self) -> ApplyAttackUseCase:
         """Get apply attack use case instance"""
         return self._apply_attack_use_case
@@ -162,10 +334,22 @@ class DependencyContainer:
         """Get create attack use case instance"""
         return self._create_attack_use_case
 
+    def get_create_attacks_batch_use_case(self) -> CreateAttacksBatchUseCase:
+        """Get create attacks batch use case instance"""
+        return self._create_attacks_batch_use_case
+
     def get_delete_attack_use_case(self) -> DeleteAttackUseCase:
         """Get delete attack use case instance"""
         return self._delete_attack_use_case
 
+    def get_delete_attacks_use_case(self) -> DeleteAttacksUseCase:
+        """Get delete attacks use case instance"""
+        return self._delete_attacks_use_case
+
+    def get_export_attacks_use_case(self) -> ExportAttacksUseCase:
+        """Get export attacks use case instance"""
+        return self._export_attacks_use_case
+
     def get_search_attack_by_id_use_case(self) -> SearchAttackByIdUseCase:
         """Get search attack by ID use case instance"""
         return self._search_attack_by_id_use_case
@@ -174,6 +358,10 @@ class DependencyContainer:
         """Get search attack by RSQL use case instance"""
         return self._search_attack_by_rsql_use_case
 
+    def get_simulate_attack_use_case(self) -> SimulateAttackUseCase:
+        """Get simulate attack use case instance"""
+        return self._simulate_attack_use_case
+
     def get_update_attack_modifiers_use_case(self) -> UpdateAttackModifiersUseCase:
         """Get update attack modifiers use case instance"""
         return self._update_attack_modifiers_use_case
@@ -182,6 +370,10 @@ class DependencyContainer:
         """Get update attack roll use case instance"""
         return self._update_attack_roll_use_case
 
+    def get_update_attack_rolls_batch_use_case(self) -> UpdateAttackRollsBatchUseCase:
+        """Get update attack rolls batch use case instance"""
+        return self._update_attack_rolls_batch_use_case
+
     def get_update_critical_roll_use_case(self) -> UpdateCriticalRollUseCase:
         """Get update critical roll use case instance"""
         return self._update_critical_roll_use_case
@@ -195,6 +387,10 @@ class DependencyContainer:
         return self._update_attack_parry_use_case
 
     # External services
+    def get_calculation_executor(self) -> CalculationExecutor:
+        """Get calculation executor instance"""
+        return self._calculation_executor
+
     def get_attack_table_service(self) -> AttackTableClient:
         """Get attack table service instance"""
         return self._attack_table_service
@@ -1,3 +1,20 @@
 from .mongo_attack_repository import MongoAttackRepository
+from .mongo_client import (
+    MongoPoolMetrics,
+    close_mongo_client,
+    get_mongo_client,
+    get_pool_metrics,
+)
+from .mongo_index_advisor import MongoIndexAdvisor, UnindexedQueryException
+from .mongo_table_entry_store import MongoTableEntryStore
 
-__all__ = ["MongoAttackRepository"]
+__all__ = [
+    "MongoAttackRepository",
+    "MongoIndexAdvisor",
+    "MongoPoolMetrics",
+    "MongoTableEntryStore",
+    "UnindexedQueryException",
+    "close_mongo_client",
+    "get_mongo_client",
+    "get_pool_metrics",
+]
@@ -3,7 +3,7 @@ MongoDB converter for Attack entities.
 This class handles conversion between Attack domain entities and MongoDB documents.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 from bson import ObjectId
 
 from app.domain.entities import (
@@ -22,6 +22,7 @@ from app.domain.entities import (
     CriticalTableEntry,
     CriticalEffect,
     AttackFumbleResult,
+    AttackSummary,
 )
 from app.domain.entities.enums import (
     AttackStatus,
@@ -39,6 +40,57 @@ from app.domain.entities.enums import (
 class MongoAttackConverter:
     """Converter for Attack entities to/from MongoDB documents"""
 
+    # Document path of every AttackSummary field
+    SUMMARY_FIELD_PATHS = {
+        "id": "_id",
+        "action_id": "actionId",
+        "source_id": "sourceId",
+        "target_id": "targetId",
+        "status": "status",
+        "attack_type": "modifiers.attackType",
+        "roll": "roll.roll",
+        "roll_total": "calculated.rollTotal",
+    }
+
+    # Document field of every dirty tracked Attack field
+    FIELD_PATHS = {
+        "action_id": "actionId",
+        "source_id": "sourceId",
+        "target_id": "targetId",
+        "status": "status",
+        "modifiers": "modifiers",
+        "roll": "roll",
+        "calculated": "calculated",
+        "results": "results",
+    }
+
+    CRITICAL_ROLLS_PATH = "roll.criticalRolls"
+
+    @classmethod
+    def summary_projection(cls, fields: List[str]) -> Dict[str, int]:
+        """Build the MongoDB projection loading the given AttackSummary fields"""
+        projection = {"_id": 1}
+        for name in fields:
+            projection[cls.SUMMARY_FIELD_PATHS[name]] = 1
+        return projection
+
+    @staticmethod
+    def dict_to_attack_summary(attack_dict: Dict[str, Any]) -> AttackSummary:
+        """Convert a projected MongoDB document to an AttackSummary"""
+        modifiers = attack_dict.get("modifiers") or {}
+        roll = attack_dict.get("roll") or {}
+        calculated = attack_dict.get("calculated") or {}
+        return AttackSummary(
+            id=str(attack_dict["_id"]),
+            action_id=attack_dict.get("actionId"),
+            source_id=attack_dict.get("sourceId"),
+            target_id=attack_dict.get("targetId"),
+            status=AttackStatus.from_value(attack_dict.get("status")),
+            attack_type=AttackType.from_value(modifiers.get("attackType")),
+            roll=roll.get("roll"),
+            roll_total=calculated.get("rollTotal"),
+        )
+
     @staticmethod
     def attack_to_dict(attack: Attack, include_id: bool = True) -> Dict[str, Any]:
         """Convert Attack domain entity to dictionary for MongoDB"""
@@ -142,6 +194,74 @@ class MongoAttackConverter:
 
         return attack_dict
 
+    @classmethod
+    def attack_to_update(
+        cls, attack: Attack, dirty: Set[str]
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Build the MongoDB update of the dirty fields of an attack, with the array
+        filters of the criticals it updates. Single critical rolls and critical
+        results are updated in place, other changes inside a field update the
+        whole field. Paths inside an updated field are dropped, as MongoDB rejects
+        updates of conflicting paths.
+        """
+        fields = {path for path in dirty if "." not in path}
+        critical_rolls: Set[str] = set()
+        criticals: Set[str] = set()
+        for path in dirty - fields:
+            field, _, inner = path.partition(".")
+            if field == "roll" and inner.startswith("critical_rolls.") and attack.roll:
+                target, key = critical_rolls, inner[len("critical_rolls.") :]
+            elif field == "results" and inner.startswith("criticals.") and attack.results:
+                key = inner[len("criticals.") :]
+                found = attack.results.get_critical_by_key(key)
+                target = criticals if found else fields
+            else:
+                target, key = fields, ""
+            # Keys are part of the document path
+            if target is fields or not key or "." in key or key.startswith("$"):
+                fields.add(field)
+            else:
+                target.add(key)
+
+        to_set: Dict[str, Any] = {}
+        to_unset: Dict[str, Any] = {}
+        if fields:
+            document = cls.attack_to_dict(attack, include_id=False)
+            for field in sorted(fields):
+                if field not in cls.FIELD_PATHS:
+                    raise ValueError(f"Unknown attack field: {field}")
+                document_field = cls.FIELD_PATHS[field]
+                if document[document_field] is None:
+                    to_unset[document_field] = ""
+                else:
+                    to_set[document_field] = document[document_field]
+
+        if "roll" not in fields:
+            rolls = (attack.roll.critical_rolls if attack.roll else None) or {}
+            for key in sorted(critical_rolls):
+                path = f"{cls.CRITICAL_ROLLS_PATH}.{key}"
+                if key in rolls:
+                    to_set[path] = rolls[key]
+                else:
+                    to_unset[path] = ""
+
+        array_filters: List[Dict[str, Any]] = []
+        if "results" not in fields:
+            for key in sorted(criticals):
+                name = f"c{len(array_filters)}"
+                to_set[f"results.criticals.$[{name}]"] = cls.critical_result_to_dict(
+                    attack.results.get_critical_by_key(key)
+                )
+                array_filters.append({f"{name}.key": key})
+
+        update: Dict[str, Any] = {}
+        if to_set:
+            update["$set"] = to_set
+        if to_unset:
+            update["$unset"] = to_unset
+        return update, array_filters
+
     @staticmethod
     def dict_to_attack(attack_dict: Dict[str, Any]) -> Optional[Attack]:
         """Convert dictionary from MongoDB to Attack domain entity"""
@@ -291,42 +411,10 @@ class MongoAttackConverter:
                 "criticalSeverity": attack_result.attack_table_entry.critical_severity,
             }
         if attack_result.criticals:
-            criticals = []
-            for c in attack_result.criticals:
-                critical_effects = None
-                if c.result and c.result.effects:
-                    critical_effects = []
-                    for effect in c.result.effects:
-                        critical_effects.append(
-                            {
-                                "status": effect.status,
-                                "rounds": effect.rounds,
-                                "value": effect.value,
-                                "delay": effect.delay,
-                                "condition": effect.condition,
-                            }
-                        )
-                critical_result = (
-                    {
-                        "text": c.result.text,
-                        "damage": c.result.damage,
-                        "location": c.result.location,
-                        "effects": critical_effects,
-                    }
-                    if c.result
-                    else None
-                )
-                criticals.append(
-                    {
-                        "key": c.key,
-                        "status": c.status.value,
-                        "type": c.critical_type,
-                        "criticalSeverity": c.critical_severity,
-                        "adjustedRoll": c.adjusted_roll,
-                        "result": critical_result,
-                    }
-                )
-            result_dict["criticals"] = criticals
+            result_dict["criticals"] = [
+                MongoAttackConverter.critical_result_to_dict(c)
+                for c in attack_result.criticals
+            ]
 
         if attack_result.fumble:
             result_dict["fumble"] = {
@@ -348,6 +436,41 @@ class MongoAttackConverter:
 
         return result_dict
 
+    @staticmethod
+    def critical_result_to_dict(c: AttackCriticalResult) -> Dict[str, Any]:
+        """Convert AttackCriticalResult domain entity to dictionary for MongoDB"""
+        critical_effects = None
+        if c.result and c.result.effects:
+            critical_effects = []
+            for effect in c.result.effects:
+                critical_effects.append(
+                    {
+                        "status": effect.status,
+                        "rounds": effect.rounds,
+                        "value": effect.value,
+                        "delay": effect.delay,
+                        "condition": effect.condition,
+                    }
+                )
+        critical_result = (
+            {
+                "text": c.result.text,
+                "damage": c.result.damage,
+                "location": c.result.location,
+                "effects": critical_effects,
+            }
+            if c.result
+            else None
+        )
+        return {
+            "key": c.key,
+            "status": c.status.value,
+            "type": c.critical_type,
+            "criticalSeverity": c.critical_severity,
+            "adjustedRoll": c.adjusted_roll,
+            "result": critical_result,
+        }
+
     @staticmethod
     def dict_to_attack_result(dict: Dict[str, Any]) -> Optional[AttackResult]:
         results = None
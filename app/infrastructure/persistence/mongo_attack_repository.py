@@ -3,19 +3,22 @@ MongoDB adapter for attack persistence.
 This is an infrastructure adapter that implements the AttackRepository port.
 """
 
-from typing import Optional, List
+import time
+from typing import AsyncIterator, Optional, List
 from fastapi import HTTPException
-from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo.errors import DuplicateKeyError
+from pymongo import ASCENDING, IndexModel, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 from bson import ObjectId
+from bson.errors import InvalidId
 
 from app.domain.exceptions import AttackNotFoundException
-from app.domain.entities import Attack
+from app.domain.entities import Attack, AttackSummary, BatchItemError, BatchResult
 
 from app.application.ports import AttackRepository
 from app.infrastructure.logging import get_logger
-from app.infrastructure.config.config import settings
 
+from .mongo_client import get_mongo_client
+from .mongo_index_advisor import MongoIndexAdvisor
 from .rsql_parser import RSQLParser
 from .mongo_attack_converter import MongoAttackConverter
 
@@ -25,9 +28,25 @@ logger = get_logger(__name__)
 class MongoAttackRepository(AttackRepository):
     """MongoDB implementation of AttackRepository"""
 
-    def __init__(self, database=None):
+    # Indexes required by the repository queries, created by ensure_indexes()
+    INDEXES = [
+        IndexModel([("actionId", ASCENDING)]),
+        IndexModel([("sourceId", ASCENDING)]),
+        IndexModel([("targetId", ASCENDING)]),
+        IndexModel([("status", ASCENDING)]),
+        IndexModel([("actionId", ASCENDING), ("status", ASCENDING)]),
+        IndexModel([("sourceId", ASCENDING), ("targetId", ASCENDING)]),
+        IndexModel(
+            [("actionId", ASCENDING), ("sourceId", ASCENDING), ("targetId", ASCENDING)]
+        ),
+    ]
+
+    def __init__(
+        self, database=None, index_advisor: Optional[MongoIndexAdvisor] = None
+    ):
         self._converter = MongoAttackConverter()
         self._rsql_parser = RSQLParser()
+        self._index_advisor = index_advisor
 
         if database is not None:
             # Use provided database connection (from container)
@@ -35,11 +54,7 @@ class MongoAttackRepository(AttackRepository):
             self._database = database
             self._collection = database.attacks
         else:
-            # Create own connection (legacy mode)
-            self.mongo_url = settings.MONGODB_URL
-            self.database_name = settings.MONGODB_DATABASE
-            self.collection_name = "attacks"
-
+            # Standalone mode, uses the shared client on connect
             self._client = None
             self._database = None
             self._collection = None
@@ -49,15 +64,40 @@ class MongoAttackRepository(AttackRepository):
         if self._database is not None:
             return
 
-        if not self._client:
-            self._client = AsyncIOMotorClient(self.mongo_url)
-            self._database = self._client[self.database_name]
-            self._collection = self._database[self.collection_name]
+        self._client = get_mongo_client()
+        self._database = self._client.get_default_database()
+        self._collection = self._database.attacks
+
+    async def ensure_indexes(self) -> List[str]:
+        """Create the missing required indexes, returns the created index names"""
+        await self.connect()
+        start = time.perf_counter()
+        existing = await self._collection.index_information()
+        created = []
+        for index in self.INDEXES:
+            name = index.document["name"]
+            if name in existing:
+                logger.debug(f"Index {name} already exists")
+                continue
+            logger.info(f"Creating index {name}")
+            index_start = time.perf_counter()
+            try:
+                created.extend(await self._collection.create_indexes([index]))
+            except Exception as e:
+                logger.error(f"Error creating index {name}: {e}")
+                continue
+            logger.info(
+                f"Created index {name} in {time.perf_counter() - index_start:.3f}s"
+            )
+        logger.info(
+            f"Indexes checked in {time.perf_counter() - start:.3f}s: "
+            f"{len(created)} created, {len(self.INDEXES) - len(created)} existing or failed"
+        )
+        return created
 
     async def disconnect(self):
-        """Close MongoDB connection"""
+        """Release the MongoDB connection, the shared client stays open"""
         if self._client:
-            self._client.close()
             self._client = None
             self._database = None
             self._collection = None
@@ -76,17 +116,60 @@ class MongoAttackRepository(AttackRepository):
             logger.error(f"Error finding attack by ID: {attack_id} - {e}")
             raise HTTPException(status_code=500, detail=str(e))
 
+    async def find_by_ids(self, attack_ids: List[str]) -> List[Attack]:
+        await self.connect()
+        object_ids = []
+        for attack_id in attack_ids:
+            try:
+                object_ids.append(ObjectId(attack_id))
+            except (InvalidId, TypeError):
+                logger.warning(f"Invalid attack ID: {attack_id}")
+        if not object_ids:
+            return []
+        cursor = self._collection.find({"_id": {"$in": object_ids}})
+        return [self._converter.dict_to_attack(doc) async for doc in cursor]
+
+    @property
+    def index_advisor(self) -> Optional[MongoIndexAdvisor]:
+        return self._index_advisor
+
+    async def _parse_rsql(self, rsql_query: Optional[str]) -> dict:
+        """Parse an RSQL query, letting the index advisor record or reject it"""
+        mongo_query = self._rsql_parser.parse(rsql_query) if rsql_query else {}
+        if mongo_query and self._index_advisor is not None:
+            await self._index_advisor.check(mongo_query)
+        return mongo_query
+
+    @staticmethod
+    def _after_query(query: dict, after: Optional[str]) -> dict:
+        """Restrict a query to the documents following the given ID"""
+        if not after:
+            return query
+        try:
+            after_query = {"_id": {"$gt": ObjectId(after)}}
+        except (InvalidId, TypeError):
+            raise ValueError(f"Invalid cursor: {after}")
+        return {"$and": [query, after_query]} if query else after_query
+
     async def find_by_rsql(
-        self, rsql_query: Optional[str] = None, limit: int = 10, skip: int = 0
+        self,
+        rsql_query: Optional[str] = None,
+        limit: int = 10,
+        skip: int = 0,
+        after: Optional[str] = None,
     ) -> List[Attack]:
         await self.connect()
+        mongo_query = await self._parse_rsql(rsql_query)
+        mongo_query = self._after_query(mongo_query, after)
         try:
-            if rsql_query:
-                mongo_query = self._rsql_parser.parse(rsql_query)
-            else:
-                mongo_query = {}
             logger.info("Searching using query: %s", mongo_query)
-            cursor = self._collection.find(mongo_query).skip(skip).limit(limit)
+            # Sorting by _id keeps pages stable and lets keyset pages use the _id index
+            cursor = (
+                self._collection.find(mongo_query)
+                .sort("_id", 1)
+                .skip(skip)
+                .limit(limit)
+            )
             attacks = []
             async for doc in cursor:
                 attacks.append(self._converter.dict_to_attack(doc))
@@ -95,6 +178,44 @@ class MongoAttackRepository(AttackRepository):
             print(f"Error in find_by_rsql: {e}")
             return []
 
+    async def find_summaries_by_rsql(
+        self,
+        fields: List[str],
+        rsql_query: Optional[str] = None,
+        limit: int = 100,
+        skip: int = 0,
+        after: Optional[str] = None,
+    ) -> List[AttackSummary]:
+        await self.connect()
+        mongo_query = await self._parse_rsql(rsql_query)
+        mongo_query = self._after_query(mongo_query, after)
+        projection = self._converter.summary_projection(fields)
+        logger.info("Searching summaries using query: %s", mongo_query)
+        cursor = (
+            self._collection.find(mongo_query, projection)
+            .sort("_id", 1)
+            .skip(skip)
+            .limit(limit)
+        )
+        return [self._converter.dict_to_attack_summary(doc) async for doc in cursor]
+
+    async def stream_by_rsql(
+        self,
+        rsql_query: Optional[str] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Attack]:
+        await self.connect()
+        mongo_query = await self._parse_rsql(rsql_query)
+        logger.info("Streaming using query: %s", mongo_query)
+        cursor = (
+            self._collection.find(mongo_query).sort("_id", 1).batch_size(batch_size)
+        )
+        try:
+            async for doc in cursor:
+                yield self._converter.dict_to_attack(doc)
+        finally:
+            await cursor.close()
+
     async def save(self, attack: Attack) -> Attack:
         await self.connect()
         attack_dict = self._converter.attack_to_dict(attack, include_id=False)
@@ -106,6 +227,35 @@ class MongoAttackRepository(AttackRepository):
             logger.error(f"Error saving attack: {e}")
             raise ValueError(f"Failed to save attack: {str(e)}")
 
+    async def save_all(self, attacks: List[Attack]) -> BatchResult[Attack]:
+        await self.connect()
+        result = BatchResult[Attack]()
+        if not attacks:
+            return result
+        attack_dicts = [
+            self._converter.attack_to_dict(attack, include_id=False)
+            for attack in attacks
+        ]
+        failed: dict[int, str] = {}
+        try:
+            # insert_many assigns the generated _id to every document
+            await self._collection.insert_many(attack_dicts, ordered=False)
+        except BulkWriteError as e:
+            for write_error in e.details.get("writeErrors", []):
+                failed[write_error["index"]] = write_error.get("errmsg", str(e))
+            logger.error(f"Error saving {len(failed)} of {len(attacks)} attacks")
+        except Exception as e:
+            logger.error(f"Error saving attacks: {e}")
+            raise ValueError(f"Failed to save attacks: {str(e)}")
+
+        for index, (attack, attack_dict) in enumerate(zip(attacks, attack_dicts)):
+            if index in failed:
+                result.errors.append(BatchItemError(index=index, message=failed[index]))
+            else:
+                attack.id = str(attack_dict["_id"])
+                result.content.append(attack)
+        return result
+
     async def update(self, attack: Attack) -> Optional[Attack]:
         await self.connect()
         if not attack.id:
@@ -116,10 +266,107 @@ class MongoAttackRepository(AttackRepository):
             result = await self._collection.replace_one({"_id": object_id}, attack_dict)
             if result.matched_count == 0:
                 return None
+            attack.clear_dirty()
+            return attack
+        except Exception as e:
+            raise ValueError(f"Failed to update attack: {str(e)}")
+
+    async def patch(self, attack: Attack) -> Optional[Attack]:
+        """
+        Update the dirty fields of an attack with $set and $unset, so concurrent
+        updates of different fields, such as two critical rolls, do not
+        overwrite each other
+        """
+        await self.connect()
+        if not attack.id:
+            raise ValueError("Cannot update attack without ID")
+        update, array_filters = self._converter.attack_to_update(
+            attack, attack.dirty_fields()
+        )
+        try:
+            object_id = ObjectId(attack.id)
+            if not update:
+                return attack if await self.exists(attack.id) else None
+            if self._sets_critical_rolls(update):
+                # Fields cannot be set inside a null criticalRolls, only create it
+                # when missing so concurrent critical rolls are kept
+                await self._collection.update_one(
+                    {"_id": object_id, self._converter.CRITICAL_ROLLS_PATH: None},
+                    {"$set": {self._converter.CRITICAL_ROLLS_PATH: {}}},
+                )
+            result = await self._collection.update_one(
+                {"_id": object_id}, update, array_filters=array_filters or None
+            )
+            if result.matched_count == 0:
+                return None
+            attack.clear_dirty()
             return attack
         except Exception as e:
             raise ValueError(f"Failed to update attack: {str(e)}")
 
+    async def update_all(self, attacks: List[Attack]) -> List[Attack]:
+        """
+        Update the dirty fields of several attacks in a single bulk write, like
+        patch. Returns the attacks that still exist, attacks deleted meanwhile
+        are not written.
+        """
+        await self.connect()
+        if not attacks:
+            return []
+        try:
+            updates = [
+                (
+                    attack,
+                    *self._converter.attack_to_update(attack, attack.dirty_fields()),
+                )
+                for attack in attacks
+            ]
+            critical_rolls = self._converter.CRITICAL_ROLLS_PATH
+            created = [
+                UpdateOne(
+                    {"_id": ObjectId(attack.id), critical_rolls: None},
+                    {"$set": {critical_rolls: {}}},
+                )
+                for attack, update, _ in updates
+                if self._sets_critical_rolls(update)
+            ]
+            if created:
+                await self._collection.bulk_write(created, ordered=False)
+            operations = [
+                UpdateOne(
+                    {"_id": ObjectId(attack.id)},
+                    update,
+                    array_filters=array_filters or None,
+                )
+                for attack, update, array_filters in updates
+                if update
+            ]
+            matched_count = 0
+            if operations:
+                result = await self._collection.bulk_write(operations, ordered=False)
+                matched_count = result.matched_count
+            if matched_count == len(attacks):
+                updated = attacks
+            else:
+                # The bulk result only counts matches, find which attacks exist
+                cursor = self._collection.find(
+                    {"_id": {"$in": [ObjectId(attack.id) for attack in attacks]}},
+                    {"_id": 1},
+                )
+                existing = {str(doc["_id"]) async for doc in cursor}
+                updated = [attack for attack in attacks if attack.id in existing]
+            for attack in updated:
+                attack.clear_dirty()
+            return updated
+        except Exception as e:
+            logger.error(f"Error updating attacks: {e}")
+            raise ValueError(f"Failed to update attacks: {str(e)}")
+
+    def _sets_critical_rolls(self, update: dict) -> bool:
+        """Whether an update sets fields inside criticalRolls"""
+        prefix = f"{self._converter.CRITICAL_ROLLS_PATH}."
+        return any(path.startswith(prefix) for path in update.get("$set", {}))
+
     async def delete(self, attack_id: str) -> bool:
         await self.connect()
         try:
@@ -129,6 +376,31 @@ class MongoAttackRepository(AttackRepository):
         except Exception:
             return False
 
+    async def delete_many(
+        self,
+        rsql_query: Optional[str] = None,
+        action_id: Optional[str] = None,
+    ) -> int:
+        """Delete attacks by RSQL query and/or action ID"""
+        await self.connect()
+        filters = []
+        if rsql_query:
+            filters.append(self._rsql_parser.parse(rsql_query))
+        if action_id:
+            filters.append({"actionId": action_id})
+        filters = [query for query in filters if query]
+        if not filters:
+            # Never turn an empty or unparseable filter into a collection wipe
+            raise ValueError("A filter is required to delete attacks")
+        mongo_query = filters[0] if len(filters) == 1 else {"$and": filters}
+        try:
+            logger.info("Deleting using query: %s", mongo_query)
+            result = await self._collection.delete_many(mongo_query)
+            return result.deleted_count
+        except Exception as e:
+            logger.error(f"Error deleting attacks: {e}")
+            raise ValueError(f"Failed to delete attacks: {str(e)}")
+
     async def exists(self, attack_id: str) -> bool:
         await self.connect()
         try:
@@ -141,11 +413,8 @@ class MongoAttackRepository(AttackRepository):
     async def count_by_rsql(self, rsql_query: Optional[str] = None) -> int:
         """Count attacks by RSQL query"""
         await self.connect()
+        mongo_query = await self._parse_rsql(rsql_query)
         try:
-            if rsql_query:
-                mongo_query = self._rsql_parser.parse(rsql_query)
-            else:
-                mongo_query = {}
             count = await self._collection.count_documents(mongo_query)
             return count
         except Exception as e:
@@ -160,6 +429,7 @@ class MongoAttackRepository(AttackRepository):
         status: Optional[str] = None,
         limit: int = 100,
         skip: int = 0,
+        after: Optional[str] = None,
     ) -> List[Attack]:
         await self.connect()
         query = {}
@@ -171,8 +441,9 @@ class MongoAttackRepository(AttackRepository):
             query["target_id"] = target_id
         if status:
             query["status"] = status
+        query = self._after_query(query, after)
 
-        cursor = self._collection.find(query).skip(skip).limit(limit)
+        cursor = self._collection.find(query).sort("_id", 1).skip(skip).limit(limit)
         attacks = []
         async for doc in cursor:
             attacks.append(self._converter.dict_to_attack(doc))
@@ -198,6 +469,10 @@ class MongoAttackRepository(AttackRepository):
 
         return await self._collection.count_documents(query)
 
+    async def estimated_count(self) -> int:
+        await self.connect()
+        return await self._collection.estimated_document_count()
+
     async def find_with_filters(
         self,
         action_id: Optional[str] = None,
@@ -0,0 +1,138 @@
+"""
+Shared MongoDB client.
+A single motor client, and so a single connection pool, is used per process.
+Pool events are counted by a pymongo listener and exposed as metrics.
+"""
+
+import threading
+from typing import Optional
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+
+from app.infrastructure.config.config import settings
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class MongoPoolMetrics(monitoring.ConnectionPoolListener):
+    """Connection pool counters. Pool events are published from driver threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connections_created = 0
+        self.connections_closed = 0
+        self.checkouts = 0
+        self.checkout_failures = 0
+        self.checked_out = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        self.pool_clears = 0
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self.pool_clears += 1
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        with self._lock:
+            self.connections_created += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.connections_closed += 1
+
+    def connection_check_out_started(self, event):
+        with self._lock:
+            self.waiting += 1
+            self.max_waiting = max(self.max_waiting, self.waiting)
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self.waiting -= 1
+            self.checkout_failures += 1
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            self.waiting -= 1
+            self.checkouts += 1
+            self.checked_out += 1
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.checked_out -= 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "maxPoolSize": settings.MONGODB_MAX_POOL_SIZE,
+                "minPoolSize": settings.MONGODB_MIN_POOL_SIZE,
+                "open": self.connections_created - self.connections_closed,
+                "checkedOut": self.checked_out,
+                "waiting": self.waiting,
+                "maxWaiting": self.max_waiting,
+                "checkouts": self.checkouts,
+                "checkoutFailures": self.checkout_failures,
+                "connectionsCreated": self.connections_created,
+                "connectionsClosed": self.connections_closed,
+                "poolClears": self.pool_clears,
+            }
+
+
+_client: Optional[AsyncIOMotorClient] = None
+_pool_metrics: Optional[MongoPoolMetrics] = None
+
+
+def mongo_client_options() -> dict:
+    """Client options built from the pool settings"""
+    options = {
+        "maxPoolSize": settings.MONGODB_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGODB_MIN_POOL_SIZE,
+    }
+    if settings.MONGODB_MAX_IDLE_TIME_MS is not None:
+        options["maxIdleTimeMS"] = settings.MONGODB_MAX_IDLE_TIME_MS
+    if settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS is not None:
+        options["waitQueueTimeoutMS"] = settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS
+    if settings.MONGODB_COMPRESSORS:
+        # pymongo ignores, with a warning, compressors whose library is missing
+        options["compressors"] = settings.MONGODB_COMPRESSORS
+    return options
+
+
+def get_mongo_client() -> AsyncIOMotorClient:
+    """Get the process wide client, creating it on first use"""
+    global _client, _pool_metrics
+    if _client is None:
+        _pool_metrics = MongoPoolMetrics()
+        options = mongo_client_options()
+        logger.info(f"Creating MongoDB client: {options}")
+        _client = AsyncIOMotorClient(
+            settings.MONGODB_URL, event_listeners=[_pool_metrics], **options
+        )
+    return _client
+
+
+def get_pool_metrics() -> Optional[MongoPoolMetrics]:
+    """Pool metrics of the shared client, None before it is created"""
+    return _pool_metrics
+
+
+def close_mongo_client() -> None:
+    """Close the shared client and its connection pool"""
+    global _client, _pool_metrics
+    if _client is not None:
+        _client.close()
+        _client = None
+        _pool_metrics = None
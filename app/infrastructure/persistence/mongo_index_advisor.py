@@ -0,0 +1,280 @@
+"""
+Index advisor for RSQL queries.
+Records the field combinations used by real queries, compares them with the
+indexes of the collection and suggests (or creates) the missing compound indexes.
+"""
+
+import asyncio
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+RANGE_OPERATORS = {"$gt", "$gte", "$lt", "$lte", "$ne", "$nin"}
+
+
+class UnindexedQueryException(ValueError):
+    """Raised when a query would scan a large collection without an index"""
+
+
+@dataclass(frozen=True)
+class QueryShape:
+    """Fields of a query grouped by how an index can serve them"""
+
+    equality: Tuple[str, ...] = ()
+    range: Tuple[str, ...] = ()
+    regex: Tuple[str, ...] = ()
+    # Regex fields starting with ^, which an index can serve as a prefix scan
+    anchored_regex: Tuple[str, ...] = ()
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        return self.equality + self.range + self.regex
+
+    def suggested_index(self) -> List[Tuple[str, int]]:
+        """Compound index following the equality, range, regex order"""
+        return [(field, 1) for field in self.fields]
+
+    def key(self) -> str:
+        parts = [f"eq({','.join(self.equality)})"]
+        if self.range:
+            parts.append(f"range({','.join(self.range)})")
+        if self.regex:
+            parts.append(f"regex({','.join(self.regex)})")
+        return " ".join(parts)
+
+
+def query_shapes(query: Dict[str, Any]) -> List[QueryShape]:
+    """
+    Get the shapes of a MongoDB filter. Every $or branch needs its own index,
+    so each branch gives a separate shape including the fields around it.
+    """
+    equality, ranges, regex, anchored = set(), set(), set(), set()
+    or_branches: List[List[QueryShape]] = []
+
+    def visit(node: Dict[str, Any]) -> None:
+        for field, condition in node.items():
+            if field == "$and":
+                for child in condition:
+                    visit(child)
+            elif field == "$or":
+                or_branches.append(
+                    [shape for child in condition for shape in query_shapes(child)]
+                )
+            elif isinstance(condition, dict) and "$regex" in condition:
+                regex.add(field)
+                if str(condition["$regex"]).startswith("^"):
+                    anchored.add(field)
+            elif isinstance(condition, dict) and RANGE_OPERATORS & condition.keys():
+                ranges.add(field)
+            else:
+                equality.add(field)
+
+    visit(query)
+    base = QueryShape(
+        tuple(sorted(equality)),
+        tuple(sorted(ranges - equality)),
+        tuple(sorted(regex - equality - ranges)),
+        tuple(sorted(anchored)),
+    )
+    shapes = [base]
+    for branches in or_branches:
+        shapes = [_merge(shape, branch) for shape in shapes for branch in branches]
+    return shapes
+
+
+def _merge(first: QueryShape, second: QueryShape) -> QueryShape:
+    equality = set(first.equality) | set(second.equality)
+    ranges = (set(first.range) | set(second.range)) - equality
+    regex = (set(first.regex) | set(second.regex)) - equality - ranges
+    return QueryShape(
+        tuple(sorted(equality)),
+        tuple(sorted(ranges)),
+        tuple(sorted(regex)),
+        tuple(sorted(set(first.anchored_regex) | set(second.anchored_regex))),
+    )
+
+
+class MongoIndexAdvisor:
+    """
+    Tracks query shapes of a collection. check() is called before running a query:
+    it records the shape and reports regex scans without a usable index once the
+    collection is larger than regex_scan_threshold documents. Those scans are
+    only logged and counted unless reject_unindexed is set.
+    """
+
+    def __init__(
+        self,
+        collection,
+        regex_scan_threshold: int = 10000,
+        auto_create: bool = False,
+        auto_create_min_queries: int = 50,
+        metadata_ttl: float = 60.0,
+        max_shapes: int = 256,
+        reject_unindexed: bool = False,
+    ):
+        self._collection = collection
+        self._regex_scan_threshold = regex_scan_threshold
+        self._auto_create = auto_create
+        self._auto_create_min_queries = auto_create_min_queries
+        self._metadata_ttl = metadata_ttl
+        self._max_shapes = max_shapes
+        self._reject_unindexed = reject_unindexed
+        self._reported: set = set()
+        self._shape_counts: Counter = Counter()
+        self._samples: Dict[QueryShape, Dict[str, Any]] = {}
+        self._indexes: Optional[List[List[Tuple[str, int]]]] = None
+        self._document_count = 0
+        self._loaded_at = 0.0
+        self._creating: Dict[QueryShape, asyncio.Task] = {}
+        self.rejected = 0
+
+    async def check(self, query: Dict[str, Any]) -> None:
+        """Record the query, report or reject it when it is an unindexed regex scan"""
+        await self._refresh_metadata()
+        for shape in query_shapes(query):
+            self._record(shape, query)
+            supported = self._is_supported(shape)
+            if (
+                self._auto_create
+                and not supported
+                and self._shape_counts[shape] >= self._auto_create_min_queries
+            ):
+                self._schedule_create(shape)
+            if (
+                shape.regex
+                and not supported
+                and self._document_count > self._regex_scan_threshold
+            ):
+                self.rejected += 1
+                message = (
+                    f"Pattern search on {', '.join(shape.regex)} would scan "
+                    f"{self._document_count} attacks without an index. "
+                    f"Add an indexed filter such as actionId"
+                )
+                if self._reject_unindexed:
+                    raise UnindexedQueryException(message)
+                if shape not in self._reported:
+                    # Logged once per shape, the report counts every query
+                    self._reported.add(shape)
+                    logger.warning(f"{message} ({shape.key()})")
+
+    def _record(self, shape: QueryShape, query: Dict[str, Any]) -> None:
+        if (
+            shape not in self._shape_counts
+            and len(self._shape_counts) >= self._max_shapes
+        ):
+            return
+        self._shape_counts[shape] += 1
+        self._samples.setdefault(shape, query)
+
+    async def _refresh_metadata(self, force: bool = False) -> None:
+        if not force and time.monotonic() - self._loaded_at < self._metadata_ttl:
+            return
+        self._loaded_at = time.monotonic()
+        try:
+            information = await self._collection.index_information()
+            self._indexes = [list(index["key"]) for index in information.values()]
+            self._document_count = await self._collection.estimated_document_count()
+        except Exception as e:
+            logger.warning(f"Error loading index information: {e}")
+
+    def _is_supported(self, shape: QueryShape) -> bool:
+        """Whether an index prefix can serve at least one field of the query"""
+        if self._indexes is None:
+            # Unknown indexes, never reject because of missing metadata
+            return True
+        usable = set(shape.equality) | set(shape.range) | set(shape.anchored_regex)
+        if not usable:
+            return not shape.regex
+        return any(index and index[0][0] in usable for index in self._indexes)
+
+    def _schedule_create(self, shape: QueryShape) -> None:
+        if shape in self._creating:
+            return
+        task = asyncio.create_task(self._create_index(shape))
+        self._creating[shape] = task
+
+    async def _create_index(self, shape: QueryShape) -> Optional[str]:
+        keys = shape.suggested_index()
+        try:
+            start = time.perf_counter()
+            name = await self._collection.create_index(keys, background=True)
+            logger.info(
+                f"Created index {name} for {shape.key()} in "
+                f"{time.perf_counter() - start:.3f}s"
+            )
+            await self._refresh_metadata(force=True)
+            return name
+        except Exception as e:
+            logger.error(f"Error creating index for {shape.key()}: {e}")
+            return None
+
+    async def create_missing_indexes(self, min_queries: int = 1) -> List[str]:
+        """Create the suggested index of every unsupported recorded shape"""
+        await self._refresh_metadata(force=True)
+        created = []
+        for shape, count in self._shape_counts.most_common():
+            if count >= min_queries and shape.fields and not self._is_supported(shape):
+                name = await self._create_index(shape)
+                if name:
+                    created.append(name)
+        return created
+
+    async def report(self, explain: bool = True) -> dict:
+        """Recorded query shapes with the plan chosen by MongoDB for a sample query"""
+        await self._refresh_metadata(force=True)
+        shapes = []
+        for shape, count in self._shape_counts.most_common():
+            entry = {
+                "shape": shape.key(),
+                "queries": count,
+                "indexed": self._is_supported(shape),
+                "suggestedIndex": shape.suggested_index(),
+            }
+            if explain:
+                entry["plan"] = await self._explain(self._samples[shape])
+            shapes.append(entry)
+        return {
+            "documents": self._document_count,
+            "indexes": self._indexes or [],
+            "regexScanThreshold": self._regex_scan_threshold,
+            "rejectUnindexed": self._reject_unindexed,
+            "rejected": self.rejected,
+            "shapes": shapes,
+        }
+
+    async def _explain(self, query: Dict[str, Any]) -> dict:
+        try:
+            explanation = await self._collection.find(query).sort("_id", 1).explain()
+        except Exception as e:
+            return {"error": str(e)}
+        winning_plan = explanation.get("queryPlanner", {}).get("winningPlan", {})
+        stages, index_names = [], []
+        stage = winning_plan
+        while stage:
+            stages.append(stage.get("stage"))
+            if stage.get("indexName"):
+                index_names.append(stage["indexName"])
+            stage = stage.get("inputStage")
+        statistics = explanation.get("executionStats", {})
+        return {
+            "stages": stages,
+            "indexes": index_names,
+            "collectionScan": "COLLSCAN" in stages,
+            "docsExamined": statistics.get("totalDocsExamined"),
+            "returned": statistics.get("nReturned"),
+        }
+
+    def stats(self) -> dict:
+        return {
+            "shapes": len(self._shape_counts),
+            "rejected": self.rejected,
+            "indexesCreating": sum(
+                1 for task in self._creating.values() if not task.done()
+            ),
+        }
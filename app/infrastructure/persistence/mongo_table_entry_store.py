@@ -0,0 +1,48 @@
+"""
+MongoDB store of attack table entries.
+Keeps the last entry received from the Attack Table Service for every lookup,
+so lookups can still be served while the service is unavailable.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Hashable, Optional, Tuple
+
+from app.infrastructure.api.attack_table_snapshot import (
+    table_entry_from_dict,
+    table_entry_to_dict,
+)
+
+
+class MongoTableEntryStore:
+    """Table entries keyed by lookup, e.g. ("attack", table, size, at, roll)"""
+
+    def __init__(self, collection):
+        self._collection = collection
+
+    @staticmethod
+    def _id(key: Tuple[Hashable, ...]) -> str:
+        return "/".join(str(part) for part in key)
+
+    async def get(self, key: Tuple[Hashable, ...]) -> Optional[Tuple[Any, datetime]]:
+        """Get the stored entry and the time it was stored"""
+        document = await self._collection.find_one({"_id": self._id(key)})
+        if document is None:
+            return None
+        updated_at = document["updatedAt"]
+        if updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=timezone.utc)
+        return table_entry_from_dict(document["entry"]), updated_at
+
+    async def put(self, key: Tuple[Hashable, ...], entry: Any) -> None:
+        """Store or replace the entry of a lookup"""
+        await self._collection.replace_one(
+            {"_id": self._id(key)},
+            {
+                "entry": table_entry_to_dict(entry),
+                "updatedAt": datetime.now(timezone.utc),
+            },
+            upsert=True,
+        )
+
+    async def count(self) -> int:
+        return await self._collection.estimated_document_count()
@@ -1,10 +1,17 @@
 """
 RSQL (RESTful Service Query Language) parser for attack queries.
 This module provides functionality to parse RSQL expressions into MongoDB queries.
+
+Queries are tokenized and parsed into a small AST supporting AND (';', '&' or
+'and'), OR (',' or 'or') and parentheses. Compiled MongoDB filters are kept in a
+bounded cache, so repeated queries skip parsing.
 """
 
+import copy
 import re
-from typing import Dict, Any, Optional, Union
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Union
 from enum import Enum
 
 
@@ -22,12 +29,181 @@ class RSQLOperator(Enum):
     LIKE = "=like="
 
 
+class RSQLSyntaxError(ValueError):
+    """Raised when an RSQL query cannot be parsed"""
+
+
+@dataclass(frozen=True)
+class Token:
+    kind: str
+    value: str
+    position: int
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """AST node: selector operator arguments"""
+
+    selector: str
+    operator: str
+    arguments: tuple
+    # True when the arguments were written as a parenthesized list
+    is_list: bool = False
+
+
+@dataclass(frozen=True)
+class Logical:
+    """AST node: AND / OR of child nodes"""
+
+    operator: str
+    children: tuple
+
+
+Node = Union[Comparison, Logical]
+
+AND = "and"
+OR = "or"
+
+TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<ws>\s+)
+    | (?P<lparen>\()
+    | (?P<rparen>\))
+    | (?P<and>;|&)
+    | (?P<or>,)
+    | (?P<operator>==|!=|=[a-z]+=)
+    | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+    | (?P<word>[^\s;,&()"'=!]+)
+    """,
+    re.VERBOSE,
+)
+SELECTOR_PATTERN = re.compile(r"^[A-Za-z_][\w.]*$")
+OPERATORS = {operator.value for operator in RSQLOperator}
+LIST_OPERATORS = {RSQLOperator.IN.value, RSQLOperator.OUT.value}
+
+
+def tokenize(rsql_query: str) -> List[Token]:
+    """Split an RSQL query into tokens"""
+    tokens = []
+    position = 0
+    while position < len(rsql_query):
+        match = TOKEN_PATTERN.match(rsql_query, position)
+        if not match:
+            raise RSQLSyntaxError(
+                f"Unexpected character '{rsql_query[position]}' at {position}"
+            )
+        kind = match.lastgroup
+        if kind != "ws":
+            tokens.append(Token(kind, match.group(), position))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive descent parser building the AST of a token list"""
+
+    def __init__(self, tokens: List[Token], query: str):
+        self._tokens = tokens
+        self._query = query
+        self._index = 0
+
+    def parse(self) -> Node:
+        node = self._or()
+        token = self._peek()
+        if token is not None:
+            raise RSQLSyntaxError(f"Unexpected '{token.value}' at {token.position}")
+        return node
+
+    def _peek(self) -> Optional[Token]:
+        if self._index < len(self._tokens):
+            return self._tokens[self._index]
+        return None
+
+    def _next(self, expected: str) -> Token:
+        token = self._peek()
+        if token is None:
+            raise RSQLSyntaxError(f"Expected {expected} at end of query")
+        self._index += 1
+        return token
+
+    def _accept_logical(self, operator: str) -> bool:
+        token = self._peek()
+        if token is None:
+            return False
+        if token.kind == operator or (
+            token.kind == "word" and token.value.lower() == operator
+        ):
+            self._index += 1
+            return True
+        return False
+
+    def _or(self) -> Node:
+        children = [self._and()]
+        while self._accept_logical(OR):
+            children.append(self._and())
+        return children[0] if len(children) == 1 else Logical(OR, tuple(children))
+
+    def _and(self) -> Node:
+        children = [self._constraint()]
+        while self._accept_logical(AND):
+            children.append(self._constraint())
+        return children[0] if len(children) == 1 else Logical(AND, tuple(children))
+
+    def _constraint(self) -> Node:
+        token = self._next("a comparison")
+        if token.kind == "lparen":
+            node = self._or()
+            closing = self._next("')'")
+            if closing.kind != "rparen":
+                raise RSQLSyntaxError(f"Expected ')' at {closing.position}")
+            return node
+        if token.kind != "word" or not SELECTOR_PATTERN.match(token.value):
+            raise RSQLSyntaxError(
+                f"Invalid selector '{token.value}' at {token.position}"
+            )
+        operator = self._next("an operator")
+        if operator.kind != "operator" or operator.value not in OPERATORS:
+            raise RSQLSyntaxError(
+                f"Invalid operator '{operator.value}' at {operator.position}"
+            )
+        if self._peek() is not None and self._peek().kind == "lparen":
+            self._index += 1
+            arguments = [self._argument()]
+            while self._peek() is not None and self._peek().kind == "or":
+                self._index += 1
+                arguments.append(self._argument())
+            closing = self._next("')'")
+            if closing.kind != "rparen":
+                raise RSQLSyntaxError(f"Expected ')' at {closing.position}")
+            return Comparison(token.value, operator.value, tuple(arguments), True)
+        return Comparison(token.value, operator.value, (self._argument(),))
+
+    def _argument(self) -> str:
+        token = self._next("a value")
+        if token.kind == "word":
+            # Unquoted values may contain spaces, e.g. name==John Smith, up to
+            # the next separator or 'and' / 'or' keyword
+            last = token
+            while (
+                self._peek() is not None
+                and self._peek().kind == "word"
+                and self._peek().value.lower() not in (AND, OR)
+            ):
+                last = self._next("a value")
+            return self._query[token.position : last.position + len(last.value)]
+        if token.kind == "string":
+            return re.sub(r"\\(.)", r"\1", token.value[1:-1])
+        raise RSQLSyntaxError(f"Expected a value at {token.position}")
+
+
 class RSQLParser:
     """Parser for RSQL query expressions"""
 
-    RSQL_PATTERN = (
-        r"(\w+)(==|!=|=gt=|=ge=|=lt=|=le=|=in=|=out=|=like=)(\([^)]+\)|[^;,&|]+)"
-    )
+    CACHE_MAX_SIZE = 1024
+
+    _cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    cache_hits = 0
+    cache_misses = 0
 
     @classmethod
     def parse(cls, rsql_query: Optional[str]) -> Dict[str, Any]:
@@ -38,45 +214,86 @@ class RSQLParser:
         - 'status==DRAFT' -> {'status': 'DRAFT'}
         - 'actionId==action_001;sourceId==source_001' -> {'actionId': 'action_001', 'sourceId': 'source_001'}
         - 'status=in=(DRAFT,APPLIED)' -> {'status': {'$in': ['DRAFT', 'APPLIED']}}
+        - 'status==DRAFT,status==APPLIED' -> {'$or': [{'status': 'DRAFT'}, {'status': 'APPLIED'}]}
+
+        Raises RSQLSyntaxError (a ValueError) when the query is malformed.
         """
 
         if not rsql_query or not rsql_query.strip():
             return {}
 
-        # For now, implement a simple parser that supports basic operations
-        # In a production system, you might want to use a proper RSQL parser library
-
-        query_dict = {}
-
-        # Split by logical AND (semicolon or 'and')
-        and_parts = re.split(r"[;&]|\sand\s", rsql_query)
-
-        for part in and_parts:
-            part = part.strip()
-            if not part:
-                continue
+        key = rsql_query.strip()
+        compiled = cls._cache.get(key)
+        if compiled is not None:
+            cls.cache_hits += 1
+            cls._cache.move_to_end(key)
+        else:
+            cls.cache_misses += 1
+            compiled = cls.compile(cls.parse_ast(key))
+            cls._cache[key] = compiled
+            if len(cls._cache) > cls.CACHE_MAX_SIZE:
+                cls._cache.popitem(last=False)
+        # Callers may extend the filter, the cached one must stay untouched
+        return copy.deepcopy(compiled)
 
-            match = re.match(cls.RSQL_PATTERN, part)
-            if match:
-                field, operator, value = match.groups()
-                field = field.strip()
-                value = value.strip()
+    @classmethod
+    def parse_ast(cls, rsql_query: str) -> Node:
+        """Parse an RSQL query into its AST"""
+        return _Parser(tokenize(rsql_query), rsql_query).parse()
 
-                # Remove quotes if present
-                if (value.startswith('"') and value.endswith('"')) or (
-                    value.startswith("'") and value.endswith("'")
-                ):
-                    value = value[1:-1]
+    @classmethod
+    def compile(cls, node: Node) -> Dict[str, Any]:
+        """Compile an AST into a MongoDB query"""
+        if isinstance(node, Comparison):
+            return cls._convert_to_mongo_query(
+                node.selector, node.operator, list(node.arguments), node.is_list
+            )
+
+        children = []
+        for child in node.children:
+            compiled = cls.compile(child)
+            # Flatten nested operations of the same kind
+            if isinstance(child, Logical) and child.operator == node.operator:
+                children.extend(compiled[f"${node.operator}"])
+            else:
+                children.append(compiled)
+
+        if node.operator == AND:
+            merged: Dict[str, Any] = {}
+            for child in children:
+                if any(key in merged for key in child):
+                    # Repeated keys cannot be merged without losing conditions
+                    return {"$and": children}
+                merged.update(child)
+            return merged
+        return {"$or": children}
 
-                query_dict.update(cls._convert_to_mongo_query(field, operator, value))
+    @classmethod
+    def clear_cache(cls) -> None:
+        cls._cache.clear()
+        cls.cache_hits = 0
+        cls.cache_misses = 0
 
-        return query_dict
+    @classmethod
+    def cache_stats(cls) -> dict:
+        lookups = cls.cache_hits + cls.cache_misses
+        return {
+            "size": len(cls._cache),
+            "maxSize": cls.CACHE_MAX_SIZE,
+            "hits": cls.cache_hits,
+            "misses": cls.cache_misses,
+            "hitRatio": cls.cache_hits / lookups if lookups else 0.0,
+        }
 
     @classmethod
     def _convert_to_mongo_query(
-        cls, field: str, operator: str, value: str
+        cls, field: str, operator: str, values: List[str], is_list: bool = False
     ) -> Dict[str, Any]:
-        """Convert RSQL field-operator-value to MongoDB query"""
+        """Convert RSQL field-operator-values to MongoDB query"""
+
+        if is_list and operator not in LIST_OPERATORS:
+            raise RSQLSyntaxError(f"Operator {operator} does not accept a list")
+        value = values[0]
 
         if operator == RSQLOperator.EQUAL.value:
             return {field: value}
@@ -97,20 +314,10 @@ class RSQLParser:
             return {field: {"$lte": cls._convert_value(value)}}
 
         elif operator == RSQLOperator.IN.value:
-            # Parse comma-separated values: (value1,value2,value3)
-            if value.startswith("(") and value.endswith(")"):
-                values = value[1:-1].split(",")
-                values = [v.strip().strip("\"'") for v in values]
-                return {field: {"$in": values}}
-            return {field: {"$in": [value]}}
+            return {field: {"$in": values}}
 
         elif operator == RSQLOperator.OUT.value:
-            # Parse comma-separated values: (value1,value2,value3)
-            if value.startswith("(") and value.endswith(")"):
-                values = value[1:-1].split(",")
-                values = [v.strip().strip("\"'") for v in values]
-                return {field: {"$nin": values}}
-            return {field: {"$nin": [value]}}
+            return {field: {"$nin": values}}
 
         elif operator == RSQLOperator.LIKE.value:
             # Convert to MongoDB regex
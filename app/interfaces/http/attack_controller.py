@@ -2,17 +2,28 @@
 Attack web controller.
 """
 
-from typing import Optional
+from typing import Optional, Union
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import JSONResponse, StreamingResponse
+from app.domain.entities import CountMode
 from app.infrastructure.dependency_container import container
 from app.infrastructure.logging import log_endpoint, log_errors, get_logger
 from app.interfaces.http.dto import (
     AttackDTO,
+    AttackSummaryDTO,
+    BatchAttacksDTO,
     PagedAttacksDTO,
+    PagedAttackSummariesDTO,
+    PaginationDTO,
     AttackNotFoundDTO,
+    AttackSimulationDTO,
     CreateAttackRequestDTO,
+    CreateAttacksBatchRequestDTO,
+    DeletedAttacksDTO,
+    SimulateAttackRequestDTO,
     UpdateAttackModifiersRequestDTO,
     UpdateAttackRollRequestDTO,
+    UpdateAttackRollsBatchRequestDTO,
     UpdateCriticalRollRequestDTO,
     UpdateFumbleRollRequestDTO,
     UpdateParryRequestDTO,
@@ -25,8 +36,8 @@ router = APIRouter(prefix="/attacks", tags=["Attacks"])
 @router.get(
     "",
     summary="Search attacks by RSQL",
-    description="Search attacks using RSQL query language.",
-    response_model=PagedAttacksDTO,
+    description="Search attacks using RSQL query language. With fields only the requested attack fields are loaded and returned.",
+    response_model=Union[PagedAttacksDTO, PagedAttackSummariesDTO],
 )
 @log_endpoint
 @log_errors
@@ -37,22 +48,105 @@ async def search_attacks_by_rsql(
     ),
     page: int = Query(0, description="Page number (0-based)", ge=0),
     size: int = Query(10, description="Page size", ge=1),
+    after: Optional[str] = Query(
+        None,
+        description="Cursor of the next page (pagination.nextCursor), replaces page",
+    ),
+    count: Optional[CountMode] = Query(
+        None,
+        description="Total count: exact, estimated (unfiltered searches only) or none. Defaults to exact by page and none by cursor",
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma separated attack fields to return (e.g., 'id,status'): id, actionId, sourceId, targetId, status, attackType, roll, rollTotal",
+    ),
 ):
 
-    logger.info(f"Search attacks << search: {search}, page: {page}, size: {size}")
+    logger.info(
+        f"Search attacks << search: {search}, page: {page}, size: {size}, after: {after}"
+    )
     try:
+        summary_fields = AttackSummaryDTO.parse_fields(fields) if fields else None
         use_case = container.get_search_attack_by_rsql_use_case()
         result_page = await use_case.execute(
             rsql_query=search,
             page=page,
             size=size,
+            after=PaginationDTO.decode_cursor(after),
+            count=count,
+            fields=summary_fields,
         )
+        if summary_fields is not None:
+            # Serialized directly so fields that were not requested are left out
+            return JSONResponse(
+                PagedAttackSummariesDTO.from_entity(
+                    result_page, summary_fields
+                ).model_dump(exclude_unset=True)
+            )
         return PagedAttacksDTO.from_entity(result_page)
+    except ValueError as e:
+        logger.warning(f"Validation error listing attacks: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing attacks: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.get(
+    "/export",
+    summary="Export attacks by RSQL",
+    description="Streams every attack matching an RSQL query as newline delimited JSON, without pagination.",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+@log_endpoint
+@log_errors
+async def export_attacks(
+    search: Optional[str] = Query(
+        "",
+        description="RSQL query string for filtering (e.g., 'status==applied;actionId==action_001')",
+    ),
+):
+    """Export attacks as NDJSON"""
+
+    logger.info(f"Export attacks << search: {search}")
+    use_case = container.get_export_attacks_use_case()
+    attacks = use_case.execute(rsql_query=search)
+    try:
+        # Query errors are raised by the first fetch, before the response starts
+        first_attack = await anext(attacks, None)
+    except ValueError as e:
+        logger.warning(f"Validation error exporting attacks: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error exporting attacks: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+    async def lines():
+        # Lines are flushed once per cursor batch so memory stays bounded
+        if first_attack is None:
+            return
+        chunk = [AttackDTO.from_entity(first_attack).model_dump_json()]
+        exported = 0
+        try:
+            async for attack in attacks:
+                if len(chunk) >= use_case.batch_size:
+                    exported += len(chunk)
+                    yield "\n".join(chunk) + "\n"
+                    chunk = []
+                chunk.append(AttackDTO.from_entity(attack).model_dump_json())
+            exported += len(chunk)
+            yield "\n".join(chunk) + "\n"
+            logger.info(f"Exported {exported} attacks")
+        except Exception as e:
+            logger.error(f"Error exporting attacks after {exported}: {str(e)}")
+            raise
+        finally:
+            await attacks.aclose()
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/{attack_id}",
     summary="Get attack by Id",
@@ -106,6 +200,64 @@ async def create_attack(request: CreateAttackRequestDTO):
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.post(
+    ":batch",
+    summary="Create attacks in batch",
+    description="Creates several attacks in a single request. Items that fail are reported without failing the whole batch.",
+    response_model=BatchAttacksDTO,
+    status_code=201,
+)
+@log_endpoint
+@log_errors
+async def create_attacks_batch(request: CreateAttacksBatchRequestDTO):
+    """Create several attacks"""
+    logger.info(f"Creating batch of {len(request.root)} attacks")
+
+    try:
+        command = request.to_command()
+        use_case = container.get_create_attacks_batch_use_case()
+        result = await use_case.execute(command)
+        logger.info(
+            f"Created batch attacks << created: {len(result.content)}, errors: {len(result.errors)}"
+        )
+        return BatchAttacksDTO.from_entity(result)
+
+    except ValueError as e:
+        logger.warning(f"Validation error creating attacks: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error creating attacks: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.post(
+    "/simulate",
+    summary="Simulate attack outcomes",
+    description="Simulates many random rolls of an attack and returns the distribution of hits, misses, damage, critical severities and fumbles. Nothing is stored.",
+    response_model=AttackSimulationDTO,
+)
+@log_endpoint
+@log_errors
+async def simulate_attack(request: SimulateAttackRequestDTO):
+    """Preview the odds of an attack"""
+    logger.info(
+        f"Simulating attack << attackTable: {request.modifiers.attackTable}, samples: {request.samples}"
+    )
+
+    try:
+        command = request.to_command()
+        use_case = container.get_simulate_attack_use_case()
+        simulation = await use_case.execute(command)
+        return AttackSimulationDTO.from_entity(simulation)
+
+    except ValueError as e:
+        logger.warning(f"Validation error simulating attack: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error simulating attack: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
 @router.patch(
     "/{attack_id}",
     summary="Update attack modifiers",
@@ -139,6 +291,39 @@ async def update_attack_modifiers(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.delete(
+    "",
+    summary="Delete attacks by filter",
+    description="Delete every attack matching an RSQL search and/or an action ID. At least one filter is required.",
+    response_model=DeletedAttacksDTO,
+)
+@log_endpoint
+@log_errors
+async def delete_attacks(
+    search: Optional[str] = Query(
+        None, description="RSQL query string (e.g., 'status==APPLIED')"
+    ),
+    actionId: Optional[str] = Query(None, description="Action ID"),
+):
+    """Delete attacks by filter"""
+
+    logger.info(f"Deleting attacks << search: {search}, actionId: {actionId}")
+    try:
+        use_case = container.get_delete_attacks_use_case()
+        deleted_count = await use_case.execute(rsql_query=search, action_id=actionId)
+        logger.info(f"Successfully deleted {deleted_count} attacks")
+        return DeletedAttacksDTO(deletedCount=deleted_count)
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        logger.warning(f"Validation error deleting attacks: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error deleting attacks: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
 @router.delete(
     "/{attack_id}",
     summary="Delete attack by ID",
@@ -238,6 +423,37 @@ async def execute_attack_roll(attack_id: str, request: UpdateAttackRollRequestDT
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.post(
+    "/rolls:batch",
+    summary="Update attack rolls in batch",
+    description="Updates the results of several attacks from their dice rolls in a single request.",
+    response_model=BatchAttacksDTO,
+)
+@log_endpoint
+@log_errors
+async def execute_attack_rolls_batch(request: UpdateAttackRollsBatchRequestDTO):
+    """Applies the result of the dice rolls to several attacks."""
+
+    logger.info(f"Executing batch of {len(request.root)} attack rolls")
+    try:
+        command = request.to_command()
+        use_case = container.get_update_attack_rolls_batch_use_case()
+        result = await use_case.execute(command=command)
+        logger.info(
+            f"Executed batch rolls << updated: {len(result.content)}, errors: {len(result.errors)}"
+        )
+        return BatchAttacksDTO.from_entity(result)
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        logger.warning(f"Validation error executing batch rolls: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error executing batch rolls: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
 @router.patch(
     "/{attack_id}/critical-roll",
     summary="Update critical roll",
@@ -7,13 +7,23 @@ from .attack_result_dto import AttackResultDTO
 from .attack_roll_dto import AttackRollDTO
 from .attack_roll_modifiers_dto import AttackRollModifiersDTO
 from .attack_situational_modifiers_dto import AttackSituationalModifiersDTO
+from .attack_simulation_dto import AttackSimulationDTO
+from .attack_summary_dto import AttackSummaryDTO, PagedAttackSummariesDTO
 from .attack_table_entry_dto import AttackTableEntryDTO
+from .batch_attacks_dto import BatchAttacksDTO, BatchItemErrorDTO
 from .create_attack_request_dto import CreateAttackRequestDTO
+from .create_attacks_batch_request_dto import CreateAttacksBatchRequestDTO
 from .critical_effect_dto import CriticalEffectDTO
+from .deleted_attacks_dto import DeletedAttacksDTO
 from .errors_dto import AttackNotFoundDTO
 from .pagination_dto import PaginationDTO, PagedAttacksDTO
+from .simulate_attack_request_dto import SimulateAttackRequestDTO
 from .update_attack_modifiers_request_dto import UpdateAttackModifiersRequestDTO
 from .update_attack_roll_request_dto import UpdateAttackRollRequestDTO
+from .update_attack_rolls_batch_request_dto import (
+    AttackRollBatchItemDTO,
+    UpdateAttackRollsBatchRequestDTO,
+)
 from .update_critical_roll_request_dto import UpdateCriticalRollRequestDTO
 from .update_fumble_roll_request_dto import UpdateFumbleRollRequestDTO
 from .update_parry_request_dto import UpdateParryRequestDTO
@@ -28,14 +38,24 @@ __all__ = [
     "AttackRollDTO",
     "AttackRollModifiersDTO",
     "AttackSituationalModifiersDTO",
+    "AttackSimulationDTO",
+    "AttackSummaryDTO",
     "AttackTableEntryDTO",
+    "BatchAttacksDTO",
+    "BatchItemErrorDTO",
     "CreateAttackRequestDTO",
+    "CreateAttacksBatchRequestDTO",
     "CriticalEffectDTO",
+    "DeletedAttacksDTO",
     "AttackNotFoundDTO",
     "PaginationDTO",
     "PagedAttacksDTO",
+    "PagedAttackSummariesDTO",
+    "SimulateAttackRequestDTO",
     "UpdateAttackModifiersRequestDTO",
     "UpdateAttackRollRequestDTO",
+    "AttackRollBatchItemDTO",
+    "UpdateAttackRollsBatchRequestDTO",
     "UpdateCriticalRollRequestDTO",
     "UpdateFumbleRollRequestDTO",
     "UpdateParryRequestDTO",
@@ -0,0 +1,55 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.domain.entities import AttackSimulation
+
+
+class AttackSimulationDTO(BaseModel):
+    """DTO for attack simulation results"""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "samples": 100000,
+                "hitRate": 0.62,
+                "missRate": 0.36,
+                "fumbleRate": 0.02,
+                "criticalRate": 0.31,
+                "damageMean": 6.4,
+                "damage": {"0": 0.36, "8": 0.05},
+                "criticalSeverities": {"A": 0.08, "B": 0.07},
+                "rollTotalMean": 101.3,
+            }
+        },
+    )
+
+    samples: int = Field(..., description="Number of simulated rolls")
+    hitRate: float = Field(..., description="Probability of damage or a critical")
+    missRate: float = Field(..., description="Probability of no effect")
+    fumbleRate: float = Field(..., description="Probability of a fumble")
+    criticalRate: float = Field(..., description="Probability of a critical")
+    damageMean: float = Field(
+        ..., description="Expected damage, fumbles count as no damage"
+    )
+    damage: dict[int, float] = Field(
+        ..., description="Probability of each damage value, fumbles excluded"
+    )
+    criticalSeverities: dict[str, float] = Field(
+        ..., description="Probability of each critical severity"
+    )
+    rollTotalMean: float = Field(
+        ..., description="Mean roll total of the rolls that are not fumbles"
+    )
+
+    @classmethod
+    def from_entity(cls, entity: AttackSimulation) -> "AttackSimulationDTO":
+        return cls(
+            samples=entity.samples,
+            hitRate=entity.hit_rate,
+            missRate=entity.miss_rate,
+            fumbleRate=entity.fumble_rate,
+            criticalRate=entity.critical_rate,
+            damageMean=entity.damage_mean,
+            damage=entity.damage,
+            criticalSeverities=entity.critical_severities,
+            rollTotalMean=entity.roll_total_mean,
+        )
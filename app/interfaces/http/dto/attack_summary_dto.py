@@ -0,0 +1,80 @@
+from typing import ClassVar, Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.domain.entities import AttackSummary, Page
+from .pagination_dto import PaginationDTO
+
+
+class AttackSummaryDTO(BaseModel):
+    """DTO for the requested fields of an attack"""
+
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_schema_extra={
+            "example": {"id": "68837ba24b9293ca54e6ff72", "status": "applied"}
+        },
+    )
+
+    # API field name of every AttackSummary field
+    FIELDS: ClassVar[dict[str, str]] = {
+        "id": "id",
+        "actionId": "action_id",
+        "sourceId": "source_id",
+        "targetId": "target_id",
+        "status": "status",
+        "attackType": "attack_type",
+        "roll": "roll",
+        "rollTotal": "roll_total",
+    }
+
+    id: str = Field(..., description="Attack ID")
+    actionId: Optional[str] = Field(None, description="Action ID")
+    sourceId: Optional[str] = Field(None, description="Source ID")
+    targetId: Optional[str] = Field(None, description="Target ID")
+    status: Optional[str] = Field(None, description="Attack status")
+    attackType: Optional[str] = Field(None, description="Attack type")
+    roll: Optional[int] = Field(None, description="Attack roll")
+    rollTotal: Optional[int] = Field(None, description="Attack roll total")
+
+    @classmethod
+    def parse_fields(cls, fields: str) -> list[str]:
+        """Convert a comma separated list of API field names to AttackSummary fields"""
+        names = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = [name for name in names if name not in cls.FIELDS]
+        if unknown:
+            raise ValueError(
+                f"Unknown fields: {', '.join(unknown)}. "
+                f"Allowed fields: {', '.join(cls.FIELDS)}"
+            )
+        return [cls.FIELDS[name] for name in names]
+
+    @classmethod
+    def from_entity(
+        cls, entity: AttackSummary, fields: list[str]
+    ) -> "AttackSummaryDTO":
+        """Build a DTO setting only the id and the requested fields"""
+        values = {"id": entity.id}
+        for name, attribute in cls.FIELDS.items():
+            if attribute in fields:
+                value = getattr(entity, attribute)
+                values[name] = value.value if hasattr(value, "value") else value
+        return cls(**values)
+
+
+class PagedAttackSummariesDTO(BaseModel):
+    """DTO for paginated attack summaries"""
+
+    model_config = ConfigDict(use_enum_values=True)
+
+    content: list[AttackSummaryDTO] = Field(..., description="List of attacks")
+    pagination: PaginationDTO = Field(..., description="Pagination metadata")
+
+    @classmethod
+    def from_entity(cls, entity: Page, fields: list[str]) -> "PagedAttackSummariesDTO":
+        return cls(
+            content=[
+                AttackSummaryDTO.from_entity(summary, fields)
+                for summary in entity.content
+            ],
+            pagination=PaginationDTO.from_entity(entity.pagination),
+        )
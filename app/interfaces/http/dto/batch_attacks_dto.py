@@ -0,0 +1,39 @@
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.domain.entities import BatchItemError, BatchResult
+from .attack_dto import AttackDTO
+
+
+class BatchItemErrorDTO(BaseModel):
+    """DTO for the error of a single batch item"""
+
+    model_config = ConfigDict(use_enum_values=True)
+
+    index: int = Field(..., description="Position of the item in the request")
+    attackId: Optional[str] = Field(None, description="Attack ID")
+    message: str = Field(..., description="Error message")
+
+    @classmethod
+    def from_entity(cls, entity: BatchItemError) -> "BatchItemErrorDTO":
+        return cls(
+            index=entity.index,
+            attackId=entity.attack_id,
+            message=entity.message,
+        )
+
+
+class BatchAttacksDTO(BaseModel):
+    """DTO for batch operation results"""
+
+    model_config = ConfigDict(use_enum_values=True)
+
+    content: list[AttackDTO] = Field(..., description="Processed attacks")
+    errors: list[BatchItemErrorDTO] = Field(..., description="Items that failed")
+
+    @classmethod
+    def from_entity(cls, entity: BatchResult) -> "BatchAttacksDTO":
+        return cls(
+            content=[AttackDTO.from_entity(attack) for attack in entity.content],
+            errors=[BatchItemErrorDTO.from_entity(error) for error in entity.errors],
+        )
@@ -0,0 +1,38 @@
+from typing import Any, Optional, TypeVar
+
+from pydantic import TypeAdapter, ValidationError
+
+from app.domain.entities import BatchItemError
+
+T = TypeVar("T")
+
+
+def validation_error_message(error: ValidationError) -> str:
+    """Single line message with the location of each validation error"""
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in detail['loc'])}: {detail['msg']}"
+        if detail["loc"]
+        else detail["msg"]
+        for detail in error.errors()
+    )
+
+
+def validate_batch_items(
+    adapter: TypeAdapter[T], items: list[Any]
+) -> tuple[list[Optional[T]], list[BatchItemError]]:
+    """
+    Validate the items of a batch request one by one, so a malformed item is
+    reported at its index instead of rejecting the whole request.
+    Invalid items are replaced by None.
+    """
+    validated: list[Optional[T]] = []
+    errors: list[BatchItemError] = []
+    for index, item in enumerate(items):
+        try:
+            validated.append(adapter.validate_python(item))
+        except ValidationError as e:
+            validated.append(None)
+            errors.append(
+                BatchItemError(index=index, message=validation_error_message(e))
+            )
+    return validated, errors
@@ -0,0 +1,58 @@
+from typing import Any
+
+from pydantic import ConfigDict, RootModel, TypeAdapter
+
+from app.application.commands import CreateAttacksBatchCommand
+from app.domain.entities import BatchItemError
+from .batch_request_items import validate_batch_items
+from .create_attack_request_dto import CreateAttackRequestDTO
+
+_ITEM_ADAPTER = TypeAdapter(CreateAttackRequestDTO)
+
+
+class CreateAttacksBatchRequestDTO(RootModel[list[Any]]):
+    """
+    DTO for create attacks batch request. Items are validated one by one when
+    converting to the command, see validate_batch_items.
+    """
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": [
+                {
+                    "actionId": "action_001",
+                    "sourceId": "character_001",
+                    "targetId": "character_002",
+                    "modifiers": {
+                        "attackType": "melee",
+                        "rollModifiers": {"bo": 96, "bd": -11},
+                    },
+                },
+                {
+                    "actionId": "action_001",
+                    "sourceId": "character_001",
+                    "targetId": "character_003",
+                    "modifiers": {
+                        "attackType": "melee",
+                        "rollModifiers": {"bo": 96, "bd": -20},
+                    },
+                },
+            ]
+        },
+    )
+
+    def to_command(self) -> CreateAttacksBatchCommand:
+        """Convert to command, recording the items that cannot be converted."""
+        items, errors = validate_batch_items(_ITEM_ADAPTER, self.root)
+        command = CreateAttacksBatchCommand(attacks=[], errors=errors)
+        for index, item in enumerate(items):
+            if item is None:
+                command.attacks.append(None)
+                continue
+            try:
+                command.attacks.append(item.to_command())
+            except ValueError as e:
+                command.attacks.append(None)
+                command.errors.append(BatchItemError(index=index, message=str(e)))
+        command.errors.sort(key=lambda error: error.index)
+        return command
@@ -0,0 +1,11 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class DeletedAttacksDTO(BaseModel):
+    """DTO for bulk delete results"""
+
+    model_config = ConfigDict(
+        json_schema_extra={"example": {"deletedCount": 12}},
+    )
+
+    deletedCount: int = Field(..., description="Number of deleted attacks")
@@ -1,3 +1,8 @@
+import base64
+import binascii
+import json
+from typing import Optional
+
 from pydantic import BaseModel, ConfigDict, Field
 from app.domain.entities import Page, Pagination
 from .attack_dto import AttackDTO
@@ -10,8 +15,18 @@ class PaginationDTO(BaseModel):
 
     page: int = Field(..., description="Current page number (0-based)")
     size: int = Field(..., description="Page size")
-    totalElements: int = Field(..., description="Total number of elements")
-    totalPages: int = Field(..., description="Total number of pages")
+    totalElements: Optional[int] = Field(
+        None, description="Total number of elements, absent when not counted"
+    )
+    totalPages: Optional[int] = Field(
+        None, description="Total number of pages, absent when not counted"
+    )
+    totalExact: bool = Field(
+        True, description="Whether totals are exact rather than estimated"
+    )
+    nextCursor: Optional[str] = Field(
+        None, description="Opaque cursor of the next page, absent on the last page"
+    )
 
     @classmethod
     def from_entity(cls, entity: Pagination) -> "PaginationDTO":
@@ -20,8 +35,30 @@ class PaginationDTO(BaseModel):
             size=entity.size,
             totalElements=entity.total_elements,
             totalPages=entity.total_pages,
+            totalExact=entity.total_exact,
+            nextCursor=cls.encode_cursor(entity.next_after),
         )
 
+    @staticmethod
+    def encode_cursor(after: Optional[str]) -> Optional[str]:
+        """Encode the keyset position of a page as an opaque cursor"""
+        if after is None:
+            return None
+        payload = json.dumps({"id": after}, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: Optional[str]) -> Optional[str]:
+        """Decode an opaque cursor, raising ValueError when it is malformed"""
+        if not cursor:
+            return None
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            return str(payload["id"])
+        except (binascii.Error, ValueError, KeyError, TypeError):
+            raise ValueError(f"Invalid cursor: {cursor}")
+
 
 class PagedAttacksDTO(BaseModel):
     """DTO for paginated attack results"""
@@ -0,0 +1,53 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.application.commands import MAX_SIMULATION_SAMPLES, SimulateAttackCommand
+from .attack_modifiers_dto import AttackModifiersDTO
+
+
+class SimulateAttackRequestDTO(BaseModel):
+    """DTO for simulate attack request"""
+
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_schema_extra={
+            "example": {
+                "modifiers": {
+                    "attackType": "melee",
+                    "attackTable": "arming-sword",
+                    "attackSize": "medium",
+                    "fumbleTable": "melee-one-hand",
+                    "at": 1,
+                    "actionPoints": 4,
+                    "fumble": 2,
+                    "rollModifiers": {"bo": 80, "bd": 30},
+                    "situationalModifiers": {},
+                },
+                "samples": 100000,
+            }
+        },
+    )
+
+    modifiers: AttackModifiersDTO = Field(
+        ..., description="Attack modifiers including type and bonuses"
+    )
+    samples: int = Field(
+        10000,
+        description="Number of simulated rolls",
+        ge=1,
+        le=MAX_SIMULATION_SAMPLES,
+    )
+    openEnded: bool = Field(True, description="Simulate open-ended d100 rolls")
+    seed: Optional[int] = Field(
+        None, description="Random seed to reproduce a simulation"
+    )
+
+    def to_command(self) -> SimulateAttackCommand:
+        """Convert to command for use in application layer."""
+        return SimulateAttackCommand(
+            modifiers=self.modifiers.to_entity(),
+            samples=self.samples,
+            open_ended=self.openEnded,
+            seed=self.seed,
+        )
@@ -0,0 +1,50 @@
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, RootModel, TypeAdapter
+
+from app.application.commands import (
+    UpdateAttackRollCommand,
+    UpdateAttackRollsBatchCommand,
+)
+from .batch_request_items import validate_batch_items
+
+
+class AttackRollBatchItemDTO(BaseModel):
+    """DTO for a single roll of a batch"""
+
+    attackId: str = Field(..., description="Attack ID")
+    roll: int = Field(..., description="Roll value to apply to the attack")
+
+
+_ITEM_ADAPTER = TypeAdapter(AttackRollBatchItemDTO)
+
+
+class UpdateAttackRollsBatchRequestDTO(RootModel[list[Any]]):
+    """
+    DTO for update attack rolls batch request. Items are validated one by one
+    when converting to the command, see validate_batch_items.
+    """
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": [
+                {"attackId": "68837ba24b9293ca54e6ff72", "roll": 55},
+                {"attackId": "68837ba24b9293ca54e6ff73", "roll": 87},
+            ]
+        },
+    )
+
+    def to_command(self) -> UpdateAttackRollsBatchCommand:
+        """Convert to command, recording the items that cannot be converted."""
+        items, errors = validate_batch_items(_ITEM_ADAPTER, self.root)
+        return UpdateAttackRollsBatchCommand(
+            rolls=[
+                (
+                    UpdateAttackRollCommand(attack_id=item.attackId, roll=item.roll)
+                    if item is not None
+                    else None
+                )
+                for item in items
+            ],
+            errors=errors,
+        )
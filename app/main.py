@@ -1,8 +1,10 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from app.infrastructure.config.config import settings
 from app.infrastructure.dependency_container import container
 from app.infrastructure.logging import setup_logging, get_logger
+from app.infrastructure.persistence import get_pool_metrics
+from app.infrastructure.persistence.rsql_parser import RSQLParser
 from app.interfaces.http.attack_controller import router as attack_router
 
 setup_logging(
@@ -81,3 +83,41 @@ async def health_check():
             else settings.MONGODB_URL
         ),
     }
+
+
+@app.get("/metrics")
+async def metrics():
+    """
+    Runtime metrics of the application components
+    """
+    attack_table_service = container.get_attack_table_service()
+    return {
+        "attackTables": (
+            attack_table_service.stats()
+            if hasattr(attack_table_service, "stats")
+            else None
+        ),
+        "rsqlCache": RSQLParser.cache_stats(),
+        "indexAdvisor": (
+            container.get_index_advisor().stats()
+            if container.get_index_advisor()
+            else None
+        ),
+        "mongoPool": get_pool_metrics().stats() if get_pool_metrics() else None,
+        "calculation": (
+            container.get_calculation_executor().stats()
+            if container.get_calculation_executor()
+            else None
+        ),
+    }
+
+
+@app.get("/indexes")
+async def index_report(explain: bool = True):
+    """
+    Query shapes used by RSQL searches compared with the attack collection indexes
+    """
+    index_advisor = container.get_index_advisor()
+    if index_advisor is None:
+        raise HTTPException(status_code=404, detail="Index advisor is disabled")
+    return await index_advisor.report(explain=explain)
@@ -0,0 +1,80 @@
+"""
+Throughput of AttackCalculator.calculate_many compared with calculate_attack.
+Attacks are calculated without attack table client, so only the calculation
+itself is measured. Attacks are processed in chunks of at most 100k, sharing
+the modifiers of 1000 random templates to bound memory. The cyclic garbage
+collector is paused while calculating, otherwise collections triggered by the
+allocations rescan every live attack and dominate the time of large chunks.
+
+Usage: python -m benchmarks.calculate_many_benchmark [sizes]
+       e.g. python -m benchmarks.calculate_many_benchmark 10000,100000,1000000
+"""
+
+import asyncio
+import copy
+import gc
+import random
+import sys
+import time
+
+from app.domain.entities import AttackRoll
+from app.domain.services import AttackCalculator
+from tests.test_attack_roll_modifiers import random_attack
+
+CHUNK_SIZE = 100_000
+TEMPLATES = 1000
+
+
+def templates() -> list:
+    rng = random.Random(42)
+    attacks = []
+    for _ in range(TEMPLATES):
+        attack = random_attack(rng)
+        attack.roll = AttackRoll(roll=rng.randint(1, 100))
+        attacks.append(attack)
+    return attacks
+
+
+def chunk(pool: list, size: int) -> list:
+    return [copy.copy(pool[index % len(pool)]) for index in range(size)]
+
+
+async def throughput(pool: list, size: int, calculate) -> float:
+    """Attacks per second calculating size attacks in chunks"""
+    attacks = chunk(pool, min(size, CHUNK_SIZE))
+    elapsed = 0.0
+    remaining = size
+    while remaining > 0:
+        batch = attacks[:remaining]
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            await calculate(batch)
+            elapsed += time.perf_counter() - start
+        finally:
+            gc.enable()
+        remaining -= len(batch)
+    return size / elapsed
+
+
+async def main(sizes: list[int]) -> None:
+    pool = templates()
+    calculator = AttackCalculator()
+
+    async def scalar(attacks: list) -> None:
+        for attack in attacks:
+            await calculator.calculate_attack(attack)
+
+    for size in sizes:
+        scalar_rate = await throughput(pool, size, scalar)
+        vectorized_rate = await throughput(pool, size, calculator.calculate_many)
+        print(
+            f"{size:>9,} attacks: calculate_attack {scalar_rate:>9,.0f}/s, "
+            f"calculate_many {vectorized_rate:>9,.0f}/s, "
+            f"{vectorized_rate / scalar_rate:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    arguments = sys.argv[1] if len(sys.argv) > 1 else "10000,100000,1000000"
+    asyncio.run(main([int(size) for size in arguments.split(",")]))
@@ -0,0 +1,46 @@
+"""
+Micro-benchmark of the attack roll modifiers calculation.
+Compares the table-driven implementation with the reference implementation it
+replaced.
+
+Usage: python -m benchmarks.roll_modifiers_benchmark [attacks] [repeat]
+"""
+
+import random
+import sys
+import timeit
+
+from app.domain.services import AttackCalculator
+from tests.roll_modifiers_reference import ReferenceRollModifiers
+from tests.test_attack_roll_modifiers import random_attack
+
+
+def run(attacks: int = 10000, repeat: int = 5) -> dict:
+    rng = random.Random(42)
+    samples = [random_attack(rng) for _ in range(attacks)]
+    calculator = AttackCalculator()
+    reference = ReferenceRollModifiers()
+
+    def measure(implementation) -> float:
+        def calculate():
+            for attack in samples:
+                calculator.initialize_attack_calculations(attack)
+                implementation.calculate_attack_roll_modifiers(attack)
+
+        best = min(timeit.repeat(calculate, number=1, repeat=repeat))
+        return best / attacks * 1e6
+
+    results = {
+        "reference": measure(reference),
+        "table-driven": measure(calculator),
+    }
+    results["speedup"] = results["reference"] / results["table-driven"]
+    return results
+
+
+if __name__ == "__main__":
+    arguments = [int(argument) for argument in sys.argv[1:3]]
+    results = run(*arguments)
+    print(f"reference:    {results['reference']:.2f} us/attack")
+    print(f"table-driven: {results['table-driven']:.2f} us/attack")
+    print(f"speedup:      {results['speedup']:.2f}x")
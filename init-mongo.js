@@ -87,10 +87,13 @@ db.createCollection('criticals', {
 });
 
 // Create indexes for better performance
+// The API also creates the attack indexes at startup (RMU_MONGO_ENSURE_INDEXES)
 db.attacks.createIndex({ actionId: 1 });
 db.attacks.createIndex({ sourceId: 1 });
 db.attacks.createIndex({ targetId: 1 });
 db.attacks.createIndex({ status: 1 });
+db.attacks.createIndex({ actionId: 1, status: 1 });
+db.attacks.createIndex({ sourceId: 1, targetId: 1 });
 db.attacks.createIndex({ actionId: 1, sourceId: 1, targetId: 1 });
 
 db.criticals.createIndex({ type: 1 });
@@ -0,0 +1,191 @@
+"""
+Tests for the vectorized AttackCalculator.calculate_many.
+"""
+
+import copy
+import random
+
+import pytest
+
+from app.application.ports import (
+    AttackTableClient,
+    ATTACK_TABLE_MIN_ROLL,
+    ATTACK_TABLE_MAX_ROLL,
+)
+from app.domain.entities import AttackRoll, AttackTableEntry
+from app.domain.entities.enums import AttackStatus
+from app.domain.services import AttackCalculator
+from tests.test_attack_roll_modifiers import random_attack
+
+TABLES = ["arming-sword", "short-bow", "broken"]
+
+
+class FakeTableClient(AttackTableClient):
+    """Deterministic tables, 'broken' fails like an unavailable API"""
+
+    def __init__(self):
+        self.entry_calls = 0
+        self.row_calls = 0
+
+    async def get_attack_table_entry(self, attack_table, size, roll, at):
+        self.entry_calls += 1
+        if attack_table == "broken":
+            raise Exception("Attack table API unavailable")
+        # Rolls out of the table are adjusted as the table clients do
+        roll = min(ATTACK_TABLE_MAX_ROLL, max(roll, ATTACK_TABLE_MIN_ROLL))
+        if roll < 70:
+            return AttackTableEntry(text="0", damage=0)
+        damage = roll // 10 + len(attack_table) - at
+        return AttackTableEntry(
+            text=f"{damage}{'ABCDE'[roll % 5]}",
+            damage=damage,
+            critical_type="S" if roll > 90 else None,
+            critical_severity="ABCDE"[roll % 5] if roll > 90 else None,
+        )
+
+    async def get_attack_table_row(self, attack_table, size, at):
+        self.row_calls += 1
+        return await super().get_attack_table_row(attack_table, size, at)
+
+    async def get_critical_table_entry(self, critical_type, critical_severity, roll):
+        raise NotImplementedError
+
+    async def get_fumble_table_entry(self, fumble_table, roll):
+        raise NotImplementedError
+
+
+def random_attacks(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    attacks = []
+    for _ in range(count):
+        attack = random_attack(rng)
+        attack.roll = AttackRoll(roll=rng.randint(1, 150))
+        attack.modifiers.attack_table = rng.choice(TABLES)
+        attack.modifiers.at = rng.randint(1, 3)
+        attack.modifiers.fumble = rng.randint(0, 3)
+        attacks.append(attack)
+    return attacks
+
+
+class TestCalculateMany:
+    """Test cases for AttackCalculator.calculate_many"""
+
+    @pytest.mark.asyncio
+    async def test_same_results_as_calculate_attack(self):
+        attacks = random_attacks(2000, seed=7)
+        expected = copy.deepcopy(attacks)
+        scalar = AttackCalculator(attack_table_client=FakeTableClient())
+        for attack in expected:
+            await scalar.calculate_attack(attack)
+
+        table_client = FakeTableClient()
+        await AttackCalculator(attack_table_client=table_client).calculate_many(attacks)
+
+        for attack, scalar_attack in zip(attacks, expected):
+            assert attack.calculated == scalar_attack.calculated
+            assert attack.results == scalar_attack.results
+            assert attack.status == scalar_attack.status
+        # One row per table and AT
+        assert table_client.row_calls == len(TABLES) * 3
+
+    @pytest.mark.asyncio
+    async def test_absolute_hit_bonus(self):
+        attack = random_attacks(1, seed=1)[0]
+        attack.modifiers.fumble = 0
+        attack.roll = AttackRoll(roll=100)
+        attack.modifiers.roll_modifiers.bo = 200
+        calculator = AttackCalculator()
+
+        await calculator.calculate_many([attack])
+        roll_total = attack.calculated.roll_total
+
+        assert roll_total > 175
+        assert attack.calculated.critical_total == -(-(roll_total - 175) // 5)
+
+    @pytest.mark.asyncio
+    async def test_written_values_are_python_ints(self):
+        attack = random_attacks(1, seed=3)[0]
+        attack.modifiers.fumble = 0
+
+        await AttackCalculator().calculate_many([attack])
+
+        assert type(attack.calculated.roll_total) is int
+        assert all(
+            type(entry.value) is int for entry in attack.calculated.roll_modifiers
+        )
+
+    @pytest.mark.asyncio
+    async def test_invalid_attack(self):
+        attacks = random_attacks(2, seed=5)
+        attacks[1].roll = None
+
+        with pytest.raises(ValueError):
+            await AttackCalculator().calculate_many(attacks)
+
+    @pytest.mark.asyncio
+    async def test_invalid_critical_severity_fails_only_its_attacks(self):
+        class InvalidSeverityTableClient(FakeTableClient):
+            async def get_attack_table_entry(self, attack_table, size, roll, at):
+                entry = await super().get_attack_table_entry(
+                    attack_table, size, roll, at
+                )
+                if attack_table == "short-bow" and entry.critical_type:
+                    entry.critical_severity = "X"
+                return entry
+
+        attacks = random_attacks(300, seed=11)
+        expected = copy.deepcopy(attacks)
+        scalar = AttackCalculator(attack_table_client=FakeTableClient())
+        for attack in expected:
+            await scalar.calculate_attack(attack)
+
+        errors = await AttackCalculator(
+            attack_table_client=InvalidSeverityTableClient()
+        ).calculate_many(attacks)
+
+        failed = 0
+        for attack, scalar_attack, error in zip(attacks, expected, errors):
+            entry = attack.results.attack_table_entry
+            if entry and entry.critical_severity == "X":
+                failed += 1
+                assert attack.status == AttackStatus.FAILED
+                assert attack.results.criticals == []
+                assert isinstance(error, ValueError)
+            elif scalar_attack.status == AttackStatus.FAILED:
+                assert attack.status == AttackStatus.FAILED
+                assert error is not None
+            else:
+                assert error is None
+                assert attack.results == scalar_attack.results
+                assert attack.status == scalar_attack.status
+        assert 0 < failed < len(attacks)
+
+    @pytest.mark.asyncio
+    async def test_unreadable_table_fails_its_attacks(self):
+        attacks = random_attacks(300, seed=13)
+        for attack in attacks:
+            attack.modifiers.fumble = 0
+
+        errors = await AttackCalculator(
+            attack_table_client=FakeTableClient()
+        ).calculate_many(attacks)
+
+        broken = [
+            (attack, error)
+            for attack, error in zip(attacks, errors)
+            if attack.modifiers.attack_table == "broken"
+        ]
+        assert broken
+        for attack, error in broken:
+            assert attack.status == AttackStatus.FAILED
+            assert attack.results.attack_table_entry is None
+            assert str(error) == "Attack table API unavailable"
+        assert all(
+            error is None
+            for attack, error in zip(attacks, errors)
+            if attack.modifiers.attack_table != "broken"
+        )
+
+    @pytest.mark.asyncio
+    async def test_empty(self):
+        await AttackCalculator().calculate_many([])
@@ -0,0 +1,93 @@
+"""
+Tests for the precomputed attack outcome tables.
+"""
+
+import pytest
+
+from app.domain.entities import (
+    Attack,
+    AttackModifiers,
+    AttackResult,
+    AttackRollModifiers,
+    AttackTableEntry,
+)
+from app.domain.entities.enums import AttackStatus, AttackType, CriticalStatus
+from app.domain.services import AttackCalculator
+from app.domain.services.attack_outcome_table import AttackOutcomeTable
+
+
+def row_with(**entries: AttackTableEntry) -> list[AttackTableEntry]:
+    """Row of 175 misses with the given entries by roll, e.g. r100=entry"""
+    row = [AttackTableEntry(text="0", damage=0) for _ in range(175)]
+    for roll, entry in entries.items():
+        row[int(roll[1:]) - 1] = entry
+    return row
+
+
+class TestAttackOutcomeTable:
+    """Test cases for AttackOutcomeTable"""
+
+    def test_roll_totals_are_adjusted_to_the_table(self):
+        first = AttackTableEntry(text="1", damage=1)
+        last = AttackTableEntry(text="20", damage=20)
+        table = AttackOutcomeTable.from_row(row_with(r1=first, r175=last))
+
+        assert table.outcome(-40).entry == first
+        assert table.outcome(1).entry == first
+        assert table.outcome(175).entry == last
+        assert table.outcome(260).entry == last
+
+    def test_criticals_are_copied_from_templates(self):
+        entry = AttackTableEntry(
+            text="12IS", damage=12, critical_type="S", critical_severity="I"
+        )
+        outcome = AttackOutcomeTable.from_row(row_with(r150=entry)).outcome(150)
+
+        criticals = outcome.create_criticals()
+        criticals[0].adjusted_roll = 80
+
+        assert [(c.key, c.critical_severity) for c in criticals] == [
+            ("s_e_1", "E"),
+            ("s_c_2", "C"),
+            ("s_a_3", "A"),
+        ]
+        assert all(c.status == CriticalStatus.PENDING_CRITICAL_ROLL for c in criticals)
+        assert outcome.create_criticals()[0].adjusted_roll is None
+        assert outcome.create_entry() == entry
+        assert outcome.create_entry() is not entry
+
+    def test_unknown_severity_fails_only_when_reached(self):
+        entry = AttackTableEntry(
+            text="12XS", damage=12, critical_type="S", critical_severity="X"
+        )
+        table = AttackOutcomeTable.from_row(row_with(r170=entry))
+
+        assert table.outcome(100).create_criticals() == []
+        with pytest.raises(ValueError, match="Invalid critical severity: X"):
+            table.outcome(170).create_criticals()
+
+    def test_create_critical_results_uses_the_same_criticals(self):
+        entry = AttackTableEntry(
+            text="9JK", damage=9, critical_type="K", critical_severity="J"
+        )
+        attack = Attack(
+            id="attack_001",
+            action_id="action_001",
+            source_id="source_001",
+            target_id="target_001",
+            status=AttackStatus.PENDING_ATTACK_ROLL,
+            modifiers=AttackModifiers(
+                attack_type=AttackType.MELEE,
+                attack_table="arming-sword",
+                roll_modifiers=AttackRollModifiers(),
+            ),
+            results=AttackResult(attack_table_entry=entry, criticals=[]),
+        )
+
+        AttackCalculator().create_critical_results(attack)
+
+        assert attack.results.criticals == (
+            AttackOutcomeTable.from_row(row_with(r90=entry))
+            .outcome(90)
+            .create_criticals()
+        )
@@ -0,0 +1,180 @@
+"""
+Tests for the incremental recalculation of attacks after modifier changes.
+"""
+
+import copy
+import random
+
+import pytest
+
+from app.domain.entities import AttackRoll
+from app.domain.entities.enums import AttackStatus, CriticalStatus
+from app.domain.services import AttackCalculator
+from app.domain.services.attack_recalculation import (
+    CalculationStage,
+    affected_stages,
+    changed_modifiers,
+)
+from tests.test_attack_calculate_many import TABLES, FakeTableClient
+from tests.test_attack_roll_modifiers import random_attack
+
+
+def random_change(rng: random.Random, attack) -> None:
+    modifiers = attack.modifiers
+    change = rng.choice(
+        ["parry", "bo", "size_difference", "disabled_parry", "table", "at", "fumble"]
+    )
+    if change == "parry":
+        modifiers.roll_modifiers.parry = rng.randint(0, 60)
+    elif change == "bo":
+        modifiers.roll_modifiers.bo = rng.randint(0, 200)
+    elif change == "size_difference":
+        modifiers.situational_modifiers.size_difference = rng.randint(-3, 3)
+    elif change == "disabled_parry":
+        modifiers.situational_modifiers.disabled_parry = rng.random() < 0.5
+    elif change == "table":
+        modifiers.attack_table = rng.choice(TABLES)
+    elif change == "at":
+        modifiers.at = rng.randint(1, 3)
+    else:
+        modifiers.fumble = rng.randint(0, 3)
+
+
+async def calculated_attack(seed: int):
+    rng = random.Random(seed)
+    attack = random_attack(rng)
+    attack.roll = AttackRoll(roll=rng.randint(1, 150))
+    attack.modifiers.attack_table = rng.choice(TABLES[:2])
+    attack.modifiers.fumble = 0
+    await AttackCalculator(attack_table_client=FakeTableClient()).calculate_attack(
+        attack
+    )
+    return attack
+
+
+class TestAffectedStages:
+    """Test cases for the modifier dependencies"""
+
+    def test_changed_modifiers_are_nested(self):
+        attack = random_attack(random.Random(1))
+        previous = copy.deepcopy(attack.modifiers)
+        attack.modifiers.roll_modifiers.parry += 10
+        attack.modifiers.situational_modifiers.size_difference += 1
+        attack.modifiers.at += 1
+
+        assert changed_modifiers(previous, attack.modifiers) == {
+            "roll_modifiers.parry",
+            "situational_modifiers.size_difference",
+            "at",
+        }
+
+    def test_stages_of_modifiers(self):
+        assert affected_stages({"roll_modifiers.parry"}) == CalculationStage.ROLL
+        assert affected_stages({"at", "attack_size"}) == CalculationStage.ATTACK_TABLE
+        assert affected_stages({"situational_modifiers.size_difference"}) == (
+            CalculationStage.ROLL | CalculationStage.CRITICAL_SEVERITY
+        )
+        assert affected_stages({"action_points"}) == CalculationStage.NONE
+        assert affected_stages({"unknown"}) == CalculationStage.ALL
+
+
+class TestRecalculateAttack:
+    """Test cases for AttackCalculator.recalculate_attack"""
+
+    @pytest.mark.asyncio
+    async def test_same_results_as_calculate_attack(self):
+        rng = random.Random(17)
+        skipped_lookups = 0
+        for seed in range(300):
+            attack = await calculated_attack(seed)
+            previous = copy.deepcopy(attack.modifiers)
+            random_change(rng, attack)
+            expected = copy.deepcopy(attack)
+            await AttackCalculator(
+                attack_table_client=FakeTableClient()
+            ).calculate_attack(expected)
+
+            table_client = FakeTableClient()
+            await AttackCalculator(attack_table_client=table_client).recalculate_attack(
+                attack, previous
+            )
+
+            assert attack.calculated == expected.calculated
+            assert attack.results == expected.results
+            assert attack.status == expected.status
+            skipped_lookups += table_client.entry_calls == 0
+        assert skipped_lookups > 50
+
+    @pytest.mark.asyncio
+    async def test_table_is_not_read_when_the_row_does_not_change(self):
+        attack = await calculated_attack(3)
+        attack.modifiers.situational_modifiers.disabled_parry = True
+        await AttackCalculator(attack_table_client=FakeTableClient()).calculate_attack(
+            attack
+        )
+        results = attack.results
+        previous = copy.deepcopy(attack.modifiers)
+        attack.modifiers.roll_modifiers.parry += 20
+        table_client = FakeTableClient()
+
+        await AttackCalculator(attack_table_client=table_client).recalculate_attack(
+            attack, previous
+        )
+
+        assert table_client.entry_calls == 0
+        assert attack.results is results
+
+    @pytest.mark.asyncio
+    async def test_table_is_read_when_the_table_changes(self):
+        attack = await calculated_attack(5)
+        previous = copy.deepcopy(attack.modifiers)
+        attack.modifiers.at = previous.at % 3 + 1
+        table_client = FakeTableClient()
+
+        await AttackCalculator(attack_table_client=table_client).recalculate_attack(
+            attack, previous
+        )
+
+        assert table_client.entry_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_rolled_criticals_are_kept(self):
+        attack = await calculated_attack(0)
+        attack.modifiers.roll_modifiers.bo = 150
+        attack.modifiers.situational_modifiers.disabled_parry = True
+        await AttackCalculator(attack_table_client=FakeTableClient()).calculate_attack(
+            attack
+        )
+        assert attack.status == AttackStatus.PENDING_CRITICAL_ROLL
+        attack.results.criticals[0].adjusted_roll = 50
+        previous = copy.deepcopy(attack.modifiers)
+        attack.modifiers.roll_modifiers.parry += 10
+
+        await AttackCalculator(
+            attack_table_client=FakeTableClient()
+        ).recalculate_attack(attack, previous)
+
+        assert attack.results.criticals[0].adjusted_roll == 50
+
+    @pytest.mark.asyncio
+    async def test_resolved_criticals_survive_unrelated_changes(self):
+        attack = await calculated_attack(0)
+        attack.modifiers.roll_modifiers.bo = 150
+        attack.modifiers.situational_modifiers.disabled_parry = True
+        await AttackCalculator(attack_table_client=FakeTableClient()).calculate_attack(
+            attack
+        )
+        critical = attack.results.criticals[0]
+        critical.adjusted_roll = 50
+        critical.status = CriticalStatus.PENDING_APPLY
+        previous = copy.deepcopy(attack.modifiers)
+        attack.modifiers.action_points = previous.action_points + 1
+
+        await AttackCalculator(
+            attack_table_client=FakeTableClient()
+        ).recalculate_attack(attack, previous)
+
+        # calculate_attack would create the critical again, pending its roll
+        assert attack.results.criticals[0] is critical
+        assert critical.status == CriticalStatus.PENDING_APPLY
+        assert critical.adjusted_roll == 50
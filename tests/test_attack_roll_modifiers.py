@@ -0,0 +1,143 @@
+"""
+Tests for the table-driven attack roll modifiers.
+"""
+
+import random
+
+import pytest
+
+from app.domain.entities import (
+    Attack,
+    AttackBonusEntry,
+    AttackModifiers,
+    AttackRoll,
+    AttackRollModifiers,
+    AttackSituationalModifiers,
+    AttackSkill,
+)
+from app.domain.entities.enums import (
+    AttackStatus,
+    AttackType,
+    Cover,
+    PositionalSource,
+    PositionalTarget,
+    RestrictedQuarters,
+)
+from app.domain.services import AttackCalculator
+from app.domain.services.attack_roll_modifiers import calculate_roll_modifiers
+from tests.roll_modifiers_reference import ReferenceRollModifiers
+
+SKILLS = ["footwork", "restricted-quarters", "reverse-strike", "riding"]
+SOURCE_STATUSES = ["prone", "ambidextrous", "melee"]
+TARGET_STATUSES = ["stunned", "surprised", "prone"]
+
+
+def random_attack(rng: random.Random) -> Attack:
+    def modifier() -> int:
+        return rng.choice([0, 0, rng.randint(-60, 60)])
+
+    skills = [
+        AttackSkill(skill_id=rng.choice(SKILLS), bonus=rng.randint(-10, 120))
+        for _ in range(rng.randint(0, 4))
+    ]
+    return Attack(
+        id="attack_001",
+        action_id="action_001",
+        source_id="source_001",
+        target_id="target_001",
+        status=AttackStatus.PENDING_ATTACK_ROLL,
+        roll=rng.choice([None, AttackRoll(roll=rng.randint(1, 100))]),
+        modifiers=AttackModifiers(
+            attack_type=rng.choice(list(AttackType)),
+            attack_table="arming-sword",
+            roll_modifiers=AttackRollModifiers(
+                bo=modifier(),
+                injury_penalty=modifier(),
+                pace_penalty=modifier(),
+                fatigue_penalty=modifier(),
+                bd=modifier(),
+                shield=modifier(),
+                range_penalty=modifier(),
+                parry=modifier(),
+                custom_bonus=modifier(),
+            ),
+            situational_modifiers=AttackSituationalModifiers(
+                cover=rng.choice(list(Cover)),
+                restricted_quarters=rng.choice(list(RestrictedQuarters)),
+                positional_source=rng.choice(list(PositionalSource)),
+                positional_target=rng.choice(list(PositionalTarget)),
+                disabled_db=rng.random() < 0.3,
+                disabled_shield=rng.random() < 0.3,
+                disabled_parry=rng.random() < 0.3,
+                size_difference=rng.randint(-3, 3),
+                off_hand=rng.random() < 0.3,
+                two_handed_weapon=rng.random() < 0.3,
+                source_status=rng.sample(SOURCE_STATUSES, rng.randint(0, 3)),
+                target_status=rng.sample(TARGET_STATUSES, rng.randint(0, 3)),
+            ),
+            features=[],
+            source_skills=skills,
+        ),
+    )
+
+
+def modifiers_of(calculator, attack: Attack) -> tuple:
+    calculator.initialize_attack_calculations(attack)
+    calculator.calculate_attack_roll_modifiers(attack)
+    return (
+        [(entry.key, entry.value) for entry in attack.calculated.roll_modifiers],
+        attack.calculated.roll_total,
+    )
+
+
+class TestAttackRollModifiers:
+    """Test cases for calculate_roll_modifiers"""
+
+    def test_same_modifiers_as_reference(self):
+        rng = random.Random(20240101)
+        calculator = AttackCalculator()
+        reference = ReferenceRollModifiers()
+        # initialize_attack_calculations is shared, the reference only replaces
+        # the roll modifiers calculation
+        reference.initialize_attack_calculations = (
+            calculator.initialize_attack_calculations
+        )
+
+        for _ in range(5000):
+            attack = random_attack(rng)
+            expected = modifiers_of(reference, attack)
+            assert modifiers_of(calculator, attack) == expected
+
+    def test_cover_penalty_is_the_same_for_ranged_attacks(self):
+        attack = random_attack(random.Random(1))
+        attack.modifiers.situational_modifiers.cover = Cover.HARD_HALF
+        attack.modifiers.attack_type = AttackType.RANGED
+
+        entries = calculate_roll_modifiers(attack)
+
+        assert AttackBonusEntry("cover", -40) in entries
+
+    def test_skill_reduces_penalty_up_to_its_value(self):
+        attack = random_attack(random.Random(2))
+        attack.roll = None
+        attack.modifiers.attack_type = AttackType.MELEE
+        attack.modifiers.roll_modifiers = AttackRollModifiers(pace_penalty=-25)
+        attack.modifiers.situational_modifiers = AttackSituationalModifiers(
+            source_status=[], target_status=[]
+        )
+        attack.modifiers.source_skills = [
+            AttackSkill(skill_id="footwork", bonus=40),
+            AttackSkill(skill_id="footwork", bonus=5),
+        ]
+
+        assert calculate_roll_modifiers(attack) == [
+            AttackBonusEntry("pace-penalty", -25),
+            AttackBonusEntry("pace-penalty-skill-footwork", 25),
+        ]
+
+    def test_bonus_entries_use_slots(self):
+        entry = AttackBonusEntry("bo", 10)
+
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.extra = 1
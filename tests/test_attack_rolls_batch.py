@@ -0,0 +1,162 @@
+"""
+Tests for batch resolution of attack rolls.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.application.commands import (
+    UpdateAttackRollCommand,
+    UpdateAttackRollsBatchCommand,
+)
+from app.application.ports import (
+    ATTACK_TABLE_MAX_ROLL,
+    AttackRepository,
+    AttackTableClient,
+)
+from app.domain.entities import (
+    Attack,
+    AttackModifiers,
+    AttackRollModifiers,
+    AttackSituationalModifiers,
+    AttackStatus,
+    AttackTableEntry,
+    AttackType,
+    BatchItemError,
+    BatchResult,
+)
+from app.application.use_cases import UpdateAttackRollsBatchUseCase
+from app.domain.services import AttackCalculator, AttackResolutionService
+from app.interfaces.http.dto import UpdateAttackRollsBatchRequestDTO
+
+
+def build_attack(attack_id: str, status=AttackStatus.PENDING_ATTACK_ROLL) -> Attack:
+    return Attack(
+        id=attack_id,
+        action_id="action_001",
+        source_id="source_001",
+        target_id="target_001",
+        status=status,
+        modifiers=AttackModifiers(
+            attack_type=AttackType.MELEE,
+            attack_table="arming-sword",
+            roll_modifiers=AttackRollModifiers(bo=50),
+            situational_modifiers=AttackSituationalModifiers(
+                source_status=[], target_status=[]
+            ),
+            features=[],
+            source_skills=[],
+        ),
+    )
+
+
+class TestUpdateAttackRollsBatch:
+    """Test cases for AttackResolutionService.update_attack_rolls"""
+
+    @pytest.fixture
+    def repository(self):
+        repository = AsyncMock(spec=AttackRepository)
+        repository.find_by_ids.return_value = [
+            build_attack("a1"),
+            build_attack("a2"),
+            build_attack("a3", status=AttackStatus.APPLIED),
+        ]
+        repository.update_all.side_effect = lambda attacks: attacks
+        return repository
+
+    @pytest.fixture
+    def service(self, repository):
+        table_client = AsyncMock(spec=AttackTableClient)
+        table_client.get_attack_table_entry.return_value = AttackTableEntry(
+            text="8", damage=8
+        )
+        table_client.get_attack_table_row.return_value = [
+            AttackTableEntry(text="8", damage=8)
+        ] * ATTACK_TABLE_MAX_ROLL
+        return AttackResolutionService(
+            attack_repository=repository,
+            attack_calculator=AttackCalculator(attack_table_client=table_client),
+            attack_table_client=table_client,
+        )
+
+    @pytest.mark.asyncio
+    async def test_resolves_attacks_in_bulk(self, service, repository):
+        result = await service.update_attack_rolls(
+            [("a1", 40), ("missing", 50), ("a2", 60), ("a3", 70)]
+        )
+
+        assert [attack.id for attack in result.content] == ["a1", "a2"]
+        assert result.content[0].calculated.roll_total == 90
+        assert result.content[1].status == AttackStatus.PENDING_APPLY
+        assert [(error.index, error.attack_id) for error in result.errors] == [
+            (1, "missing"),
+            (3, "a3"),
+        ]
+        repository.find_by_ids.assert_awaited_once_with(["a1", "missing", "a2", "a3"])
+        repository.update_all.assert_awaited_once_with(result.content)
+
+    @pytest.mark.asyncio
+    async def test_attacks_deleted_before_the_write_are_errors(
+        self, service, repository
+    ):
+        repository.update_all.side_effect = lambda attacks: [
+            attack for attack in attacks if attack.id != "a1"
+        ]
+
+        result = await service.update_attack_rolls([("a1", 40), ("a2", 60)])
+
+        assert [attack.id for attack in result.content] == ["a2"]
+        assert [(error.index, error.attack_id) for error in result.errors] == [
+            (0, "a1")
+        ]
+
+
+class TestUpdateAttackRollsBatchUseCase:
+    """Test cases for UpdateAttackRollsBatchUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_malformed_item_is_reported_at_its_index(self):
+        service = AsyncMock(spec=AttackResolutionService)
+        service.update_attack_rolls.return_value = BatchResult[Attack](
+            content=[build_attack("a1")],
+            errors=[BatchItemError(index=1, attack_id="missing", message="")],
+        )
+        request = UpdateAttackRollsBatchRequestDTO.model_validate(
+            [
+                {"attackId": "a1", "roll": 40},
+                {"attackId": "a2", "roll": "high"},
+                {"attackId": "missing", "roll": 60},
+            ]
+        )
+
+        result = await UpdateAttackRollsBatchUseCase(service).execute(
+            request.to_command()
+        )
+
+        service.update_attack_rolls.assert_awaited_once_with(
+            [("a1", 40), ("missing", 60)]
+        )
+        assert [attack.id for attack in result.content] == ["a1"]
+        assert [(error.index, error.attack_id) for error in result.errors] == [
+            (1, None),
+            (2, "missing"),
+        ]
+        assert result.errors[0].message.startswith("roll: ")
+
+
+class TestUpdateAttackRollsBatchCommand:
+    """Test cases for UpdateAttackRollsBatchCommand"""
+
+    def test_rejects_empty_batch(self):
+        with pytest.raises(ValueError):
+            UpdateAttackRollsBatchCommand(rolls=[]).validate()
+
+    def test_rejects_duplicated_attacks(self):
+        command = UpdateAttackRollsBatchCommand(
+            rolls=[
+                UpdateAttackRollCommand(attack_id="a1", roll=10),
+                UpdateAttackRollCommand(attack_id="a1", roll=20),
+            ]
+        )
+        with pytest.raises(ValueError):
+            command.validate()
@@ -0,0 +1,160 @@
+"""
+Tests for the Monte Carlo attack outcome simulator.
+"""
+
+import copy
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from app.application.commands import SimulateAttackCommand
+from app.domain.entities import AttackRoll, AttackTableEntry
+from app.domain.services import AttackCalculator, AttackSimulator
+from app.domain.services.attack_simulator import open_ended_rolls, simulate_outcomes
+from app.interfaces.http.dto import SimulateAttackRequestDTO
+from tests.test_attack_calculate_many import FakeTableClient
+from tests.test_attack_roll_modifiers import random_attack
+
+
+def simulator(table_client=None) -> AttackSimulator:
+    table_client = table_client or FakeTableClient()
+    return AttackSimulator(
+        attack_calculator=AttackCalculator(attack_table_client=table_client),
+        attack_table_client=table_client,
+    )
+
+
+class TestOpenEndedRolls:
+    """Test cases for open_ended_rolls"""
+
+    def test_closed_rolls_are_d100(self):
+        naturals, rolls = open_ended_rolls(
+            np.random.default_rng(1), 10000, open_ended=False
+        )
+
+        assert rolls.min() == 1
+        assert rolls.max() == 100
+        assert (naturals == rolls).all()
+
+    def test_open_ended_rolls_extend_both_ends(self):
+        naturals, rolls = open_ended_rolls(np.random.default_rng(1), 10000)
+        middle = (rolls > 5) & (rolls < 96)
+
+        assert rolls.max() > 100
+        assert rolls.min() <= 0
+        assert naturals.min() == 1
+        assert naturals.max() == 100
+        assert (rolls[naturals > 95] > naturals[naturals > 95]).all()
+        assert (rolls[naturals < 6] < naturals[naturals < 6]).all()
+        # Rolls of 06-95 are never extended
+        assert 0.88 < np.count_nonzero(middle) / len(rolls) < 0.92
+
+
+class TestAttackSimulator:
+    """Test cases for AttackSimulator"""
+
+    @pytest.mark.asyncio
+    async def test_same_outcomes_as_calculate_attack(self):
+        attack = random_attack(random.Random(11))
+        attack.modifiers.fumble = 3
+        samples, seed = 2000, 42
+        naturals, rolls = open_ended_rolls(np.random.default_rng(seed), samples)
+
+        table_client = FakeTableClient()
+        calculator = AttackCalculator(attack_table_client=table_client)
+        outcomes = Counter()
+        damage = Counter()
+        # Fumbles depend on the natural roll, the calculator gets the totals
+        resolved = copy.deepcopy(attack)
+        resolved.modifiers.fumble = 0
+        for natural, roll in zip(naturals.tolist(), rolls.tolist()):
+            if natural <= attack.modifiers.fumble:
+                outcomes["fumble"] += 1
+                continue
+            resolved.roll = AttackRoll(roll=roll)
+            await calculator.calculate_attack(resolved)
+            entry = resolved.results.attack_table_entry
+            damage[entry.damage] += 1
+            if entry.critical_type:
+                outcomes[entry.critical_severity] += 1
+            outcomes["hit" if entry.damage > 0 or entry.critical_type else "miss"] += 1
+
+        simulation = await simulator(table_client).simulate(
+            attack.modifiers, samples=samples, seed=seed
+        )
+
+        assert simulation.samples == samples
+        assert simulation.fumble_rate == outcomes["fumble"] / samples
+        assert simulation.hit_rate == outcomes["hit"] / samples
+        assert simulation.miss_rate == outcomes["miss"] / samples
+        assert simulation.damage == {
+            value: count / samples for value, count in damage.items()
+        }
+        assert simulation.critical_severities == {
+            severity: outcomes[severity] / samples
+            for severity in simulation.critical_severities
+        }
+        assert sum(simulation.critical_severities.values()) == pytest.approx(
+            simulation.critical_rate
+        )
+
+    def test_low_open_ended_rolls_fumble_by_natural_roll(self):
+        row = [AttackTableEntry(text="0", damage=0) for _ in range(175)]
+        naturals = np.array([4, 2, 50])
+        # 04 - 60 and 02 - 10 open-ended down, 50 is not open-ended
+        rolls = np.array([-56, -8, 50])
+
+        simulation = simulate_outcomes(0, 2, row, naturals, rolls)
+
+        assert simulation.fumble_rate == pytest.approx(1 / 3)
+        assert simulation.miss_rate == pytest.approx(2 / 3)
+
+    @pytest.mark.asyncio
+    async def test_rates_add_up(self):
+        attack = random_attack(random.Random(5))
+
+        simulation = await simulator().simulate(attack.modifiers, samples=100000)
+
+        assert simulation.hit_rate + simulation.miss_rate + simulation.fumble_rate == (
+            pytest.approx(1.0)
+        )
+        assert sum(simulation.damage.values()) == pytest.approx(
+            1.0 - simulation.fumble_rate
+        )
+
+    @pytest.mark.asyncio
+    async def test_seed_reproduces_simulation(self):
+        attack = random_attack(random.Random(9))
+
+        first = await simulator().simulate(attack.modifiers, samples=5000, seed=1)
+        second = await simulator().simulate(attack.modifiers, samples=5000, seed=1)
+
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_reads_table_row_once(self):
+        table_client = FakeTableClient()
+        attack = random_attack(random.Random(3))
+
+        await simulator(table_client).simulate(attack.modifiers, samples=10000)
+
+        assert table_client.row_calls == 1
+
+    def test_command_rejects_invalid_samples(self):
+        attack = random_attack(random.Random(1))
+
+        with pytest.raises(ValueError):
+            SimulateAttackCommand(modifiers=attack.modifiers, samples=0).validate()
+
+    def test_request_dto_to_command(self):
+        request = SimulateAttackRequestDTO.model_validate(
+            SimulateAttackRequestDTO.model_config["json_schema_extra"]["example"]
+        )
+
+        command = request.to_command()
+
+        assert command.samples == 100000
+        assert command.open_ended is True
+        assert command.modifiers.roll_modifiers.bo == 80
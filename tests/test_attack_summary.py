@@ -0,0 +1,92 @@
+"""
+Tests for projected attack summaries.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+from bson import ObjectId
+
+from app.application.ports import AttackRepository
+from app.application.use_cases import SearchAttacksByRsqlUseCase
+from app.domain.entities import AttackStatus, AttackSummary, AttackType
+from app.infrastructure.persistence.mongo_attack_converter import MongoAttackConverter
+from app.interfaces.http.dto import AttackSummaryDTO
+
+
+class TestAttackSummaryConverter:
+    """Test cases for the summary projection of MongoAttackConverter"""
+
+    def test_projection_maps_nested_fields(self):
+        projection = MongoAttackConverter.summary_projection(
+            ["status", "attack_type", "roll_total"]
+        )
+
+        assert projection == {
+            "_id": 1,
+            "status": 1,
+            "modifiers.attackType": 1,
+            "calculated.rollTotal": 1,
+        }
+
+    def test_converts_projected_document(self):
+        object_id = ObjectId()
+        summary = MongoAttackConverter.dict_to_attack_summary(
+            {
+                "_id": object_id,
+                "status": "applied",
+                "modifiers": {"attackType": "melee"},
+                "calculated": {"rollTotal": 87},
+            }
+        )
+
+        assert summary == AttackSummary(
+            id=str(object_id),
+            status=AttackStatus.APPLIED,
+            attack_type=AttackType.MELEE,
+            roll_total=87,
+        )
+
+
+class TestAttackSummaryDTO:
+    """Test cases for AttackSummaryDTO"""
+
+    def test_parse_fields(self):
+        assert AttackSummaryDTO.parse_fields("id, status,rollTotal") == [
+            "id",
+            "status",
+            "roll_total",
+        ]
+        with pytest.raises(ValueError):
+            AttackSummaryDTO.parse_fields("status,modifiers")
+
+    def test_dumps_only_requested_fields(self):
+        summary = AttackSummary(id="a1", status=AttackStatus.APPLIED, roll=40)
+
+        dto = AttackSummaryDTO.from_entity(summary, ["status"])
+
+        assert dto.model_dump(exclude_unset=True) == {"id": "a1", "status": "applied"}
+
+
+class TestSearchAttackSummaries:
+    """Test cases for SearchAttacksByRsqlUseCase with fields"""
+
+    @pytest.mark.asyncio
+    async def test_loads_summaries(self):
+        repository = AsyncMock(spec=AttackRepository)
+        repository.find_summaries_by_rsql.return_value = [AttackSummary(id="a1")]
+        repository.count_by_rsql.return_value = 1
+        use_case = SearchAttacksByRsqlUseCase(repository)
+
+        page = await use_case.execute(
+            rsql_query="actionId==action_001", size=10, fields=["status"]
+        )
+
+        repository.find_by_rsql.assert_not_awaited()
+        repository.find_summaries_by_rsql.assert_awaited_once_with(
+            fields=["status"],
+            rsql_query="actionId==action_001",
+            limit=11,
+            skip=0,
+            after=None,
+        )
+        assert page.content == [AttackSummary(id="a1")]
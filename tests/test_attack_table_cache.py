@@ -0,0 +1,134 @@
+"""
+Tests for the attack table lookup cache.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.application.ports import AttackTableClient
+from app.domain.entities import AttackTableEntry, CriticalTableEntry
+from app.infrastructure.api.attack_table_cache import (
+    CachingAttackTableClient,
+    LRUCache,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUCache:
+    """Test cases for LRUCache"""
+
+    def test_hit_and_miss_counters(self):
+        cache = LRUCache(max_size=2)
+        assert cache.get("a") is None
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.evictions == 1
+
+    def test_expires_entries(self):
+        clock = FakeClock()
+        cache = LRUCache(max_size=10, ttl=5, clock=clock)
+        cache.put("a", 1)
+        clock.now = 4.9
+        assert cache.get("a") == 1
+        clock.now = 5.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestCachingAttackTableClient:
+    """Test cases for CachingAttackTableClient"""
+
+    @pytest.fixture
+    def delegate(self):
+        delegate = AsyncMock(spec=AttackTableClient)
+        delegate.get_attack_table_entry.return_value = AttackTableEntry(
+            text="12AS", damage=12, critical_type="S", critical_severity="A"
+        )
+        delegate.get_critical_table_entry.return_value = CriticalTableEntry(
+            damage=3, text="Glancing blow"
+        )
+        return delegate
+
+    @pytest.mark.asyncio
+    async def test_attack_lookup_is_cached(self, delegate):
+        client = CachingAttackTableClient(delegate)
+        first = await client.get_attack_table_entry("arming-sword", "medium", 80, 3)
+        second = await client.get_attack_table_entry("arming-sword", "medium", 80, 3)
+
+        assert first == second
+        assert first is not second
+        delegate.get_attack_table_entry.assert_awaited_once_with(
+            attack_table="arming-sword", size="medium", roll=80, at=3
+        )
+        assert client.stats()["hits"] == 1
+        assert client.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_attack_lookup_clamps_roll_in_key(self, delegate):
+        client = CachingAttackTableClient(delegate)
+        await client.get_attack_table_entry("arming-sword", "medium", 180, 3)
+        await client.get_attack_table_entry("arming-sword", "medium", 220, 3)
+
+        delegate.get_attack_table_entry.assert_awaited_once_with(
+            attack_table="arming-sword", size="medium", roll=175, at=3
+        )
+
+    @pytest.mark.asyncio
+    async def test_critical_lookup_is_cached(self, delegate):
+        client = CachingAttackTableClient(delegate)
+        await client.get_critical_table_entry("S", "A", 42)
+        await client.get_critical_table_entry("S", "A", 42)
+        await client.get_critical_table_entry("S", "B", 42)
+
+        assert delegate.get_critical_table_entry.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, delegate):
+        delegate.get_attack_table_entry.side_effect = [
+            Exception("boom"),
+            AttackTableEntry(text="0", damage=0),
+        ]
+        client = CachingAttackTableClient(delegate)
+        with pytest.raises(Exception):
+            await client.get_attack_table_entry("arming-sword", "medium", 10, 1)
+        entry = await client.get_attack_table_entry("arming-sword", "medium", 10, 1)
+
+        assert entry.damage == 0
+        assert delegate.get_attack_table_entry.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rows_are_cached_from_the_delegate_row(self, delegate):
+        row = [AttackTableEntry(text=str(roll), damage=roll) for roll in range(175)]
+        delegate.get_attack_table_row.return_value = row
+        client = CachingAttackTableClient(delegate)
+
+        first = await client.get_attack_table_row("arming-sword", "medium", 3)
+        second = await client.get_attack_table_row("arming-sword", "medium", 3)
+
+        assert first == second == row
+        assert first[10] is not second[10]
+        assert first[10] is not row[10]
+        delegate.get_attack_table_row.assert_awaited_once_with(
+            attack_table="arming-sword", size="medium", at=3
+        )
+        delegate.get_attack_table_entry.assert_not_awaited()
+        assert client.stats()["hits"] == 1
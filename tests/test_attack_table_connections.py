@@ -0,0 +1,86 @@
+"""
+Tests for the connection settings and warm-up of the attack table REST adapter.
+"""
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from app.infrastructure.api.attack_table_rest_adapter import AttackTableRestAdapter
+from app.infrastructure.config.attack_table_config import AttackTableApiConfig
+
+
+def mock_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestAttackTableConnections:
+    """Test cases for the HTTP client configuration"""
+
+    def test_limits(self):
+        adapter = AttackTableRestAdapter(
+            "http://tables/v1",
+            max_connections=10,
+            max_keepalive_connections=5,
+            keepalive_expiry=12.0,
+        )
+
+        assert adapter.limits == httpx.Limits(
+            max_connections=10, max_keepalive_connections=5, keepalive_expiry=12.0
+        )
+
+    def test_http2_falls_back_without_h2(self):
+        with patch("importlib.util.find_spec", return_value=None):
+            adapter = AttackTableRestAdapter("http://tables/v1", http2=True)
+
+        assert adapter.http2 is False
+
+    def test_config_from_env(self, monkeypatch):
+        monkeypatch.setenv("RMU_API_ATTACK_TABLES_MAX_CONNECTIONS", "50")
+        monkeypatch.setenv("RMU_API_ATTACK_TABLES_HTTP2", "true")
+        monkeypatch.setenv("RMU_API_ATTACK_TABLES_WARM_UP_CONNECTIONS", "4")
+
+        config = AttackTableApiConfig.from_env()
+
+        assert config.max_connections == 50
+        assert config.http2 is True
+        assert config.warm_up_connections == 4
+        assert config.max_keepalive_connections == 20
+
+    @pytest.mark.asyncio
+    async def test_start_warms_connections(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200)
+
+        adapter = AttackTableRestAdapter("http://tables/v1/")
+        adapter._client = mock_client(handler)
+
+        warmed = await adapter.start(warm_up_connections=3)
+
+        assert warmed == 3
+        assert [request.method for request in requests] == ["HEAD"] * 3
+        assert str(requests[0].url) == "http://tables/v1"
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_start_ignores_unavailable_api(self):
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        adapter = AttackTableRestAdapter("http://tables/v1")
+        adapter._client = mock_client(handler)
+
+        assert await adapter.start(warm_up_connections=2) == 0
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_start_creates_configured_client(self):
+        adapter = AttackTableRestAdapter("http://tables/v1", max_connections=7)
+
+        await adapter.start(warm_up_connections=0)
+
+        assert adapter._client is not None
+        await adapter.close()
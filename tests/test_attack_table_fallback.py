@@ -0,0 +1,168 @@
+"""
+Tests for the stale-while-revalidate table entry store.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.application.ports import AttackTableClient
+from app.domain.entities import AttackTableEntry, CriticalEffect, FumbleTableEntry
+from app.infrastructure.api.attack_table_fallback import FallbackAttackTableClient
+from app.infrastructure.persistence import MongoTableEntryStore
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+ENTRY = AttackTableEntry(text="5A", damage=5)
+FRESH_ENTRY = AttackTableEntry(text="6A", damage=6)
+
+
+class MemoryStore:
+    def __init__(self):
+        self.entries = {}
+
+    async def get(self, key):
+        return self.entries.get(key)
+
+    async def put(self, key, entry):
+        self.entries[key] = (entry, NOW)
+
+
+class TestFallbackAttackTableClient:
+    """Test cases for FallbackAttackTableClient"""
+
+    @pytest.fixture
+    def delegate(self):
+        delegate = AsyncMock(spec=AttackTableClient)
+        delegate.get_attack_table_entry.return_value = FRESH_ENTRY
+        return delegate
+
+    @pytest.fixture
+    def store(self):
+        return MemoryStore()
+
+    def client(self, delegate, store, now=NOW):
+        return FallbackAttackTableClient(
+            delegate, store, refresh_after=3600, clock=lambda: now
+        )
+
+    @pytest.mark.asyncio
+    async def test_lookup_calls_delegate_and_stores(self, delegate, store):
+        key = ("attack", "sword", "medium", 1, 175)
+        store.entries[key] = (ENTRY, NOW)
+        client = self.client(delegate, store)
+
+        entry = await client.get_attack_table_entry("sword", "medium", 200, 1)
+
+        assert entry == FRESH_ENTRY
+        delegate.get_attack_table_entry.assert_awaited_once_with(
+            attack_table="sword", size="medium", roll=175, at=1
+        )
+        await asyncio.sleep(0)
+        assert store.entries[key][0] == FRESH_ENTRY
+
+    @pytest.mark.asyncio
+    async def test_store_is_not_read_while_delegate_works(self, delegate):
+        store = AsyncMock()
+        client = self.client(delegate, store)
+
+        await client.get_attack_table_entry("sword", "medium", 80, 1)
+        await client.get_attack_table_entry("sword", "medium", 80, 1)
+        await asyncio.sleep(0)
+
+        store.get.assert_not_awaited()
+        # Written once per refresh interval
+        assert store.put.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_outage_serves_stored_entry(self, delegate, store):
+        key = ("fumble", "melee", 20)
+        fumble = FumbleTableEntry(text="Drop weapon")
+        store.entries[key] = (fumble, NOW - timedelta(days=2))
+        delegate.get_fumble_table_entry.side_effect = Exception("unavailable")
+        client = self.client(delegate, store)
+
+        assert await client.get_fumble_table_entry("melee", 20) == fumble
+        assert client.stats()["fallbackHits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_store_errors_do_not_fail_lookups(self, delegate):
+        store = AsyncMock()
+        store.put.side_effect = Exception("mongo down")
+        client = self.client(delegate, store)
+
+        assert (
+            await client.get_attack_table_entry("sword", "medium", 80, 1) == FRESH_ENTRY
+        )
+        await asyncio.sleep(0)
+        assert client.stats()["storeErrors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_entry_during_outage_fails(self, delegate, store):
+        delegate.get_critical_table_entry.side_effect = Exception("unavailable")
+        client = self.client(delegate, store)
+
+        with pytest.raises(Exception, match="unavailable"):
+            await client.get_critical_table_entry("S", "A", 50)
+        assert client.stats()["fallbackMisses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lookup_does_not_wait_for_the_store_write(self, delegate, store):
+        written = asyncio.Event()
+        put = store.put
+
+        async def slow_put(key, entry):
+            await written.wait()
+            await put(key, entry)
+
+        store.put = slow_put
+        client = self.client(delegate, store)
+
+        assert await client.get_fumble_table_entry("melee", 20) is not None
+        assert client.stats()["writing"] == 1
+        assert store.entries == {}
+
+        written.set()
+        await client.close()
+
+        assert client.stats()["writing"] == 0
+        assert ("fumble", "melee", 20) in store.entries
+
+
+class TestMongoTableEntryStore:
+    """Test cases for MongoTableEntryStore"""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self):
+        collection = MagicMock()
+        collection.replace_one = AsyncMock()
+        store = MongoTableEntryStore(collection)
+        entry = FumbleTableEntry(
+            text="Drop weapon", effects=[CriticalEffect(status="stunned", rounds=1)]
+        )
+
+        await store.put(("fumble", "melee", 20), entry)
+
+        filter, document = collection.replace_one.await_args.args
+        assert filter == {"_id": "fumble/melee/20"}
+        assert collection.replace_one.await_args.kwargs == {"upsert": True}
+
+        collection.find_one = AsyncMock(
+            return_value={
+                "_id": "fumble/melee/20",
+                "entry": document["entry"],
+                "updatedAt": NOW.replace(tzinfo=None),
+            }
+        )
+        stored, updated_at = await store.get(("fumble", "melee", 20))
+
+        assert stored == entry
+        assert updated_at == NOW
+
+    @pytest.mark.asyncio
+    async def test_missing_entry(self):
+        collection = MagicMock()
+        collection.find_one = AsyncMock(return_value=None)
+
+        assert await MongoTableEntryStore(collection).get(("fumble", "x", 1)) is None
@@ -0,0 +1,109 @@
+"""
+Tests for preloaded attack table grids.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.application.ports import AttackTableClient
+from app.domain.entities import AttackTableEntry
+from app.infrastructure.api.attack_table_preload import (
+    AttackTableGrid,
+    PreloadingAttackTableClient,
+)
+
+
+def fake_entry(attack_table: str, size: str, roll: int, at: int) -> AttackTableEntry:
+    damage = max(0, min(roll, 175) // 10 - at)
+    return AttackTableEntry(text=str(damage), damage=damage)
+
+
+class TestAttackTableGrid:
+    """Test cases for AttackTableGrid"""
+
+    def test_lookup_and_compaction(self):
+        rows = {
+            at: [fake_entry("t", "medium", roll, at) for roll in range(1, 176)]
+            for at in (1, 2)
+        }
+        grid = AttackTableGrid.from_rows("t", "medium", rows)
+
+        assert grid.get(1, 95) == fake_entry("t", "medium", 95, 1)
+        assert grid.get(2, 175) == fake_entry("t", "medium", 175, 2)
+        assert grid.get(2, 300) == grid.get(2, 175)
+        assert grid.get(1, -5) == grid.get(1, 1)
+        assert len(grid.index) == 350
+        assert len(grid.entries) < 30
+        assert grid.row(2) == rows[2]
+
+    def test_rejects_incomplete_rows(self):
+        with pytest.raises(ValueError):
+            AttackTableGrid.from_rows("t", "medium", {1: [fake_entry("t", "m", 1, 1)]})
+
+
+class TestPreloadingAttackTableClient:
+    """Test cases for PreloadingAttackTableClient"""
+
+    @pytest.fixture
+    def delegate(self):
+        delegate = AsyncMock(spec=AttackTableClient)
+        delegate.get_attack_table_entry.side_effect = (
+            lambda attack_table, size, roll, at: fake_entry(
+                attack_table, size, roll, at
+            )
+        )
+        return delegate
+
+    @pytest.mark.asyncio
+    async def test_preloaded_table_is_served_locally(self, delegate):
+        client = PreloadingAttackTableClient(
+            delegate, tables=[("arming-sword", "medium")], at_values=(1, 2, 3)
+        )
+        await client.preload()
+        calls = delegate.get_attack_table_entry.await_count
+        assert calls == 3 * 175
+
+        entry = await client.get_attack_table_entry("arming-sword", "medium", 120, 3)
+
+        assert entry == fake_entry("arming-sword", "medium", 120, 3)
+        assert delegate.get_attack_table_entry.await_count == calls
+        assert client.grid_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_table_is_loaded_lazily(self, delegate):
+        client = PreloadingAttackTableClient(delegate, at_values=(1,))
+
+        entry = await client.get_attack_table_entry("dagger", "small", 50, 1)
+        assert entry == fake_entry("dagger", "small", 50, 1)
+        assert client.grid_misses == 1
+
+        await client.load_table("dagger", "small")
+        assert delegate.get_attack_table_entry.await_count == 1 + 175
+        assert client.get_grid("dagger", "small") is not None
+        await client.get_attack_table_entry("dagger", "small", 60, 1)
+        assert client.grid_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_row_lookup(self, delegate):
+        client = PreloadingAttackTableClient(delegate, at_values=(1, 2))
+
+        row = await client.get_attack_table_row("dagger", "small", 2)
+
+        assert len(row) == 175
+        assert row[99] == fake_entry("dagger", "small", 100, 2)
+
+    @pytest.mark.asyncio
+    async def test_row_lookup_falls_back_to_delegate_when_loading_fails(self, delegate):
+        delegate.get_attack_table_entry.side_effect = Exception("API down")
+        row = [fake_entry("dagger", "small", roll, 2) for roll in range(1, 176)]
+        delegate.get_attack_table_row.return_value = row
+        client = PreloadingAttackTableClient(delegate, at_values=(1, 2))
+
+        assert await client.get_attack_table_row("dagger", "small", 2) == row
+        calls = delegate.get_attack_table_entry.await_count
+        # A failed load is not retried by every lookup
+        assert await client.get_attack_table_row("dagger", "small", 1) == row
+
+        assert delegate.get_attack_table_entry.await_count == calls
+        assert delegate.get_attack_table_row.await_count == 2
+        assert client.grid_misses == 2
@@ -0,0 +1,268 @@
+"""
+Tests for the retry policy and circuit breaker of attack table lookups.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock
+
+from app.application.ports import AttackTableClient
+from app.domain.entities import AttackTableEntry
+from app.infrastructure.api.attack_table_rest_adapter import (
+    AttackTableApiException,
+    AttackTableRestAdapter,
+)
+from app.infrastructure.api.resilience import (
+    CircuitBreaker,
+    CircuitOpenException,
+    DeadlineExceededException,
+    Resilience,
+    ResilientAttackTableClient,
+    RetryPolicy,
+)
+
+ENTRY = AttackTableEntry(text="5A", damage=5)
+
+
+def retryable_error() -> AttackTableApiException:
+    return AttackTableApiException("unavailable", status_code=503, retryable=True)
+
+
+def not_found_error() -> AttackTableApiException:
+    return AttackTableApiException("not found", status_code=404)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRetryPolicy:
+    """Test cases for RetryPolicy"""
+
+    def test_backoff_is_exponential_and_capped(self):
+        policy = RetryPolicy(base_delay=0.1, max_delay=1.0)
+
+        assert policy.backoff(0, rand=lambda: 1.0) == pytest.approx(0.1)
+        assert policy.backoff(2, rand=lambda: 1.0) == pytest.approx(0.4)
+        assert policy.backoff(10, rand=lambda: 1.0) == pytest.approx(1.0)
+        assert policy.backoff(3, rand=lambda: 0.5) == pytest.approx(0.4)
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker"""
+
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(
+            failure_threshold=2, reset_timeout=10, clock=FakeClock()
+        )
+
+        breaker.before_call()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+        breaker.before_call()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenException):
+            breaker.before_call()
+        assert breaker.stats()["rejected"] == 1
+
+    def test_success_resets_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_allows_single_probe(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 10
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        breaker.before_call()
+        with pytest.raises(CircuitOpenException):
+            breaker.before_call()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_probe_opens_again(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        breaker.before_call()
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.stats()["opened"] == 2
+
+
+class TestResilience:
+    """Test cases for Resilience"""
+
+    @pytest.fixture
+    def sleep(self):
+        return AsyncMock()
+
+    @pytest.mark.asyncio
+    async def test_retries_retryable_errors(self, sleep):
+        fn = AsyncMock(side_effect=[retryable_error(), retryable_error(), ENTRY])
+        resilience = Resilience(RetryPolicy(max_retries=3), sleep=sleep)
+
+        assert await resilience.call(fn) == ENTRY
+        assert fn.await_count == 3
+        assert sleep.await_count == 2
+        assert resilience.stats()["retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_client_errors(self, sleep):
+        fn = AsyncMock(side_effect=not_found_error())
+        resilience = Resilience(RetryPolicy(max_retries=3), sleep=sleep)
+
+        with pytest.raises(AttackTableApiException):
+            await resilience.call(fn)
+        assert fn.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, sleep):
+        fn = AsyncMock(side_effect=retryable_error())
+        resilience = Resilience(RetryPolicy(max_retries=2), sleep=sleep)
+
+        with pytest.raises(AttackTableApiException):
+            await resilience.call(fn)
+        assert fn.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_deadline_cancels_slow_call(self):
+        async def slow():
+            await asyncio.sleep(1)
+
+        resilience = Resilience(RetryPolicy(max_retries=0, deadline=0.01))
+
+        with pytest.raises(DeadlineExceededException):
+            await resilience.call(slow)
+        assert resilience.stats()["deadlinesExceeded"] == 1
+
+    @pytest.mark.asyncio
+    async def test_deadline_stops_retries(self, sleep, monkeypatch):
+        # Full jitter may pick any delay, use the longest one
+        monkeypatch.setattr(RetryPolicy, "backoff", lambda self, attempt: 10)
+        fn = AsyncMock(side_effect=retryable_error())
+        policy = RetryPolicy(max_retries=5, base_delay=10, max_delay=10, deadline=1)
+        resilience = Resilience(policy, sleep=sleep)
+
+        with pytest.raises(DeadlineExceededException):
+            await resilience.call(fn)
+        assert fn.await_count == 1
+        sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_fails_fast(self, sleep):
+        fn = AsyncMock(side_effect=retryable_error())
+        breaker = CircuitBreaker(failure_threshold=2)
+        resilience = Resilience(RetryPolicy(max_retries=5), breaker, sleep=sleep)
+
+        with pytest.raises(CircuitOpenException):
+            await resilience.call(fn)
+        assert fn.await_count == 2
+
+        with pytest.raises(CircuitOpenException):
+            await resilience.call(fn)
+        assert fn.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_client_errors_keep_breaker_closed(self, sleep):
+        breaker = CircuitBreaker(failure_threshold=1)
+        resilience = Resilience(RetryPolicy(), breaker, sleep=sleep)
+
+        with pytest.raises(AttackTableApiException):
+            await resilience.call(AsyncMock(side_effect=not_found_error()))
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+
+class TestResilientAttackTableClient:
+    """Test cases for ResilientAttackTableClient"""
+
+    @pytest.mark.asyncio
+    async def test_retries_every_lookup(self):
+        delegate = AsyncMock(spec=AttackTableClient)
+        delegate.get_attack_table_entry.side_effect = [retryable_error(), ENTRY]
+        delegate.get_critical_table_entry.side_effect = [retryable_error(), "critical"]
+        delegate.get_fumble_table_entry.side_effect = [retryable_error(), "fumble"]
+        client = ResilientAttackTableClient(
+            delegate, Resilience(RetryPolicy(max_retries=1), sleep=AsyncMock())
+        )
+
+        assert await client.get_attack_table_entry("sword", "medium", 80, 1) == ENTRY
+        assert await client.get_critical_table_entry("S", "A", 50) == "critical"
+        assert await client.get_fumble_table_entry("melee", 20) == "fumble"
+        assert client.stats()["retries"] == 3
+
+
+class TestAttackTableApiErrors:
+    """Test cases for the errors raised by the REST adapter"""
+
+    @staticmethod
+    def adapter(status_code: int, adapter_class=AttackTableRestAdapter, **kwargs):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(status_code, json={"text": "5A", "damage": 5})
+
+        adapter = adapter_class("http://tables/v1", **kwargs)
+        adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return adapter, calls
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "status_code, retryable", [(404, False), (400, False), (429, True), (503, True)]
+    )
+    async def test_status_codes(self, status_code, retryable):
+        adapter, _ = self.adapter(status_code)
+
+        with pytest.raises(AttackTableApiException) as error:
+            await adapter.get_fumble_table_entry("melee", 20)
+
+        assert error.value.status_code == status_code
+        assert error.value.retryable is retryable
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_are_retryable(self):
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        adapter = AttackTableRestAdapter("http://tables/v1")
+        adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        with pytest.raises(AttackTableApiException) as error:
+            await adapter.get_critical_table_entry("S", "A", 50)
+
+        assert error.value.retryable is True
+        assert error.value.status_code is None
+
+    @pytest.mark.asyncio
+    async def test_resilient_client_retries_critical_lookups(self):
+        adapter, calls = self.adapter(503)
+        client = ResilientAttackTableClient(
+            adapter, Resilience(RetryPolicy(max_retries=2, base_delay=0))
+        )
+
+        with pytest.raises(AttackTableApiException):
+            await client.get_critical_table_entry("S", "A", 50)
+
+        assert len(calls) == 3
+        assert client.stats()["retries"] == 2
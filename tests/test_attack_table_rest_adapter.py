@@ -7,7 +7,6 @@ import httpx
 from unittest.mock import AsyncMock, patch
 from app.infrastructure.adapters.external.attack_table_rest_adapter import (
     AttackTableRestAdapter,
-    AttackTableRestAdapterWithRetry,
 )
 from app.domain.entities.attack_table import AttackTableEntry
 
@@ -141,78 +140,3 @@ class TestAttackTableRestAdapter:
 
             # Verify close was called
             mock_client.aclose.assert_called_once()
-
-
-class TestAttackTableRestAdapterWithRetry:
-    """Test cases for AttackTableRestAdapterWithRetry"""
-
-    @pytest.fixture
-    def retry_adapter(self):
-        """Create retry adapter instance for testing"""
-        return AttackTableRestAdapterWithRetry(
-            base_url="http://test-api.com",
-            timeout=5.0,
-            max_retries=2,
-            retry_delay=0.1,  # Short delay for testing
-        )
-
-    @pytest.mark.asyncio
-    async def test_retry_on_failure_then_success(self, retry_adapter):
-        """Test retry mechanism with eventual success"""
-        mock_response_data = {"roll": 80, "at": 15, "damage": 12, "critical": None}
-
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value = mock_client
-
-            # First call fails, second succeeds
-            first_response = AsyncMock()
-            first_response.status_code = 500
-            first_response.text = "Server Error"
-            first_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-                "500 Server Error", request=AsyncMock(), response=first_response
-            )
-
-            second_response = AsyncMock()
-            second_response.status_code = 200
-            second_response.json.return_value = mock_response_data
-
-            mock_client.get.side_effect = [first_response, second_response]
-
-            # Execute
-            result = await retry_adapter.get_attack_table_entry(roll=80, at=15)
-
-            # Verify success after retry
-            assert result is not None
-            assert result.roll == 80
-            assert result.at == 15
-            assert result.damage == 12
-            assert result.critical is None
-
-            # Verify two calls were made
-            assert mock_client.get.call_count == 2
-
-    @pytest.mark.asyncio
-    async def test_retry_exhausted(self, retry_adapter):
-        """Test all retries exhausted"""
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value = mock_client
-
-            # All calls fail
-            mock_response = AsyncMock()
-            mock_response.status_code = 500
-            mock_response.text = "Persistent Error"
-            mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-                "500 Server Error", request=AsyncMock(), response=mock_response
-            )
-            mock_client.get.return_value = mock_response
-
-            # Execute and verify exception
-            with pytest.raises(Exception) as exc_info:
-                await retry_adapter.get_attack_table_entry(roll=70, at=20)
-
-            assert "Attack table API error: 500" in str(exc_info.value)
-
-            # Verify retry attempts (original + 2 retries = 3 total)
-            assert mock_client.get.call_count == 3
@@ -0,0 +1,166 @@
+"""
+Tests for memory-mapped table snapshots.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.application.ports import AttackTableClient
+from app.domain.entities import (
+    AttackTableEntry,
+    CriticalEffect,
+    CriticalTableEntry,
+    FumbleTableEntry,
+)
+from app.infrastructure.api.attack_table_snapshot import (
+    SnapshotAttackTableClient,
+    TableSnapshot,
+    TableSnapshotException,
+    TableSnapshotWriter,
+)
+from app.infrastructure.api.export_table_snapshot import export_snapshot
+
+
+def attack_entry(roll: int, at: int) -> AttackTableEntry:
+    if roll < 60:
+        return AttackTableEntry(text="0", damage=0)
+    damage = roll // 10 - at
+    return AttackTableEntry(
+        text=f"{damage}A", damage=damage, critical_type="S", critical_severity="A"
+    )
+
+
+def critical_entry(roll: int) -> CriticalTableEntry:
+    return CriticalTableEntry(
+        damage=roll // 10,
+        location="arm",
+        text=f"Critical {roll}",
+        effects=[CriticalEffect(status="bleeding", value=roll // 50)],
+    )
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    writer = TableSnapshotWriter()
+    writer.add_attack_table(
+        "arming-sword",
+        "medium",
+        {at: [attack_entry(roll, at) for roll in range(1, 176)] for at in (1, 2)},
+    )
+    writer.add_critical_table(
+        "S", "A", [critical_entry(roll) for roll in range(1, 101)]
+    )
+    writer.add_fumble_table(
+        "melee", [FumbleTableEntry(text=f"Fumble {roll}") for roll in range(1, 101)]
+    )
+    path = str(tmp_path / "tables.snapshot")
+    writer.write(path)
+    return path
+
+
+class TestTableSnapshot:
+    """Test cases for TableSnapshot"""
+
+    def test_reads_written_tables(self, snapshot_path):
+        snapshot = TableSnapshot(snapshot_path)
+        try:
+            assert snapshot.attack_tables == [("arming-sword", "medium")]
+            assert snapshot.get_attack_table_entry(
+                "arming-sword", "medium", 120, 2
+            ) == attack_entry(120, 2)
+            assert snapshot.get_attack_table_entry(
+                "arming-sword", "medium", 400, 1
+            ) == attack_entry(175, 1)
+            assert (
+                snapshot.get_attack_table_entry("arming-sword", "medium", 1, 3) is None
+            )
+            assert snapshot.get_attack_table_row("arming-sword", "medium", 1)[
+                79
+            ] == attack_entry(80, 1)
+            assert snapshot.get_critical_table_entry("S", "A", 77) == critical_entry(77)
+            assert snapshot.get_critical_table_entry("S", "A", 101) is None
+            assert snapshot.get_fumble_table_entry("melee", 5).text == "Fumble 5"
+        finally:
+            snapshot.close()
+
+    def test_decodes_rows_on_demand(self, snapshot_path):
+        snapshot = TableSnapshot(snapshot_path, row_cache_size=1)
+        try:
+            row = snapshot.get_attack_table_row("arming-sword", "medium", 1)
+            assert snapshot.get_attack_table_entry("arming-sword", "medium", 80, 1) is (
+                row[79]
+            )
+            snapshot.get_attack_table_entry("arming-sword", "medium", 80, 2)
+
+            stats = snapshot.stats()
+            assert stats["size"] == 1
+            assert stats["hits"] == 1
+            assert stats["misses"] == 2
+            assert stats["evictions"] == 1
+        finally:
+            snapshot.close()
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not a snapshot")
+        with pytest.raises(TableSnapshotException):
+            TableSnapshot(str(path))
+
+
+class TestSnapshotAttackTableClient:
+    """Test cases for SnapshotAttackTableClient"""
+
+    @pytest.mark.asyncio
+    async def test_serves_from_snapshot_and_falls_back(self, snapshot_path):
+        fallback = AsyncMock(spec=AttackTableClient)
+        fallback.get_attack_table_entry.return_value = AttackTableEntry(
+            text="fallback", damage=1
+        )
+        client = SnapshotAttackTableClient.from_file(snapshot_path, fallback=fallback)
+
+        entry = await client.get_attack_table_entry("arming-sword", "medium", 99, 1)
+        missing = await client.get_attack_table_entry("dagger", "medium", 99, 1)
+
+        assert entry == attack_entry(99, 1)
+        assert missing.text == "fallback"
+        assert client.snapshot_hits == 1
+        assert client.snapshot_misses == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_missing_entry_without_fallback(self, snapshot_path):
+        client = SnapshotAttackTableClient.from_file(snapshot_path)
+        with pytest.raises(TableSnapshotException):
+            await client.get_critical_table_entry("K", "A", 10)
+        await client.close()
+
+
+class TestExportSnapshot:
+    """Test cases for the snapshot export"""
+
+    @pytest.mark.asyncio
+    async def test_export_from_client(self, tmp_path):
+        client = AsyncMock(spec=AttackTableClient)
+        client.get_attack_table_entry.side_effect = (
+            lambda attack_table, size, roll, at: attack_entry(roll, at)
+        )
+        client.get_critical_table_entry.side_effect = (
+            lambda critical_type, critical_severity, roll: critical_entry(roll)
+        )
+        path = str(tmp_path / "export.snapshot")
+
+        await export_snapshot(
+            client,
+            path,
+            attack_tables=[("arming-sword", "medium")],
+            at_values=(1, 2, 3),
+            critical_types=["S"],
+            critical_severities=["A", "B"],
+        )
+
+        snapshot = TableSnapshot(path)
+        assert snapshot.get_attack_table_entry(
+            "arming-sword", "medium", 150, 3
+        ) == attack_entry(150, 3)
+        assert snapshot.critical_tables == [("S", "A"), ("S", "B")]
+        snapshot.close()
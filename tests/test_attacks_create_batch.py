@@ -0,0 +1,179 @@
+"""
+Tests for batch creation of attacks.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from pymongo.errors import BulkWriteError
+
+from app.application.commands import CreateAttackCommand, CreateAttacksBatchCommand
+from app.application.ports import AttackRepository, AttackTableClient
+from app.application.use_cases import CreateAttacksBatchUseCase
+from app.domain.entities import (
+    Attack,
+    AttackModifiers,
+    AttackRollModifiers,
+    AttackSituationalModifiers,
+    AttackStatus,
+    AttackType,
+    BatchItemError,
+    BatchResult,
+)
+from app.domain.services import AttackCalculator, AttackDomainService
+from app.infrastructure.persistence.mongo_attack_repository import (
+    MongoAttackRepository,
+)
+from app.interfaces.http.dto import CreateAttacksBatchRequestDTO
+
+
+def build_command(target_id: str) -> CreateAttackCommand:
+    return CreateAttackCommand(
+        action_id="action_001",
+        source_id="source_001",
+        target_id=target_id,
+        modifiers=AttackModifiers(
+            attack_type=AttackType.MELEE,
+            attack_table="arming-sword",
+            roll_modifiers=AttackRollModifiers(bo=50),
+            situational_modifiers=AttackSituationalModifiers(
+                source_status=[], target_status=[]
+            ),
+            features=[],
+            source_skills=[],
+        ),
+    )
+
+
+class TestCreateAttacksBatch:
+    """Test cases for CreateAttacksBatchUseCase"""
+
+    @pytest.fixture
+    def repository(self):
+        repository = AsyncMock(spec=AttackRepository)
+
+        def save_all(attacks):
+            result = BatchResult()
+            for index, attack in enumerate(attacks):
+                if attack.target_id == "duplicated":
+                    result.errors.append(BatchItemError(index=index, message="E11000"))
+                else:
+                    attack.id = f"id_{attack.target_id}"
+                    result.content.append(attack)
+            return result
+
+        repository.save_all.side_effect = save_all
+        return repository
+
+    @pytest.fixture
+    def use_case(self, repository):
+        calculator = AttackCalculator(
+            attack_table_client=AsyncMock(spec=AttackTableClient)
+        )
+        return CreateAttacksBatchUseCase(
+            AttackDomainService(
+                attack_repository=repository, attack_calculator=calculator
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_creates_attacks_in_bulk(self, use_case, repository):
+        command = CreateAttacksBatchCommand(
+            attacks=[
+                build_command("t1"),
+                None,
+                build_command(""),
+                build_command("duplicated"),
+                build_command("t2"),
+            ],
+            errors=[BatchItemError(index=1, message="Invalid modifiers")],
+        )
+
+        result = await use_case.execute(command)
+
+        repository.save_all.assert_awaited_once()
+        assert len(repository.save_all.await_args.args[0]) == 3
+        assert [attack.id for attack in result.content] == ["id_t1", "id_t2"]
+        assert result.content[0].calculated is not None
+        assert [error.index for error in result.errors] == [1, 2, 3]
+        assert result.errors[2].message == "E11000"
+
+    @pytest.mark.asyncio
+    async def test_rejects_empty_batch(self, use_case):
+        with pytest.raises(ValueError):
+            await use_case.execute(CreateAttacksBatchCommand(attacks=[]))
+
+
+class TestCreateAttacksBatchRequestDTO:
+    """Test cases for CreateAttacksBatchRequestDTO"""
+
+    def test_malformed_item_is_reported_at_its_index(self):
+        item = {
+            "actionId": "action_001",
+            "sourceId": "source_001",
+            "targetId": "target_001",
+            "modifiers": {
+                "attackType": "melee",
+                "attackTable": "arming-sword",
+                "attackSize": "medium",
+                "fumbleTable": "melee-one-hand",
+                "at": 1,
+                "actionPoints": 4,
+                "rollModifiers": {"bo": 50, "bd": -10},
+                "situationalModifiers": {},
+            },
+        }
+        request = CreateAttacksBatchRequestDTO.model_validate(
+            [item, {"actionId": "action_001", "modifiers": "melee"}, item]
+        )
+
+        command = request.to_command()
+
+        assert command.attacks[1] is None
+        assert [attack.target_id for attack in command.attacks if attack] == [
+            "target_001",
+            "target_001",
+        ]
+        assert [error.index for error in command.errors] == [1]
+        assert "sourceId: Field required" in command.errors[0].message
+
+
+class TestMongoSaveAll:
+    """Test cases for MongoAttackRepository.save_all"""
+
+    @pytest.mark.asyncio
+    async def test_maps_write_errors_to_items(self):
+        repository = MongoAttackRepository.__new__(MongoAttackRepository)
+        repository.connect = AsyncMock()
+        repository._converter = MagicMock()
+        repository._converter.attack_to_dict.side_effect = lambda attack, **_: {
+            "targetId": attack.target_id
+        }
+
+        async def insert_many(documents, ordered):
+            assert ordered is False
+            for i, document in enumerate(documents):
+                document["_id"] = f"oid{i}"
+            raise BulkWriteError(
+                {"writeErrors": [{"index": 1, "errmsg": "duplicate key"}]}
+            )
+
+        repository._collection = MagicMock()
+        repository._collection.insert_many = insert_many
+        attacks = [
+            Attack(
+                id=None,
+                action_id=command.action_id,
+                source_id=command.source_id,
+                target_id=command.target_id,
+                modifiers=command.modifiers,
+                status=AttackStatus.PENDING_ATTACK_ROLL,
+            )
+            for command in (build_command(f"t{i}") for i in range(3))
+        ]
+
+        result = await repository.save_all(attacks)
+
+        assert [attack.id for attack in result.content] == ["oid0", "oid2"]
+        assert [(error.index, error.message) for error in result.errors] == [
+            (1, "duplicate key")
+        ]
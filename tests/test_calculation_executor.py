@@ -0,0 +1,166 @@
+"""
+Tests for the inline and process pool calculation executors.
+"""
+
+import asyncio
+import copy
+import random
+
+import pytest
+
+from app.domain.services import AttackCalculator, AttackSimulator
+from app.infrastructure.api.attack_table_snapshot import TableSnapshotWriter
+from app.infrastructure.calculation import (
+    InlineCalculationExecutor,
+    ProcessPoolCalculationExecutor,
+)
+from tests.test_attack_calculate_many import FakeTableClient, random_attacks
+from tests.test_attack_roll_modifiers import random_attack
+
+
+class InvalidSeverityTableClient(FakeTableClient):
+    """The criticals of the 'invalid-sword' table have an unknown severity"""
+
+    async def get_attack_table_entry(self, attack_table, size, roll, at):
+        if attack_table != "invalid-sword":
+            return await super().get_attack_table_entry(attack_table, size, roll, at)
+        entry = await super().get_attack_table_entry("arming-sword", size, roll, at)
+        if entry.critical_type:
+            entry.critical_severity = "X"
+        return entry
+
+
+@pytest.fixture(scope="module")
+def snapshot_path(tmp_path_factory):
+    """
+    Snapshot of the arming-sword and invalid-sword tables only, other tables
+    are misses
+    """
+    client = InvalidSeverityTableClient()
+
+    async def rows(attack_table):
+        return {
+            at: await client.get_attack_table_row(attack_table, "medium", at)
+            for at in (1, 2, 3)
+        }
+
+    writer = TableSnapshotWriter()
+    for attack_table in ("arming-sword", "invalid-sword"):
+        writer.add_attack_table(attack_table, "medium", asyncio.run(rows(attack_table)))
+    path = str(tmp_path_factory.mktemp("snapshot") / "tables.snapshot")
+    writer.write(path)
+    return path
+
+
+@pytest.fixture(scope="module")
+def pool_executor(snapshot_path):
+    """Workers take a while to spawn, the tests share them and compare counters"""
+    executor = ProcessPoolCalculationExecutor(
+        AttackCalculator(attack_table_client=FakeTableClient()),
+        snapshot_path=snapshot_path,
+        max_workers=2,
+        min_batch_size=100,
+        min_samples=1000,
+    )
+    yield executor
+    asyncio.run(executor.close())
+
+
+async def inline_results(attacks) -> list:
+    executor = InlineCalculationExecutor(
+        AttackCalculator(attack_table_client=FakeTableClient())
+    )
+    return await executor.calculate_attacks(attacks)
+
+
+class TestProcessPoolCalculationExecutor:
+    """Test cases for ProcessPoolCalculationExecutor"""
+
+    @pytest.mark.asyncio
+    async def test_same_results_as_inline(self, pool_executor):
+        attacks = random_attacks(600, seed=21)
+        attacks[10].roll = None
+        expected = copy.deepcopy(attacks)
+        expected_errors = await inline_results(expected)
+        await pool_executor.start()
+        before = pool_executor.stats()
+
+        errors = await pool_executor.calculate_attacks(attacks)
+
+        assert [str(error) for error in errors] == [
+            str(error) for error in expected_errors
+        ]
+        assert isinstance(errors[10], ValueError)
+        for attack, inline_attack in zip(attacks, expected):
+            assert attack.calculated == inline_attack.calculated
+            assert attack.results == inline_attack.results
+            assert attack.status == inline_attack.status
+        stats = pool_executor.stats()
+        assert stats["offloadedBatches"] == before["offloadedBatches"] + 1
+        # short-bow and broken tables are not in the snapshot
+        assert stats["snapshotMisses"] - before["snapshotMisses"] == sum(
+            attack.modifiers.attack_table != "arming-sword" for attack in attacks
+        )
+        assert stats["pending"] == 0
+        assert stats["queueDepth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_invalid_criticals_are_the_same_errors_as_inline(self, pool_executor):
+        attacks = random_attacks(300, seed=23)
+        for attack in attacks:
+            attack.modifiers.attack_table = "invalid-sword"
+        expected = copy.deepcopy(attacks)
+        expected_errors = await InlineCalculationExecutor(
+            AttackCalculator(attack_table_client=InvalidSeverityTableClient())
+        ).calculate_attacks(expected)
+        before = pool_executor.stats()
+
+        errors = await pool_executor.calculate_attacks(attacks)
+
+        assert pool_executor.stats()["offloadedBatches"] == (
+            before["offloadedBatches"] + 1
+        )
+        assert pool_executor.stats()["snapshotMisses"] == before["snapshotMisses"]
+        assert any(isinstance(error, ValueError) for error in errors)
+        assert [repr(error) for error in errors] == [
+            repr(error) for error in expected_errors
+        ]
+        for attack, inline_attack, error in zip(attacks, expected, errors):
+            if error is None:
+                assert attack.results == inline_attack.results
+                assert attack.status == inline_attack.status
+
+    @pytest.mark.asyncio
+    async def test_small_batches_run_inline(self, pool_executor):
+        attacks = random_attacks(10, seed=4)
+        before = pool_executor.stats()
+
+        await pool_executor.calculate_attacks(attacks)
+
+        stats = pool_executor.stats()
+        assert stats["offloadedBatches"] == before["offloadedBatches"]
+        assert stats["inlineBatches"] == before["inlineBatches"] + 1
+
+    @pytest.mark.asyncio
+    async def test_simulation_on_workers(self, pool_executor):
+        modifiers = random_attack(random.Random(8)).modifiers
+        client = FakeTableClient()
+
+        def simulator(executor=None) -> AttackSimulator:
+            return AttackSimulator(
+                attack_calculator=AttackCalculator(attack_table_client=client),
+                attack_table_client=client,
+                calculation_executor=executor,
+            )
+
+        before = pool_executor.stats()
+
+        simulation = await simulator(pool_executor).simulate(
+            modifiers, samples=5000, seed=3
+        )
+
+        assert simulation == await simulator().simulate(modifiers, samples=5000, seed=3)
+        assert (
+            pool_executor.stats()["offloadedSimulations"]
+            == before["offloadedSimulations"] + 1
+        )
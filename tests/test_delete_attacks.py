@@ -0,0 +1,69 @@
+"""
+Tests for bulk deletion of attacks.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.application.ports import AttackRepository
+from app.application.use_cases import DeleteAttacksUseCase
+from app.infrastructure.persistence.mongo_attack_repository import (
+    MongoAttackRepository,
+)
+from app.infrastructure.persistence.rsql_parser import RSQLParser
+
+
+class TestDeleteAttacksUseCase:
+    """Test cases for DeleteAttacksUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_requires_a_filter(self):
+        repository = AsyncMock(spec=AttackRepository)
+        use_case = DeleteAttacksUseCase(repository)
+
+        with pytest.raises(ValueError):
+            await use_case.execute(rsql_query="  ")
+        repository.delete_many.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_returns_deleted_count(self):
+        repository = AsyncMock(spec=AttackRepository)
+        repository.delete_many.return_value = 7
+        use_case = DeleteAttacksUseCase(repository)
+
+        assert await use_case.execute(action_id="action_001") == 7
+        repository.delete_many.assert_awaited_once_with(
+            rsql_query=None, action_id="action_001"
+        )
+
+
+class TestMongoDeleteMany:
+    """Test cases for MongoAttackRepository.delete_many"""
+
+    @pytest.fixture
+    def repository(self):
+        repository = MongoAttackRepository.__new__(MongoAttackRepository)
+        repository.connect = AsyncMock()
+        repository._rsql_parser = RSQLParser()
+        repository._collection = MagicMock()
+        repository._collection.delete_many = AsyncMock(
+            return_value=MagicMock(deleted_count=3)
+        )
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_combines_filters_in_a_single_delete(self, repository):
+        deleted = await repository.delete_many(
+            rsql_query="status==APPLIED", action_id="action_001"
+        )
+
+        assert deleted == 3
+        repository._collection.delete_many.assert_awaited_once_with(
+            {"$and": [{"status": "APPLIED"}, {"actionId": "action_001"}]}
+        )
+
+    @pytest.mark.asyncio
+    async def test_rejects_filters_matching_everything(self, repository):
+        with pytest.raises(ValueError):
+            await repository.delete_many(rsql_query="not a filter")
+        repository._collection.delete_many.assert_not_awaited()
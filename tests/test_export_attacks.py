@@ -0,0 +1,78 @@
+"""
+Tests for the streaming export of attacks.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.application.use_cases import ExportAttacksUseCase
+from app.infrastructure.persistence.mongo_attack_repository import (
+    MongoAttackRepository,
+)
+from app.infrastructure.persistence.rsql_parser import RSQLParser
+
+
+class FakeCursor:
+    """Motor cursor stand-in yielding documents one by one"""
+
+    def __init__(self, documents):
+        self._documents = documents
+        self.batch = None
+        self.closed = False
+
+    def sort(self, *args):
+        return self
+
+    def batch_size(self, batch_size):
+        self.batch = batch_size
+        return self
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for document in self._documents:
+            yield document
+
+    async def close(self):
+        self.closed = True
+
+
+class TestExportAttacks:
+    """Test cases for MongoAttackRepository.stream_by_rsql"""
+
+    @pytest.fixture
+    def cursor(self):
+        return FakeCursor([{"_id": "a1"}, {"_id": "a2"}, {"_id": "a3"}])
+
+    @pytest.fixture
+    def repository(self, cursor):
+        repository = MongoAttackRepository.__new__(MongoAttackRepository)
+        repository.connect = AsyncMock()
+        repository._rsql_parser = RSQLParser()
+        repository._index_advisor = None
+        repository._converter = MagicMock()
+        repository._converter.dict_to_attack.side_effect = lambda doc: doc["_id"]
+        repository._collection = MagicMock()
+        repository._collection.find.return_value = cursor
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_streams_with_configured_batch_size(self, repository, cursor):
+        use_case = ExportAttacksUseCase(repository, batch_size=2)
+
+        attacks = [attack async for attack in use_case.execute("status==applied")]
+
+        assert attacks == ["a1", "a2", "a3"]
+        repository._collection.find.assert_called_once_with({"status": "applied"})
+        assert cursor.batch == 2
+        assert cursor.closed is True
+
+    @pytest.mark.asyncio
+    async def test_closes_cursor_when_stopped_early(self, repository, cursor):
+        stream = repository.stream_by_rsql(batch_size=2)
+
+        assert await stream.__anext__() == "a1"
+        await stream.aclose()
+
+        assert cursor.closed is True
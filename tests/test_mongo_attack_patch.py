@@ -0,0 +1,242 @@
+"""
+Tests for the partial updates of dirty attack fields.
+"""
+
+import random
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from app.application.ports import AttackRepository
+from app.domain.entities import AttackResult, AttackRoll, AttackTableEntry
+from app.domain.services import AttackCalculator, AttackResolutionService
+from app.infrastructure.persistence import MongoAttackRepository
+from app.infrastructure.persistence.mongo_attack_converter import MongoAttackConverter
+from tests.test_attack_calculate_many import FakeTableClient
+from tests.test_attack_roll_modifiers import random_attack
+
+
+async def attack_with_criticals():
+    attack = random_attack(random.Random(0))
+    attack.id = str(ObjectId())
+    attack.roll = AttackRoll(roll=90)
+    attack.modifiers.fumble = 0
+    await AttackCalculator(attack_table_client=FakeTableClient()).calculate_attack(
+        attack
+    )
+    attack.results = AttackResult(
+        attack_table_entry=AttackTableEntry(
+            text="20IS", damage=20, critical_type="S", critical_severity="I"
+        ),
+        criticals=[],
+    )
+    AttackCalculator().create_critical_results(attack)
+    AttackCalculator().update_status(attack)
+    # As loaded from the database
+    attack = MongoAttackConverter.dict_to_attack(
+        MongoAttackConverter.attack_to_dict(attack)
+    )
+    return attack
+
+
+class TestDirtyFields:
+    """Test cases for the dirty fields of Attack"""
+
+    @pytest.mark.asyncio
+    async def test_assigned_and_marked_fields_are_dirty(self):
+        attack = await attack_with_criticals()
+        assert attack.dirty_fields() == set()
+
+        attack.status = attack.status
+        attack.modifiers.roll_modifiers.parry = 10
+        attack.mark_dirty("modifiers")
+
+        assert attack.dirty_fields() == {"status", "modifiers"}
+        attack.clear_dirty()
+        assert attack.dirty_fields() == set()
+
+
+class TestAttackToUpdate:
+    """Test cases for MongoAttackConverter.attack_to_update"""
+
+    @pytest.mark.asyncio
+    async def test_critical_roll_updates_only_its_paths(self):
+        attack = await attack_with_criticals()
+        critical = attack.results.criticals[1]
+        attack.roll.critical_rolls = {critical.key: 55}
+        critical.adjusted_roll = 55
+
+        update, array_filters = MongoAttackConverter.attack_to_update(
+            attack,
+            {
+                f"roll.critical_rolls.{critical.key}",
+                f"results.criticals.{critical.key}",
+            },
+        )
+
+        assert update == {
+            "$set": {
+                f"roll.criticalRolls.{critical.key}": 55,
+                "results.criticals.$[c0]": MongoAttackConverter.critical_result_to_dict(
+                    critical
+                ),
+            }
+        }
+        assert array_filters == [{"c0.key": critical.key}]
+
+    @pytest.mark.asyncio
+    async def test_paths_inside_updated_fields_are_dropped(self):
+        attack = await attack_with_criticals()
+        key = attack.results.criticals[0].key
+
+        update, array_filters = MongoAttackConverter.attack_to_update(
+            attack, {"results", f"results.criticals.{key}", "status"}
+        )
+
+        document = MongoAttackConverter.attack_to_dict(attack)
+        assert update == {
+            "$set": {"results": document["results"], "status": document["status"]}
+        }
+        assert array_filters == []
+
+    @pytest.mark.asyncio
+    async def test_unknown_paths_update_the_whole_field(self):
+        attack = await attack_with_criticals()
+
+        update, _ = MongoAttackConverter.attack_to_update(
+            attack, {"modifiers.roll_modifiers.parry", "results.criticals.unknown"}
+        )
+
+        assert set(update["$set"]) == {"modifiers", "results"}
+
+    @pytest.mark.asyncio
+    async def test_cleared_fields_are_unset(self):
+        attack = await attack_with_criticals()
+        attack.calculated = None
+
+        update, _ = MongoAttackConverter.attack_to_update(attack, {"calculated"})
+
+        assert update == {"$unset": {"calculated": ""}}
+
+
+class TestPatch:
+    """Test cases for MongoAttackRepository.patch"""
+
+    @pytest.fixture
+    def repository(self):
+        repository = MongoAttackRepository()
+        repository.connect = AsyncMock()
+        repository._collection = MagicMock()
+        repository._collection.update_one = AsyncMock(
+            return_value=MagicMock(matched_count=1)
+        )
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_critical_rolls_are_created_before_setting_a_roll(self, repository):
+        attack = await attack_with_criticals()
+        key = attack.results.criticals[0].key
+        attack.roll.critical_rolls = {key: 40}
+        attack.mark_dirty(f"roll.critical_rolls.{key}")
+
+        assert await repository.patch(attack) is attack
+
+        create, update = repository._collection.update_one.await_args_list
+        object_id = ObjectId(attack.id)
+        assert create.args == (
+            {"_id": object_id, "roll.criticalRolls": None},
+            {"$set": {"roll.criticalRolls": {}}},
+        )
+        assert update.args == (
+            {"_id": object_id},
+            {"$set": {f"roll.criticalRolls.{key}": 40}},
+        )
+        assert update.kwargs == {"array_filters": None}
+        assert attack.dirty_fields() == set()
+
+    @pytest.mark.asyncio
+    async def test_missing_attack_is_not_patched(self, repository):
+        repository._collection.update_one.return_value = MagicMock(matched_count=0)
+        attack = await attack_with_criticals()
+        attack.status = attack.status
+
+        assert await repository.patch(attack) is None
+        assert attack.dirty_fields() == {"status"}
+
+
+class TestUpdateAll:
+    """Test cases for MongoAttackRepository.update_all"""
+
+    @pytest.fixture
+    def repository(self):
+        repository = MongoAttackRepository()
+        repository.connect = AsyncMock()
+        repository._collection = MagicMock()
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_only_dirty_fields_are_written(self, repository):
+        repository._collection.bulk_write = AsyncMock(
+            return_value=MagicMock(matched_count=2)
+        )
+        attacks = [await attack_with_criticals(), await attack_with_criticals()]
+        for attack in attacks:
+            attack.status = attack.status
+
+        assert await repository.update_all(attacks) == attacks
+
+        (operations,), kwargs = repository._collection.bulk_write.await_args
+        assert operations == [
+            UpdateOne(
+                {"_id": ObjectId(attack.id)}, {"$set": {"status": attack.status.value}}
+            )
+            for attack in attacks
+        ]
+        assert kwargs == {"ordered": False}
+        assert all(attack.dirty_fields() == set() for attack in attacks)
+
+    @pytest.mark.asyncio
+    async def test_missing_attacks_are_not_returned(self, repository):
+        repository._collection.bulk_write = AsyncMock(
+            return_value=MagicMock(matched_count=1)
+        )
+        attacks = [await attack_with_criticals(), await attack_with_criticals()]
+        for attack in attacks:
+            attack.status = attack.status
+
+        async def existing(*_):
+            yield {"_id": ObjectId(attacks[1].id)}
+
+        repository._collection.find.side_effect = existing
+
+        assert await repository.update_all(attacks) == [attacks[1]]
+        assert attacks[0].dirty_fields() == {"status"}
+
+
+class TestUpdateCriticalRoll:
+    """Test cases for AttackResolutionService.update_critical_roll"""
+
+    @pytest.mark.asyncio
+    async def test_marks_only_the_rolled_critical(self):
+        attack = await attack_with_criticals()
+        key = attack.results.criticals[1].key
+        repository = AsyncMock(spec=AttackRepository)
+        repository.find_by_id.return_value = attack
+        repository.patch.side_effect = lambda patched: patched
+        table_client = AsyncMock()
+        service = AttackResolutionService(
+            attack_repository=repository,
+            attack_calculator=AttackCalculator(),
+            attack_table_client=table_client,
+        )
+
+        await service.update_critical_roll(attack.id, key, 60)
+
+        repository.patch.assert_awaited_once_with(attack)
+        repository.update.assert_not_awaited()
+        assert attack.dirty_fields() == {
+            f"roll.critical_rolls.{key}",
+            f"results.criticals.{key}",
+        }
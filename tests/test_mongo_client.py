@@ -0,0 +1,93 @@
+"""
+Tests for the shared MongoDB client and its pool metrics.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from app.infrastructure.config.config import settings
+from app.infrastructure.persistence import (
+    MongoAttackRepository,
+    MongoPoolMetrics,
+    close_mongo_client,
+    get_mongo_client,
+    get_pool_metrics,
+)
+from app.infrastructure.persistence.mongo_client import mongo_client_options
+
+
+class TestMongoPoolMetrics:
+    """Test cases for MongoPoolMetrics"""
+
+    def test_checkout_lifecycle(self):
+        metrics = MongoPoolMetrics()
+        event = MagicMock()
+
+        metrics.connection_created(event)
+        metrics.connection_check_out_started(event)
+        metrics.connection_check_out_started(event)
+        metrics.connection_checked_out(event)
+        metrics.connection_check_out_failed(event)
+
+        stats = metrics.stats()
+        assert stats["open"] == 1
+        assert stats["checkedOut"] == 1
+        assert stats["waiting"] == 0
+        assert stats["maxWaiting"] == 2
+        assert stats["checkouts"] == 1
+        assert stats["checkoutFailures"] == 1
+
+        metrics.connection_checked_in(event)
+        metrics.connection_closed(event)
+        stats = metrics.stats()
+        assert stats["checkedOut"] == 0
+        assert stats["open"] == 0
+
+
+class TestSharedMongoClient:
+    """Test cases for the process wide client"""
+
+    @pytest.fixture(autouse=True)
+    def shared_client(self, monkeypatch):
+        monkeypatch.setattr(settings, "MONGODB_MAX_POOL_SIZE", 20)
+        monkeypatch.setattr(settings, "MONGODB_MIN_POOL_SIZE", 2)
+        monkeypatch.setattr(settings, "MONGODB_MAX_IDLE_TIME_MS", 30000)
+        monkeypatch.setattr(settings, "MONGODB_WAIT_QUEUE_TIMEOUT_MS", 1000)
+        monkeypatch.setattr(settings, "MONGODB_COMPRESSORS", "zlib")
+        close_mongo_client()
+        yield
+        close_mongo_client()
+
+    def test_options_from_settings(self):
+        assert mongo_client_options() == {
+            "maxPoolSize": 20,
+            "minPoolSize": 2,
+            "maxIdleTimeMS": 30000,
+            "waitQueueTimeoutMS": 1000,
+            "compressors": "zlib",
+        }
+
+    def test_client_is_shared(self):
+        client = get_mongo_client()
+
+        assert get_mongo_client() is client
+        assert client.options.pool_options.max_pool_size == 20
+        assert client.options.pool_options.min_pool_size == 2
+        assert client.options.pool_options.max_idle_time_seconds == 30
+        assert get_pool_metrics() is not None
+
+    def test_close_resets_client(self):
+        client = get_mongo_client()
+        close_mongo_client()
+
+        assert get_pool_metrics() is None
+        assert get_mongo_client() is not client
+
+    @pytest.mark.asyncio
+    async def test_repository_uses_shared_client(self):
+        repository = MongoAttackRepository()
+        await repository.connect()
+
+        assert repository._client is get_mongo_client()
+        await repository.disconnect()
+        assert get_pool_metrics() is not None
@@ -0,0 +1,128 @@
+"""
+Tests for the RSQL index advisor.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.infrastructure.persistence.mongo_index_advisor import (
+    MongoIndexAdvisor,
+    QueryShape,
+    UnindexedQueryException,
+    query_shapes,
+)
+from app.infrastructure.persistence.rsql_parser import RSQLParser
+
+
+def build_collection(indexes, documents=50000):
+    collection = MagicMock()
+    collection.index_information = AsyncMock(
+        return_value={
+            "_".join(f"{field}_{order}" for field, order in keys): {"key": keys}
+            for keys in indexes
+        }
+    )
+    collection.estimated_document_count = AsyncMock(return_value=documents)
+    collection.create_index = AsyncMock(return_value="created_index")
+    explain = AsyncMock(
+        return_value={
+            "queryPlanner": {
+                "winningPlan": {
+                    "stage": "FETCH",
+                    "inputStage": {"stage": "IXSCAN", "indexName": "actionId_1"},
+                }
+            },
+            "executionStats": {"totalDocsExamined": 3, "nReturned": 3},
+        }
+    )
+    collection.find.return_value.sort.return_value.explain = explain
+    return collection
+
+
+DEFAULT_INDEXES = [[("_id", 1)], [("actionId", 1)], [("status", 1)]]
+
+
+class TestQueryShapes:
+    """Test cases for query_shapes"""
+
+    def test_groups_fields_by_index_usage(self):
+        query = RSQLParser.parse(
+            "actionId==a1;calculated.rollTotal=gt=10;targetId=like=orc*"
+        )
+
+        assert query_shapes(query) == [
+            QueryShape(
+                equality=("actionId",),
+                range=("calculated.rollTotal",),
+                regex=("targetId",),
+            )
+        ]
+
+    def test_or_branches_give_separate_shapes(self):
+        query = RSQLParser.parse("actionId==a1;(sourceId==s1,targetId==t1)")
+
+        assert [shape.equality for shape in query_shapes(query)] == [
+            ("actionId", "sourceId"),
+            ("actionId", "targetId"),
+        ]
+
+
+class TestMongoIndexAdvisor:
+    """Test cases for MongoIndexAdvisor"""
+
+    @pytest.mark.asyncio
+    async def test_reports_unindexed_regex_scan_on_large_collection(self):
+        advisor = MongoIndexAdvisor(build_collection(DEFAULT_INDEXES))
+
+        await advisor.check(RSQLParser.parse("targetId=like=orc*"))
+        await advisor.check(RSQLParser.parse("targetId=like=gob*"))
+
+        assert advisor.rejected == 2
+
+    @pytest.mark.asyncio
+    async def test_rejects_unindexed_regex_scan_when_enabled(self):
+        advisor = MongoIndexAdvisor(
+            build_collection(DEFAULT_INDEXES), reject_unindexed=True
+        )
+
+        with pytest.raises(UnindexedQueryException):
+            await advisor.check(RSQLParser.parse("targetId=like=orc*"))
+        assert advisor.rejected == 1
+
+    @pytest.mark.asyncio
+    async def test_allows_regex_with_indexed_filter(self):
+        advisor = MongoIndexAdvisor(build_collection(DEFAULT_INDEXES))
+
+        await advisor.check(RSQLParser.parse("actionId==a1;targetId=like=orc*"))
+
+        assert advisor.rejected == 0
+
+    @pytest.mark.asyncio
+    async def test_allows_regex_scan_on_small_collection(self):
+        advisor = MongoIndexAdvisor(
+            build_collection(DEFAULT_INDEXES, documents=100),
+            regex_scan_threshold=1000,
+        )
+
+        await advisor.check(RSQLParser.parse("targetId=like=orc*"))
+
+    @pytest.mark.asyncio
+    async def test_report_and_create_missing_indexes(self):
+        collection = build_collection(DEFAULT_INDEXES)
+        advisor = MongoIndexAdvisor(collection)
+        await advisor.check(RSQLParser.parse("actionId==a1"))
+        await advisor.check(RSQLParser.parse("sourceId==s1;modifiers.at=ge=3"))
+
+        report = await advisor.report()
+        created = await advisor.create_missing_indexes()
+
+        assert [(shape["shape"], shape["indexed"]) for shape in report["shapes"]] == [
+            ("eq(actionId)", True),
+            ("eq(sourceId) range(modifiers.at)", False),
+        ]
+        assert report["shapes"][0]["plan"]["indexes"] == ["actionId_1"]
+        assert report["shapes"][0]["plan"]["collectionScan"] is False
+        assert created == ["created_index"]
+        collection.create_index.assert_awaited_once_with(
+            [("sourceId", 1), ("modifiers.at", 1)], background=True
+        )
@@ -0,0 +1,56 @@
+"""
+Tests for the index bootstrap of the attack repository.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.infrastructure.persistence import MongoAttackRepository
+
+
+class TestEnsureIndexes:
+    """Test cases for MongoAttackRepository.ensure_indexes"""
+
+    @pytest.fixture
+    def repository(self):
+        repository = MongoAttackRepository.__new__(MongoAttackRepository)
+        repository.connect = AsyncMock()
+        repository._collection = MagicMock()
+        repository._collection.index_information = AsyncMock(
+            return_value={
+                "_id_": {"key": [("_id", 1)]},
+                "actionId_1": {"key": [("actionId", 1)]},
+                "status_1": {"key": [("status", 1)]},
+            }
+        )
+        repository._collection.create_indexes = AsyncMock(
+            side_effect=lambda indexes: [index.document["name"] for index in indexes]
+        )
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_creates_only_missing_indexes(self, repository):
+        created = await repository.ensure_indexes()
+
+        assert created == [
+            "sourceId_1",
+            "targetId_1",
+            "actionId_1_status_1",
+            "sourceId_1_targetId_1",
+            "actionId_1_sourceId_1_targetId_1",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_continues_after_a_failed_index(self, repository):
+        def create_indexes(indexes):
+            name = indexes[0].document["name"]
+            if name == "sourceId_1":
+                raise Exception("index build failed")
+            return [name]
+
+        repository._collection.create_indexes.side_effect = create_indexes
+
+        created = await repository.ensure_indexes()
+
+        assert "sourceId_1" not in created
+        assert "sourceId_1_targetId_1" in created
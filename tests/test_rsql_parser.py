@@ -0,0 +1,115 @@
+"""
+Tests for the RSQL parser
+"""
+
+import pytest
+
+from app.infrastructure.persistence.rsql_parser import (
+    Comparison,
+    Logical,
+    RSQLParser,
+    RSQLSyntaxError,
+)
+
+
+class TestRSQLParser:
+    """Test cases for RSQLParser.parse"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        RSQLParser.clear_cache()
+        yield
+        RSQLParser.clear_cache()
+
+    @pytest.mark.parametrize(
+        "query, expected",
+        [
+            ("", {}),
+            ("status==DRAFT", {"status": "DRAFT"}),
+            (
+                "actionId==action_001;sourceId==source_001",
+                {"actionId": "action_001", "sourceId": "source_001"},
+            ),
+            (
+                "actionId==a1 and status!=applied",
+                {"actionId": "a1", "status": {"$ne": "applied"}},
+            ),
+            ("status=in=(DRAFT,APPLIED)", {"status": {"$in": ["DRAFT", "APPLIED"]}}),
+            ("status=out=DRAFT", {"status": {"$nin": ["DRAFT"]}}),
+            ("modifiers.at=ge=5", {"modifiers.at": {"$gte": 5}}),
+            ('targetId=="target 1"', {"targetId": "target 1"}),
+            ("targetId=='target 1'", {"targetId": "target 1"}),
+            ("targetId==target  1", {"targetId": "target  1"}),
+            (
+                "targetId==Orc Chief and status==DRAFT",
+                {"targetId": "Orc Chief", "status": "DRAFT"},
+            ),
+            (
+                "targetId=in=(Orc Chief,Goblin)",
+                {"targetId": {"$in": ["Orc Chief", "Goblin"]}},
+            ),
+            (
+                "targetId=like=orc*",
+                {"targetId": {"$regex": "orc.*", "$options": "i"}},
+            ),
+        ],
+    )
+    def test_parse(self, query, expected):
+        assert RSQLParser.parse(query) == expected
+
+    def test_or_and_parentheses(self):
+        query = "actionId==a1;(status==draft,status==applied or sourceId==s1)"
+
+        assert RSQLParser.parse(query) == {
+            "actionId": "a1",
+            "$or": [
+                {"status": "draft"},
+                {"status": "applied"},
+                {"sourceId": "s1"},
+            ],
+        }
+
+    def test_repeated_keys_are_kept(self):
+        assert RSQLParser.parse(
+            "calculated.rollTotal=gt=10;calculated.rollTotal=lt=90"
+        ) == {
+            "$and": [
+                {"calculated.rollTotal": {"$gt": 10}},
+                {"calculated.rollTotal": {"$lt": 90}},
+            ]
+        }
+
+    def test_parse_ast(self):
+        assert RSQLParser.parse_ast("a==1,b=in=(2,3)") == Logical(
+            "or",
+            (
+                Comparison("a", "==", ("1",)),
+                Comparison("b", "=in=", ("2", "3"), True),
+            ),
+        )
+
+    @pytest.mark.parametrize(
+        "query",
+        ["status", "status==", "status=eq=x", "(status==x", "$where==1", "a==(1,2)"],
+    )
+    def test_rejects_malformed_queries(self, query):
+        with pytest.raises(RSQLSyntaxError):
+            RSQLParser.parse(query)
+
+    def test_cache_returns_independent_copies(self):
+        first = RSQLParser.parse("status=in=(a,b)")
+        first["status"]["$in"].append("c")
+
+        second = RSQLParser.parse("status=in=(a,b)")
+
+        assert second == {"status": {"$in": ["a", "b"]}}
+        assert RSQLParser.cache_stats()["hits"] == 1
+        assert RSQLParser.cache_stats()["misses"] == 1
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(RSQLParser, "CACHE_MAX_SIZE", 2)
+
+        for i in range(3):
+            RSQLParser.parse(f"status==s{i}")
+
+        assert RSQLParser.cache_stats()["size"] == 2
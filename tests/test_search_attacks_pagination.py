@@ -0,0 +1,114 @@
+"""
+Tests for offset and keyset pagination of attack searches.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.application.ports import AttackRepository
+from app.application.use_cases import SearchAttacksByRsqlUseCase
+from app.domain.entities import CountMode
+from app.interfaces.http.dto import PaginationDTO
+from tests.test_attack_rolls_batch import build_attack
+
+
+class TestSearchAttacksPagination:
+    """Test cases for SearchAttacksByRsqlUseCase pagination"""
+
+    @pytest.fixture
+    def repository(self):
+        repository = AsyncMock(spec=AttackRepository)
+        repository.find_by_rsql.return_value = [build_attack(f"a{i}") for i in range(4)]
+        repository.count_by_rsql.return_value = 12
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_offset_page_counts_and_returns_cursor(self, repository):
+        use_case = SearchAttacksByRsqlUseCase(repository)
+
+        page = await use_case.execute(rsql_query="status==APPLIED", page=1, size=3)
+
+        repository.find_by_rsql.assert_awaited_once_with(
+            rsql_query="status==APPLIED", limit=4, skip=3, after=None
+        )
+        assert [attack.id for attack in page.content] == ["a0", "a1", "a2"]
+        assert page.pagination.total_elements == 12
+        assert page.pagination.next_after == "a2"
+
+    @pytest.mark.asyncio
+    async def test_cursor_page_skips_count(self, repository):
+        repository.find_all.return_value = [build_attack("a5")]
+        use_case = SearchAttacksByRsqlUseCase(repository)
+
+        page = await use_case.execute(page=7, size=3, after="a4")
+
+        repository.find_all.assert_awaited_once_with(limit=4, skip=0, after="a4")
+        repository.count_all.assert_not_awaited()
+        assert page.pagination.total_elements is None
+        assert page.pagination.total_pages is None
+        assert page.pagination.next_after is None
+        assert page.is_last is True
+
+    @pytest.mark.asyncio
+    async def test_cursor_page_with_exact_count_is_last_by_cursor(self, repository):
+        repository.find_by_rsql.return_value = [build_attack("a11")]
+        use_case = SearchAttacksByRsqlUseCase(repository)
+
+        page = await use_case.execute(
+            rsql_query="status==APPLIED", size=3, after="a4", count=CountMode.EXACT
+        )
+
+        assert page.pagination.total_elements == 12
+        assert page.pagination.next_after is None
+        assert page.is_first is False
+        assert page.is_last is True
+
+    @pytest.mark.asyncio
+    async def test_estimated_count_without_filter(self, repository):
+        repository.find_all.return_value = []
+        repository.estimated_count.return_value = 1000
+        use_case = SearchAttacksByRsqlUseCase(repository)
+
+        page = await use_case.execute(size=3, count=CountMode.ESTIMATED)
+
+        repository.count_all.assert_not_awaited()
+        assert page.pagination.total_elements == 1000
+        assert page.pagination.total_exact is False
+
+    @pytest.mark.asyncio
+    async def test_estimated_count_with_filter_is_exact(self, repository):
+        use_case = SearchAttacksByRsqlUseCase(repository)
+
+        page = await use_case.execute(
+            rsql_query="status==APPLIED", size=3, count=CountMode.ESTIMATED
+        )
+
+        repository.estimated_count.assert_not_awaited()
+        assert page.pagination.total_elements == 12
+        assert page.pagination.total_exact is True
+
+    @pytest.mark.asyncio
+    async def test_count_none_skips_count(self, repository):
+        use_case = SearchAttacksByRsqlUseCase(repository)
+
+        page = await use_case.execute(
+            rsql_query="status==APPLIED", size=3, count=CountMode.NONE
+        )
+
+        repository.count_by_rsql.assert_not_awaited()
+        assert page.pagination.total_elements is None
+        assert page.pagination.next_after == "a2"
+
+
+class TestPaginationCursor:
+    """Test cases for the opaque pagination cursor"""
+
+    def test_round_trip(self):
+        cursor = PaginationDTO.encode_cursor("68837ba24b9293ca54e6ff72")
+
+        assert "68837ba2" not in cursor
+        assert PaginationDTO.decode_cursor(cursor) == "68837ba24b9293ca54e6ff72"
+
+    def test_rejects_malformed_cursor(self):
+        with pytest.raises(ValueError):
+            PaginationDTO.decode_cursor("not-a-cursor")
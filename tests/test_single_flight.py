@@ -0,0 +1,123 @@
+"""
+Tests for request coalescing.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.infrastructure.api.attack_table_rest_adapter import AttackTableRestAdapter
+from app.infrastructure.api.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_result(self):
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "value"
+
+        tasks = [asyncio.create_task(single_flight.do("key", fetch)) for _ in range(10)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert results == ["value"] * 10
+        assert calls == 1
+        assert single_flight.coalesced == 9
+        assert single_flight.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_are_shared_and_not_remembered(self):
+        single_flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            single_flight.do("key", fail),
+            single_flight.do("key", fail),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, ValueError) for result in results)
+
+        async def succeed():
+            return 1
+
+        assert await single_flight.do("key", succeed) == 1
+        assert single_flight.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "value"
+
+        first = asyncio.create_task(single_flight.do("key", fetch))
+        second = asyncio.create_task(single_flight.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "value"
+
+    @pytest.mark.asyncio
+    async def test_coalesced_callers_get_their_own_copy(self):
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+        value = {"text": "8", "damage": 8}
+
+        async def fetch():
+            await release.wait()
+            return value
+
+        tasks = [asyncio.create_task(single_flight.do("key", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        first, *coalesced = await asyncio.gather(*tasks)
+
+        assert first is value
+        assert all(result == value and result is not value for result in coalesced)
+        assert coalesced[0] is not coalesced[1]
+
+
+class TestAttackTableRestAdapterCoalescing:
+    """Test cases for request coalescing in AttackTableRestAdapter"""
+
+    @pytest.mark.asyncio
+    async def test_identical_lookups_send_one_request(self):
+        adapter = AttackTableRestAdapter(base_url="http://test-api.com")
+        response = MagicMock()
+        response.json.return_value = {"text": "10AS", "damage": 10}
+
+        async def get(url):
+            await asyncio.sleep(0.01)
+            return response
+
+        with patch.object(adapter, "_get_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.get.side_effect = get
+            mock_get_client.return_value = mock_client
+
+            entries = await asyncio.gather(
+                *(
+                    adapter.get_attack_table_entry("arming-sword", "medium", roll, 1)
+                    for roll in (180, 175, 200, 90)
+                )
+            )
+
+        assert [entry.damage for entry in entries] == [10, 10, 10, 10]
+        assert mock_client.get.await_count == 2
+        assert adapter.stats()["coalesced"] == 2